@@ -1,3 +1,5 @@
+import importlib
+
 from autoconf.dictable import from_dict, from_json, output_to_json, to_dict
 from autoarray import preprocess
 from autoarray.dataset.imaging.w_tilde import WTildeImaging
@@ -58,8 +60,6 @@ from autoarray.structures.visibilities import VisibilitiesNoiseMap
 from autogalaxy import cosmology as cosmo
 from autogalaxy.analysis.adapt_images.adapt_images import AdaptImages
 from autogalaxy.analysis.adapt_images.adapt_image_maker import AdaptImageMaker
-from autogalaxy.gui.clicker import Clicker
-from autogalaxy.gui.scribbler import Scribbler
 from autogalaxy.galaxy.galaxy import Galaxy
 from autogalaxy.galaxy.galaxies import Galaxies
 from autogalaxy.galaxy.redshift import Redshift
@@ -87,18 +87,23 @@ from autogalaxy.operate.deflections import OperateDeflections
 from autogalaxy.quantity.dataset_quantity import DatasetQuantity
 from autogalaxy import convert
 
-from . import plot
-from . import aggregator as agg
-from .lens import subhalo
 from .lens.tracer import Tracer
-from .lens.sensitivity import SubhaloSensitivityResult
+from .lens.lensing_geometry import LensingGeometry
+from .lens.sparse_deflections import SparseDeflections
+from .lens.tree_deflections import TreeDeflections
 from .lens.to_inversion import TracerToInversion
+from .analysis.likelihood_cascade import LikelihoodCascade
+from .analysis.likelihood_cascade import LikelihoodStage
+from .analysis.macro_deflections import MacroDeflectionCache
+from .analysis.telemetry import LikelihoodTelemetry
+from .analysis.visualization_worker import VisualizationWorker
 from .analysis.positions import PositionsLHResample
 from .analysis.positions import PositionsLHPenalty
 from .analysis.preloads import Preloads
 from .imaging.simulator import SimulatorImaging
 from .imaging.fit_imaging import FitImaging
 from .imaging.model.analysis import AnalysisImaging
+from .imaging.model.parametric_likelihood import ParametricImagingLikelihood
 from .interferometer.simulator import SimulatorInterferometer
 from .interferometer.fit_interferometer import FitInterferometer
 from .interferometer.model.analysis import AnalysisInterferometer
@@ -117,6 +122,7 @@ from .point.solver.shape_solver import ShapeSolver
 from .quantity.fit_quantity import FitQuantity
 from .quantity.model.analysis import AnalysisQuantity
 from . import exc
+from .profiling import HierarchicalProfiler
 from . import mock as m
 from . import util
 
@@ -124,4 +130,39 @@ from autoconf import conf
 
 conf.instance.register(__file__)
 
+# The plotting and aggregator subsystems, the subhalo and sensitivity mapping results and the GUI helpers are only
+# imported when they are first accessed (PEP 562), so that processes which only fit models do not pay their
+# import cost.
+
+_lazy_import_dict = {
+    "plot": (".plot", None),
+    "agg": (".aggregator", None),
+    "subhalo": (".lens.subhalo", None),
+    "SubhaloSensitivityResult": (".lens.sensitivity", "SubhaloSensitivityResult"),
+    "SubhaloSensitivitySimulator": (".lens.sensitivity", "SubhaloSensitivitySimulator"),
+    "Clicker": ("autogalaxy.gui.clicker", "Clicker"),
+    "Scribbler": ("autogalaxy.gui.scribbler", "Scribbler"),
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_import_dict:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr_name = _lazy_import_dict[name]
+
+    value = importlib.import_module(module_name, __name__)
+
+    if attr_name is not None:
+        value = getattr(value, attr_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_import_dict))
+
+
 __version__ = "2024.11.13.2"
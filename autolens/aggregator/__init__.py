@@ -6,6 +6,7 @@ from autogalaxy.aggregator.interferometer.interferometer import InterferometerAg
 
 from autolens.aggregator.tracer import _tracer_from
 from autolens.aggregator.tracer import TracerAgg
+from autolens.aggregator.tracer import TracerBatch
 
 from autolens.aggregator.fit_imaging import _fit_imaging_from
 from autolens.aggregator.fit_imaging import FitImagingAgg
@@ -21,3 +22,6 @@ from autogalaxy.aggregator.ellipse.fit_ellipse import _fit_ellipse_from
 from autogalaxy.aggregator.ellipse.fit_ellipse import FitEllipseAgg
 
 from autolens.aggregator.subhalo import SubhaloAgg
+
+from autolens.aggregator.telemetry import _likelihood_telemetry_summary_from
+from autolens.aggregator.telemetry import LikelihoodTelemetryAgg
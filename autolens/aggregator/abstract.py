@@ -0,0 +1,226 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Generator, List
+
+import autofit as af
+
+
+class CachedFit:
+    def __init__(self, fit: af.Fit):
+        """
+        Wraps a `PyAutoFit` sqlite database `Fit` object and memoizes every value loaded from the database.
+
+        Creating a `FitImaging` (or `Tracer`) for a sample of a non-linear search loads the data, noise-map, PSF,
+        mask, adapt images, cosmology and other attributes from the database via the `fit.value()` method. When many
+        objects are created for the same fit (e.g. randomly drawing 1000 samples from the PDF) these values are
+        identical for every sample, therefore this wrapper loads them from the database once and reuses them.
+
+        Database sessions cannot be shared safely across threads, therefore the memoized values also ensure that once
+        a fit has been loaded in the calling thread, objects can be created from it in a thread pool without
+        touching the database.
+
+        Parameters
+        ----------
+        fit
+            A `PyAutoFit` `Fit` object which contains the results of a model-fit as an entry in a sqlite database.
+        """
+        self.fit = fit
+
+        self._value_dict = {}
+        self._children = None
+        self._lock = threading.RLock()
+
+    def __getattr__(self, item):
+        return getattr(self.fit, item)
+
+    def _memoized_from(self, key, func: Callable):
+        with self._lock:
+            if key not in self._value_dict:
+                self._value_dict[key] = func()
+
+            return self._value_dict[key]
+
+    @property
+    def id(self) -> str:
+        return self.fit.id
+
+    @property
+    def instance(self):
+        return self._memoized_from(key="instance", func=lambda: self.fit.instance)
+
+    @property
+    def children(self) -> List["CachedFit"]:
+        with self._lock:
+            if self._children is None:
+                self._children = [CachedFit(fit=child) for child in self.fit.children]
+
+            return self._children
+
+    def value(self, name: str):
+        return self._memoized_from(key=name, func=lambda: self.fit.value(name=name))
+
+    def child_values(self, name: str) -> List:
+        return [child.value(name=name) for child in self.children]
+
+    def __getitem__(self, item: str):
+        return self.value(name=item)
+
+    def memoized_from(self, key: str, func: Callable):
+        """
+        Returns an object created from the fit (e.g. the `Imaging` dataset with its mask applied), creating it via
+        the input function the first time it is requested and returning the stored object thereafter.
+
+        Parameters
+        ----------
+        key
+            The name the object is stored under, which must not clash with the name of a database value.
+        func
+            A function with no arguments which creates the object.
+        """
+        return self._memoized_from(key=f"__object__.{key}", func=func)
+
+
+class AbstractAgg(af.AggBase):
+    def __init__(self, aggregator: af.Aggregator, number_of_cores: int = 1):
+        """
+        Base class of the **PyAutoLens** aggregator wrappers (e.g. `TracerAgg`, `FitImagingAgg`), which extends the
+        `PyAutoFit` `AggBase` with caching of database values and parallel creation of objects.
+
+        Every value loaded from the database for a fit (e.g. the dataset, mask, PSF and adapt images) is cached on a
+        `CachedFit` keyed on the fit's database `id`, such that generators which create many objects for the same
+        fit (e.g. `randomly_drawn_via_pdf_gen_from`) load and prepare them once.
+
+        If `number_of_cores` is above 1, objects for every sample of a fit are created in a thread pool and returned
+        in the same order as the samples. The first object is always created in the calling thread, which loads all
+        database values before the thread pool is used.
+
+        Generators are still evaluated lazily over fits, so only the cached values of the fit currently being
+        iterated over are held in memory.
+
+        Parameters
+        ----------
+        aggregator
+            A `PyAutoFit` aggregator object which can load the results of model-fits.
+        number_of_cores
+            The number of threads used to create the objects of each fit.
+        """
+        super().__init__(aggregator=aggregator)
+
+        self.number_of_cores = number_of_cores
+
+        self._cached_fit = None
+
+    def cached_fit_from(self, fit: af.Fit) -> CachedFit:
+        """
+        Returns the `CachedFit` wrapping an input database `Fit`, reusing the existing wrapper if the fit has the
+        same database `id` as the previous fit.
+
+        Only the most recent fit is cached, which keeps memory use fixed when iterating over many fits.
+
+        Parameters
+        ----------
+        fit
+            A `PyAutoFit` `Fit` object which contains the results of a model-fit as an entry in a sqlite database.
+        """
+        if isinstance(fit, CachedFit):
+            return fit
+
+        if self._cached_fit is None or self._cached_fit.id != fit.id:
+            self._cached_fit = CachedFit(fit=fit)
+
+        return self._cached_fit
+
+    def object_list_via_instance_list_from(
+        self, fit: af.Fit, instance_list: List[af.ModelInstance]
+    ) -> List[object]:
+        """
+        Returns the objects created via `object_via_gen_from` for a list of instances of the same fit, in the same
+        order as the instances.
+
+        If `number_of_cores` is above 1 the objects after the first are created in a thread pool.
+
+        Parameters
+        ----------
+        fit
+            A `PyAutoFit` `Fit` object which contains the results of a model-fit as an entry in a sqlite database.
+        instance_list
+            The instances (e.g. samples drawn randomly from the PDF) an object is created for.
+        """
+        if len(instance_list) == 0:
+            return []
+
+        fit = self.cached_fit_from(fit=fit)
+
+        object_list = [self.object_via_gen_from(fit=fit, instance=instance_list[0])]
+
+        func = partial(self.object_via_gen_from, fit)
+
+        if self.number_of_cores > 1 and len(instance_list) > 1:
+            with ThreadPoolExecutor(max_workers=self.number_of_cores) as executor:
+                object_list += list(executor.map(func, instance_list[1:]))
+        else:
+            object_list += [func(instance) for instance in instance_list[1:]]
+
+        return object_list
+
+    def all_above_weight_gen_from(self, minimum_weight: float) -> Generator:
+        """
+        Returns a generator which for every result generates a list of objects whose parameter values are all those
+        in the non-linear search with a weight about an input `minimum_weight` value.
+
+        See `af.AggBase.all_above_weight_gen_from` for a full description, the objects of each result are created via
+        `object_list_via_instance_list_from`.
+
+        Parameters
+        ----------
+        minimum_weight
+            The minimum weight of a non-linear sample, such that samples with a weight below this value are discarded
+            and not included in the generator.
+        """
+
+        def func_gen(fit: af.Fit, minimum_weight: float) -> List[object]:
+            samples = fit.value(name="samples")
+
+            instance_list = [
+                sample.instance_for_model(model=samples.model)
+                for sample in samples.sample_list
+                if sample.weight > minimum_weight
+            ]
+
+            return self.object_list_via_instance_list_from(
+                fit=fit, instance_list=instance_list
+            )
+
+        func = partial(func_gen, minimum_weight=minimum_weight)
+
+        return self.aggregator.map(func=func)
+
+    def randomly_drawn_via_pdf_gen_from(self, total_samples: int) -> Generator:
+        """
+        Returns a generator which for every result generates a list of objects whose parameter values are drawn
+        randomly from the PDF.
+
+        See `af.AggBase.randomly_drawn_via_pdf_gen_from` for a full description, the objects of each result are
+        created via `object_list_via_instance_list_from`.
+
+        Parameters
+        ----------
+        total_samples
+            The total number of non-linear search samples that should be randomly drawn from the PDF.
+        """
+
+        def func_gen(fit: af.Fit, total_samples: int) -> List[object]:
+            samples = fit.value(name="samples")
+
+            instance_list = [
+                samples.draw_randomly_via_pdf() for _ in range(total_samples)
+            ]
+
+            return self.object_list_via_instance_list_from(
+                fit=fit, instance_list=instance_list
+            )
+
+        func = partial(func_gen, total_samples=total_samples)
+
+        return self.aggregator.map(func=func)
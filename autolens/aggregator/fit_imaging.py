@@ -2,6 +2,7 @@ from typing import Optional, List
 
 import autofit as af
 import autoarray as aa
+import autogalaxy as ag
 
 from autolens.imaging.fit_imaging import FitImaging
 from autolens.analysis.preloads import Preloads
@@ -10,6 +11,7 @@ from autogalaxy.aggregator.imaging.imaging import _imaging_from
 from autogalaxy.aggregator.dataset_model import _dataset_model_from
 from autogalaxy.aggregator import agg_util
 
+from autolens.aggregator.abstract import AbstractAgg
 from autolens.aggregator.tracer import _tracer_from
 
 
@@ -18,6 +20,8 @@ def _fit_imaging_from(
     instance: Optional[af.ModelInstance] = None,
     settings_inversion: aa.SettingsInversion = None,
     use_preloaded_grid: bool = True,
+    dataset_list: Optional[List[aa.Imaging]] = None,
+    adapt_images_list: Optional[List[Optional[ag.AdaptImages]]] = None,
 ) -> List[FitImaging]:
     """
     Returns a list of `FitImaging` object from a `PyAutoFit` sqlite database `Fit` object.
@@ -53,15 +57,20 @@ def _fit_imaging_from(
         Certain pixelization's construct their mesh in the source-plane from a stochastic KMeans algorithm. This grid
         may be output to hard-disk after the model-fit and loaded via the database to ensure the same grid is used
         as the fit.
+    dataset_list
+        The datasets of the fit, which if input are used instead of being loaded from the database (e.g. because they
+        are cached and shared between many samples of the same fit).
+    adapt_images_list
+        The adapt images of the fit, which if input are used instead of being loaded from the database.
     """
 
-    dataset_list = _imaging_from(fit=fit)
+    dataset_list = dataset_list or _imaging_from(fit=fit)
 
     tracer_list = _tracer_from(fit=fit, instance=instance)
 
     dataset_model_list = _dataset_model_from(fit=fit, instance=instance)
 
-    adapt_images_list = agg_util.adapt_images_from(fit=fit)
+    adapt_images_list = adapt_images_list or agg_util.adapt_images_from(fit=fit)
 
     settings_inversion = settings_inversion or fit.value(name="settings_inversion")
 
@@ -99,12 +108,13 @@ def _fit_imaging_from(
     return fit_dataset_list
 
 
-class FitImagingAgg(af.AggBase):
+class FitImagingAgg(AbstractAgg):
     def __init__(
         self,
         aggregator: af.Aggregator,
         settings_inversion: Optional[aa.SettingsInversion] = None,
         use_preloaded_grid: bool = True,
+        number_of_cores: int = 1,
     ):
         """
         Interfaces with an `PyAutoFit` aggregator object to create instances of `FitImaging` objects from the results
@@ -130,6 +140,10 @@ class FitImagingAgg(af.AggBase):
         is instead used to load lists of the data, noise-map, PSF and mask and combine them into a list of
         `FitImaging` objects.
 
+        The dataset and adapt images of a fit are loaded from the database once and shared by every `FitImaging`
+        created for that fit (e.g. when drawing samples randomly from the PDF), and the `FitImaging` objects of a fit
+        can be created in parallel via a thread pool (see `AbstractAgg`).
+
         This can be done manually, but this object provides a more concise API.
 
         Parameters
@@ -142,8 +156,10 @@ class FitImagingAgg(af.AggBase):
             Certain pixelization's construct their mesh in the source-plane from a stochastic KMeans algorithm. This
             grid may be output to hard-disk after the model-fit and loaded via the database to ensure the same grid is
             used as the fit.
+        number_of_cores
+            The number of threads used to create the `FitImaging` objects of each fit.
         """
-        super().__init__(aggregator=aggregator)
+        super().__init__(aggregator=aggregator, number_of_cores=number_of_cores)
 
         self.settings_inversion = settings_inversion
         self.use_preloaded_grid = use_preloaded_grid
@@ -164,9 +180,18 @@ class FitImagingAgg(af.AggBase):
             A manual instance that overwrites the max log likelihood instance in fit (e.g. for drawing the instance
             randomly from the PDF).
         """
+        fit = self.cached_fit_from(fit=fit)
+
         return _fit_imaging_from(
             fit=fit,
             instance=instance,
             settings_inversion=self.settings_inversion,
             use_preloaded_grid=self.use_preloaded_grid,
+            dataset_list=fit.memoized_from(
+                key="dataset_list", func=lambda: _imaging_from(fit=fit)
+            ),
+            adapt_images_list=fit.memoized_from(
+                key="adapt_images_list",
+                func=lambda: agg_util.adapt_images_from(fit=fit),
+            ),
         )
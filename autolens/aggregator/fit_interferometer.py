@@ -2,6 +2,7 @@ from typing import Optional, List
 
 import autofit as af
 import autoarray as aa
+import autogalaxy as ag
 
 from autogalaxy.aggregator.interferometer.interferometer import _interferometer_from
 from autogalaxy.aggregator.dataset_model import _dataset_model_from
@@ -10,6 +11,7 @@ from autolens.interferometer.fit_interferometer import FitInterferometer
 from autolens.analysis.preloads import Preloads
 
 from autogalaxy.aggregator import agg_util
+from autolens.aggregator.abstract import AbstractAgg
 from autolens.aggregator.tracer import _tracer_from
 
 
@@ -19,6 +21,8 @@ def _fit_interferometer_from(
     real_space_mask: Optional[aa.Mask2D] = None,
     settings_inversion: aa.SettingsInversion = None,
     use_preloaded_grid: bool = True,
+    dataset_list: Optional[List[aa.Interferometer]] = None,
+    adapt_images_list: Optional[List[Optional[ag.AdaptImages]]] = None,
 ) -> List[FitInterferometer]:
     """
     Returns a list of `FitInterferometer` objects from a `PyAutoFit` sqlite database `Fit` object.
@@ -55,15 +59,20 @@ def _fit_interferometer_from(
         Certain pixelization's construct their mesh in the source-plane from a stochastic KMeans algorithm. This grid
         may be output to hard-disk after the model-fit and loaded via the database to ensure the same grid is used
         as the fit.
+    dataset_list
+        The datasets of the fit, which if input are used instead of being loaded from the database (e.g. because they
+        are cached and shared between many samples of the same fit).
+    adapt_images_list
+        The adapt images of the fit, which if input are used instead of being loaded from the database.
     """
-    dataset_list = _interferometer_from(
+    dataset_list = dataset_list or _interferometer_from(
         fit=fit,
         real_space_mask=real_space_mask,
     )
     tracer_list = _tracer_from(fit=fit, instance=instance)
     dataset_model_list = _dataset_model_from(fit=fit, instance=instance)
 
-    adapt_images_list = agg_util.adapt_images_from(fit=fit)
+    adapt_images_list = adapt_images_list or agg_util.adapt_images_from(fit=fit)
 
     settings_inversion = settings_inversion or fit.value(name="settings_inversion")
 
@@ -101,13 +110,14 @@ def _fit_interferometer_from(
     return fit_dataset_list
 
 
-class FitInterferometerAgg(af.AggBase):
+class FitInterferometerAgg(AbstractAgg):
     def __init__(
         self,
         aggregator: af.Aggregator,
         settings_inversion: Optional[aa.SettingsInversion] = None,
         use_preloaded_grid: bool = True,
         real_space_mask: Optional[aa.Mask2D] = None,
+        number_of_cores: int = 1,
     ):
         """
         Interfaces with an `PyAutoFit` aggregator object to create instances of `FitInterferometer` objects from the
@@ -129,6 +139,10 @@ class FitInterferometerAgg(af.AggBase):
         For example, if the `aggregator` contains 3 model-fits, this class can be used to create a generator which
         creates instances of the corresponding 3 `FitInterferometer` objects.
 
+        The dataset and adapt images of a fit are loaded from the database once and shared by every
+        `FitInterferometer` created for that fit, and the `FitInterferometer` objects of a fit can be created in
+        parallel via a thread pool (see `AbstractAgg`).
+
         This can be done manually, but this object provides a more concise API.
 
         Parameters
@@ -141,8 +155,12 @@ class FitInterferometerAgg(af.AggBase):
             Certain pixelization's construct their mesh in the source-plane from a stochastic KMeans algorithm. This
             grid may be output to hard-disk after the model-fit and loaded via the database to ensure the same grid is
             used as the fit.
+        real_space_mask
+            Optionally overwrite the real space mask of the `Interferometer` dataset that is loaded from the fit.
+        number_of_cores
+            The number of threads used to create the `FitInterferometer` objects of each fit.
         """
-        super().__init__(aggregator=aggregator)
+        super().__init__(aggregator=aggregator, number_of_cores=number_of_cores)
 
         self.settings_inversion = settings_inversion
         self.use_preloaded_grid = use_preloaded_grid
@@ -164,9 +182,22 @@ class FitInterferometerAgg(af.AggBase):
             A manual instance that overwrites the max log likelihood instance in fit (e.g. for drawing the instance
             randomly from the PDF).
         """
+        fit = self.cached_fit_from(fit=fit)
+
         return _fit_interferometer_from(
             fit=fit,
             instance=instance,
+            real_space_mask=self.real_space_mask,
             settings_inversion=self.settings_inversion,
             use_preloaded_grid=self.use_preloaded_grid,
+            dataset_list=fit.memoized_from(
+                key="dataset_list",
+                func=lambda: _interferometer_from(
+                    fit=fit, real_space_mask=self.real_space_mask
+                ),
+            ),
+            adapt_images_list=fit.memoized_from(
+                key="adapt_images_list",
+                func=lambda: agg_util.adapt_images_from(fit=fit),
+            ),
         )
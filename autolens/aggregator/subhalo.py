@@ -1,9 +1,11 @@
+import numpy as np
 from typing import Optional
 
 import autofit as af
 import autoarray as aa
 
 from autolens import exc
+from autolens.lens.subhalo import SubhaloResultColumns
 
 
 class SubhaloAgg:
@@ -35,3 +37,83 @@ class SubhaloAgg:
     @property
     def grid_search_result(self) -> af.GridSearchResult:
         return self.aggregator_grid_search[0]["result"]
+
+    @property
+    def columns(self) -> SubhaloResultColumns:
+        """
+        Returns the results of the grid search as a `SubhaloResultColumns` object, loaded directly from the
+        database entries of every grid cell's fit instead of unpickling the `GridSearchResult`.
+
+        For every cell, the (y,x) coordinates are the centres of the subhalo's `centre` priors, the log likelihood is
+        the maximum log likelihood stored in the database and the subhalo mass is taken from the maximum likelihood
+        instance. The cells are mapped to the 2D grid via their coordinates, so their order in the database does not
+        matter.
+
+        The grid search sets the `centre` prior of every cell to a `UniformPrior` spanning the cell, so the size of
+        the cells is the width of these priors and the shape of the grid is the extent of all cells divided by it
+        (which supports grids which are not square or have a single cell along an axis).
+
+        The columns can be output to a `.npz` file via `output_to_npz`, so that survey-wide analyses can load the
+        results of many lenses via `SubhaloResultColumns.from_npz`.
+        """
+        fit_list = list(self.aggregator_grid_search.children())
+
+        if len(fit_list) == 0:
+            raise exc.AggregatorException(
+                "The grid search in the aggregator does not have any child fits."
+            )
+
+        y = np.zeros(len(fit_list))
+        x = np.zeros(len(fit_list))
+        y_limits = np.zeros((len(fit_list), 2))
+        x_limits = np.zeros((len(fit_list), 2))
+        log_evidences = np.full(len(fit_list), np.nan)
+        log_likelihoods = np.zeros(len(fit_list))
+        subhalo_masses = np.full(len(fit_list), np.nan)
+        subhalo_centres = np.full((len(fit_list), 2), np.nan)
+
+        for i, fit in enumerate(fit_list):
+            centre = fit.model.galaxies.subhalo.mass.centre
+
+            y[i] = centre.centre_0.mean
+            x[i] = centre.centre_1.mean
+
+            y_limits[i] = (centre.centre_0.lower_limit, centre.centre_0.upper_limit)
+            x_limits[i] = (centre.centre_1.lower_limit, centre.centre_1.upper_limit)
+
+            log_likelihoods[i] = fit.max_log_likelihood
+
+            try:
+                log_evidences[i] = fit.value(name="samples_summary").log_evidence
+            except (AttributeError, TypeError):
+                pass
+
+            mass = fit.instance.galaxies.subhalo.mass
+
+            subhalo_centres[i] = mass.centre
+
+            try:
+                subhalo_masses[i] = mass.mass_at_200
+            except AttributeError:
+                pass
+
+        pixel_scales = (
+            y_limits[0, 1] - y_limits[0, 0],
+            x_limits[0, 1] - x_limits[0, 0],
+        )
+
+        shape = tuple(
+            int(round((np.max(limits[:, 1]) - np.min(limits[:, 0])) / pixel_scale))
+            for limits, pixel_scale in zip((y_limits, x_limits), pixel_scales)
+        )
+
+        return SubhaloResultColumns(
+            y=y,
+            x=x,
+            shape=shape,
+            pixel_scales=pixel_scales,
+            log_evidences=log_evidences,
+            log_likelihoods=log_likelihoods,
+            subhalo_masses=subhalo_masses,
+            subhalo_centres=subhalo_centres,
+        )
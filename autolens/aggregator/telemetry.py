@@ -0,0 +1,55 @@
+from typing import Dict, Generator, Optional
+
+import autofit as af
+
+
+def _likelihood_telemetry_summary_from(fit: af.Fit) -> Optional[Dict]:
+    """
+    Returns the summary of the `LikelihoodTelemetry` of a model-fit from a `PyAutoFit` sqlite database `Fit`
+    object, which contains the median (p50) and 95th percentile (p95) run time of every stage of the log likelihood
+    function sampled throughout the search.
+
+    If the fit was performed via analysis summing, the summary of every child fit is returned as a list.
+
+    Parameters
+    ----------
+    fit
+        A `PyAutoFit` `Fit` object which contains the results of a model-fit as an entry in a sqlite database.
+    """
+    summary_dict = fit.value(name="likelihood_telemetry")
+
+    if summary_dict is not None:
+        return summary_dict
+
+    summary_list = fit.child_values(name="likelihood_telemetry")
+
+    if summary_list is not None and any(
+        summary is not None for summary in summary_list
+    ):
+        return summary_list
+
+
+class LikelihoodTelemetryAgg(af.AggBase):
+    def __init__(self, aggregator: af.Aggregator):
+        """
+        Wraps a PyAutoFit aggregator in order to create generators of the summaries of the `LikelihoodTelemetry`
+        recorded during model-fits, which give the p50 / p95 run times of every stage of the log likelihood function
+        over each search.
+
+        Fits which did not use a `LikelihoodTelemetry` give None.
+
+        Parameters
+        ----------
+        aggregator
+            A `PyAutoFit` aggregator object which can load the results of model-fits.
+        """
+        super().__init__(aggregator=aggregator)
+
+    def object_via_gen_from(self, fit, instance=None) -> Optional[Dict]:
+        return _likelihood_telemetry_summary_from(fit=fit)
+
+    def summary_gen(self) -> Generator:
+        """
+        Returns a generator of the summary of the `LikelihoodTelemetry` of every fit in the aggregator.
+        """
+        return self.aggregator.map(func=_likelihood_telemetry_summary_from)
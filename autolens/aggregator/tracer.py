@@ -1,8 +1,12 @@
 import logging
-from typing import List, Optional
+import numpy as np
+from functools import partial
+from typing import Callable, Generator, List, Optional
 
 import autofit as af
+import autoarray as aa
 
+from autolens.aggregator.abstract import AbstractAgg
 from autolens.lens.tracer import Tracer
 
 logger = logging.getLogger(__name__)
@@ -74,7 +78,154 @@ def _tracer_from(
     return [tracer]
 
 
-class TracerAgg(af.AggBase):
+class TracerBatch:
+    def __init__(
+        self,
+        tracer_list: List[Tracer],
+        sample_indexes: np.ndarray,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        A batch of `Tracer` objects corresponding to many samples of a non-linear search (e.g. samples drawn randomly
+        from the PDF), whose lensing quantities are returned as arrays over the samples.
+
+        Samples drawn randomly from a PDF frequently repeat (e.g. a nested sampler may place most of the posterior
+        weight in a few hundred samples), therefore a `Tracer` is only created and evaluated once for every unique
+        sample. The `sample_indexes` map every sample in the batch to its unique `Tracer`, such that every quantity
+        is computed once per unique sample and then broadcast to all samples via NumPy indexing.
+
+        The evaluation is de-duplicated, not vectorized: every unique sample still has its own `Tracer`, whose
+        quantities are computed one sample at a time.
+
+        Parameters
+        ----------
+        tracer_list
+            The `Tracer` of every unique sample in the batch.
+        sample_indexes
+            For every sample in the batch, the index of its `Tracer` in `tracer_list`.
+        tracer
+            A `Tracer` of the fit (e.g. its maximum log likelihood `Tracer`), which is only used to compute the shape
+            of a quantity if the batch has no samples.
+        """
+        self.tracer_list = tracer_list
+        self.sample_indexes = np.asarray(sample_indexes, dtype="int")
+        self.tracer = tracer
+
+    @property
+    def total_samples(self) -> int:
+        return len(self.sample_indexes)
+
+    def __len__(self) -> int:
+        return self.total_samples
+
+    def __getitem__(self, index: int) -> Tracer:
+        return self.tracer_list[self.sample_indexes[index]]
+
+    def array_from(self, func: Callable[[Tracer], np.ndarray]) -> np.ndarray:
+        """
+        Returns a quantity computed by an input function for every sample in the batch, stacked into a single
+        array whose first dimension is the samples.
+
+        If the batch has no samples (e.g. no sample has a weight above the `minimum_weight`), an empty array whose
+        first dimension is zero is returned, whose other dimensions are those of the quantity of the batch's `tracer`.
+
+        Parameters
+        ----------
+        func
+            A function which computes the quantity (e.g. the convergence on a grid) from a `Tracer`.
+        """
+        if len(self.tracer_list) == 0:
+            if self.tracer is None:
+                return np.zeros((0,))
+
+            return np.zeros((0,) + np.shape(func(self.tracer)))
+
+        array = np.stack([np.asarray(func(tracer)) for tracer in self.tracer_list])
+
+        return array[self.sample_indexes]
+
+    def convergence_2d_from(self, grid: aa.type.Grid2DLike) -> np.ndarray:
+        """
+        Returns the 2D convergence of every sample on an input grid, as an array of
+        shape [total_samples, total_grid_pixels].
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where the convergence is evaluated.
+        """
+        return self.array_from(func=lambda tracer: tracer.convergence_2d_from(grid=grid))
+
+    def magnification_2d_from(self, grid: aa.type.Grid2DLike) -> np.ndarray:
+        """
+        Returns the 2D magnification of every sample on an input grid, as an array of
+        shape [total_samples, total_grid_pixels].
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates where the magnification is evaluated.
+        """
+        return self.array_from(
+            func=lambda tracer: tracer.magnification_2d_from(grid=grid)
+        )
+
+    def einstein_radius_from(self, grid: aa.type.Grid2DLike) -> np.ndarray:
+        """
+        Returns the Einstein radius of every sample, computed from its tangential critical curve on an input grid, as
+        an array of shape [total_samples].
+
+        Parameters
+        ----------
+        grid
+            The 2D (y, x) coordinates used to compute the tangential critical curve.
+        """
+        return self.array_from(func=lambda tracer: tracer.einstein_radius_from(grid=grid))
+
+
+def _tracer_batch_from(
+    fit: af.Fit, samples: af.SamplesPDF, sample_indexes: np.ndarray
+) -> TracerBatch:
+    """
+    Returns a `TracerBatch` from a `PyAutoFit` sqlite database `Fit` object and the indexes of the samples of its
+    non-linear search in the batch.
+
+    The parameters of all samples are read from the samples in one go as a NumPy array, and a model instance and
+    `Tracer` are created for every unique sample index (see `TracerBatch`).
+
+    For a fit with multiple summed `Analysis` objects, the `Tracer` of the first analysis is used.
+
+    Parameters
+    ----------
+    fit
+        A `PyAutoFit` `Fit` object which contains the results of a model-fit as an entry in a sqlite database.
+    samples
+        The samples of the non-linear search of the fit.
+    sample_indexes
+        The index of every sample in the batch, which can contain repeated indexes.
+    """
+    unique_indexes, sample_indexes = np.unique(sample_indexes, return_inverse=True)
+
+    parameters = np.asarray(samples.parameter_lists)[unique_indexes]
+
+    tracer_list = [
+        _tracer_from(
+            fit=fit,
+            instance=samples.model.instance_from_vector(
+                vector=list(vector), ignore_prior_limits=True
+            ),
+        )[0]
+        for vector in parameters
+    ]
+
+    return TracerBatch(
+        tracer_list=tracer_list,
+        sample_indexes=sample_indexes,
+        tracer=_tracer_from(fit=fit)[0],
+    )
+
+
+class TracerAgg(AbstractAgg):
     """
     Interfaces with an `PyAutoFit` aggregator object to create instances of `Tracer` objects from the results
     of a model-fit.
@@ -98,12 +249,18 @@ class TracerAgg(af.AggBase):
     is instead used to load lists of Tracers. This is necessary if each Tracer has different galaxies (e.g. certain
     parameters vary across each dataset and `Analysis` object).
 
+    The values loaded from the database for a fit (e.g. its cosmology) are cached and shared by every `Tracer`
+    created for that fit, and the `Tracer` objects of a fit can be created in parallel via a thread pool (see
+    `AbstractAgg`).
+
     This can be done manually, but this object provides a more concise API.
 
     Parameters
     ----------
     aggregator
         A `PyAutoFit` aggregator object which can load the results of model-fits.
+    number_of_cores
+        The number of threads used to create the `Tracer` objects of each fit.
     """
 
     def object_via_gen_from(
@@ -121,4 +278,65 @@ class TracerAgg(af.AggBase):
         galaxies
             A list of galaxies corresponding to a sample of a non-linear search and model-fit.
         """
-        return _tracer_from(fit=fit, instance=instance)
+        return _tracer_from(fit=self.cached_fit_from(fit=fit), instance=instance)
+
+    def randomly_drawn_batch_via_pdf_gen_from(self, total_samples: int) -> Generator:
+        """
+        Returns a generator which for every result generates a `TracerBatch` of samples drawn randomly from the PDF,
+        which computes lensing quantities (e.g. the convergence, magnification and Einstein radius) as arrays over
+        the samples.
+
+        All samples are drawn in one call using the sample weights, and a `Tracer` is only created for every unique
+        sample drawn.
+
+        Parameters
+        ----------
+        total_samples
+            The total number of non-linear search samples that should be randomly drawn from the PDF.
+        """
+
+        def func_gen(fit: af.Fit, total_samples: int) -> TracerBatch:
+            fit = self.cached_fit_from(fit=fit)
+
+            samples = fit.value(name="samples")
+
+            weights = np.asarray(samples.weight_list)
+
+            sample_indexes = np.random.choice(
+                a=len(weights), size=total_samples, p=weights / np.sum(weights)
+            )
+
+            return _tracer_batch_from(
+                fit=fit, samples=samples, sample_indexes=sample_indexes
+            )
+
+        return self.aggregator.map(func=partial(func_gen, total_samples=total_samples))
+
+    def all_above_weight_batch_gen_from(self, minimum_weight: float) -> Generator:
+        """
+        Returns a generator which for every result generates a `TracerBatch` of all samples with a weight above
+        an input `minimum_weight` value, which computes lensing quantities as arrays over the samples.
+
+        Parameters
+        ----------
+        minimum_weight
+            The minimum weight of a non-linear sample, such that samples with a weight below this value are discarded
+            and not included in the batch.
+        """
+
+        def func_gen(fit: af.Fit, minimum_weight: float) -> TracerBatch:
+            fit = self.cached_fit_from(fit=fit)
+
+            samples = fit.value(name="samples")
+
+            sample_indexes = np.where(np.asarray(samples.weight_list) > minimum_weight)[
+                0
+            ]
+
+            return _tracer_batch_from(
+                fit=fit, samples=samples, sample_indexes=sample_indexes
+            )
+
+        return self.aggregator.map(
+            func=partial(func_gen, minimum_weight=minimum_weight)
+        )
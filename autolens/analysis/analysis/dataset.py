@@ -1,6 +1,6 @@
 import os
 import logging
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from autoconf import conf
 from autoconf.dictable import to_dict, output_to_json
@@ -15,10 +15,17 @@ from autolens.analysis.analysis.lens import AnalysisLens
 from autolens.analysis.result import ResultDataset
 from autolens.analysis.maker import FitMaker
 from autolens.analysis.preloads import Preloads
+from autolens.analysis.likelihood_cascade import LikelihoodCascade
+from autolens.analysis.macro_deflections import MacroDeflectionCache
+from autolens.lens.sparse_deflections import SparseDeflections
+from autolens.lens.tree_deflections import TreeDeflections
+from autolens.analysis.telemetry import LikelihoodTelemetry
+from autolens.analysis.visualization_worker import VisualizationWorker
 from autolens.analysis.positions import PositionsLHResample
 from autolens.analysis.positions import PositionsLHPenalty
 
 from autolens import exc
+from autolens import profiling
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,12 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
         settings_inversion: aa.SettingsInversion = None,
         raise_inversion_positions_likelihood_exception: bool = True,
         title_prefix: str = None,
+        macro_deflection_cache: Optional[MacroDeflectionCache] = None,
+        sparse_deflections: Optional[SparseDeflections] = None,
+        tree_deflections: Optional[TreeDeflections] = None,
+        likelihood_cascade: Optional[LikelihoodCascade] = None,
+        likelihood_telemetry: Optional[LikelihoodTelemetry] = None,
+        visualization_worker: Optional[VisualizationWorker] = None,
     ):
         """
         Fits a lens model to a dataset via a non-linear search.
@@ -68,6 +81,25 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
             be inferred, in which case an Exception is raised before the model-fit begins to inform the user
             of this. This exception is not raised if this input is False, allowing the user to perform the model-fit
             anyway.
+        macro_deflection_cache
+            Optionally computes the deflection angles of the macro lens model via a first-order expansion around a
+            reference model (e.g. the fit without a subhalo), which speeds up the fits of a subhalo grid search.
+        sparse_deflections
+            Optionally approximates the deflection angles of every galaxy far from its centre via the monopole of its
+            mass distribution, within an input tolerance, which speeds up models with many halos (see
+            `SparseDeflections`).
+        tree_deflections
+            Optionally computes the deflection angles of planes with many halos (e.g. line-of-sight halos) via a tree
+            code when ray-tracing (see `TreeDeflections`), where None sums the deflection angles of every halo.
+        likelihood_cascade
+            Optionally computes progressively more expensive estimates of the log likelihood before the full fit,
+            which reject poor models early (see `LikelihoodCascade`).
+        likelihood_telemetry
+            Optionally records the run times of the stages of every Nth log likelihood evaluation throughout the
+            model-fit (see `LikelihoodTelemetry`).
+        visualization_worker
+            Optionally performs the visualization midway through the model-fit in a background process, so that
+            the non-linear search does not stall whilst it is performed (see `VisualizationWorker`).
         """
 
         super().__init__(
@@ -82,10 +114,22 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
             self=self,
             positions_likelihood=positions_likelihood,
             cosmology=cosmology,
+            macro_deflection_cache=macro_deflection_cache,
+            sparse_deflections=sparse_deflections,
+            tree_deflections=tree_deflections,
         )
 
+        if macro_deflection_cache is not None:
+            macro_deflection_cache.register_grid(grid=self.dataset.grids.uniform)
+
         self.preloads = self.preloads_cls()
 
+        self.adapt_image_path_list = None
+
+        self.likelihood_cascade = likelihood_cascade
+        self.likelihood_telemetry = likelihood_telemetry
+        self.visualization_worker = visualization_worker
+
         self.raise_inversion_positions_likelihood_exception = (
             raise_inversion_positions_likelihood_exception
         )
@@ -105,6 +149,9 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
 
         - Checks the model and raises exceptions if certain critieria are not met.
 
+        - Sets the rejection thresholds of the `LikelihoodCascade`, if the analysis has one, and the folder its
+          counts are written to.
+
         Once inherited from it also visualizes objects which do not change throughout the model fit like the dataset.
 
         Parameters
@@ -119,8 +166,265 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
 
         super().modify_before_fit(paths=paths, model=model)
 
+        self.adapt_image_path_list = self.adapt_image_path_list_from(model=model)
+
+        if self.likelihood_cascade is not None:
+            self.likelihood_cascade.set_log_likelihood_thresholds(
+                analysis=self, model=model
+            )
+            self.likelihood_cascade.output_path = str(paths.profile_path)
+
+        if self.likelihood_telemetry is not None:
+            self.likelihood_telemetry.output_path = str(paths.profile_path)
+
         self.raise_exceptions(model=model)
 
+    def visualize(
+        self,
+        paths: af.DirectoryPaths,
+        instance: af.ModelInstance,
+        during_analysis: bool,
+    ):
+        """
+        Output images of the maximum log likelihood model inferred by the model-fit, via the `Visualizer` of the
+        analysis.
+
+        If the analysis has a `VisualizationWorker`, visualization midway through the non-linear search is sent to
+        the worker's background process and this function returns immediately. The final visualization, where
+        `during_analysis` is False, stops the worker and is performed in this process.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization, and the pickled objects used by the aggregator output by this function.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        during_analysis
+            If True the visualization is being performed midway through the non-linear search before it is finished,
+            which may change which images are output.
+        """
+        if self.visualization_worker is not None:
+            if during_analysis:
+                self.visualization_worker.submit(
+                    analysis=self, paths=paths, instance=instance
+                )
+                return
+
+            self.visualization_worker.stop()
+
+        self.Visualizer.visualize(
+            analysis=self,
+            paths=paths,
+            instance=instance,
+            during_analysis=during_analysis,
+        )
+
+    def adapt_image_path_list_from(
+        self, model: af.Collection
+    ) -> Optional[List[Tuple[Tuple[str, ...], aa.Array2D]]]:
+        """
+        Returns a list pairing the path of every galaxy in the model (e.g. `("galaxies", "source")`) with its
+        adapt image, for all galaxies which have an adapt image.
+
+        The `AdaptImages` of the analysis map the path name of each galaxy to its adapt image, which for every
+        likelihood evaluation are paired with the galaxy instances of that iteration. Pairing them requires every
+        galaxy in the instance to be found via its path, which this function does once before the model-fit begins,
+        such that `adapt_images_via_instance_from` only has to look up each galaxy via its path.
+
+        Parameters
+        ----------
+        model
+            The model object, which includes model components representing the galaxies that are fitted to
+            the dataset.
+
+        Returns
+        -------
+        The paths of the galaxies with adapt images paired with their adapt image, or None if the analysis has no
+        adapt images.
+        """
+        if self.adapt_images is None:
+            return None
+
+        galaxy_name_image_dict = self.adapt_images.galaxy_name_image_dict
+
+        if galaxy_name_image_dict is None:
+            return None
+
+        path_list = [
+            path
+            for path, galaxy_model in model.path_instance_tuples_for_class(af.Model)
+            if issubclass(galaxy_model.cls, ag.Galaxy)
+        ]
+        path_list += [
+            path for path, _ in model.path_instance_tuples_for_class(ag.Galaxy)
+        ]
+
+        return [
+            (tuple(path), galaxy_name_image_dict[str(path)])
+            for path in path_list
+            if str(path) in galaxy_name_image_dict
+        ]
+
+    def adapt_images_via_instance_from(
+        self, instance: af.ModelInstance
+    ) -> Optional[ag.AdaptImages]:
+        """
+        Returns the adapt images of the analysis paired with the galaxy instances of an instance of the model, which
+        are passed to the fit to perform the inversion.
+
+        If the paths of the galaxies with adapt images were found before the model-fit (see
+        `adapt_image_path_list_from`) each galaxy is found via its path, otherwise every galaxy in the instance is
+        searched for.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        if self.adapt_image_path_list is None:
+            return super().adapt_images_via_instance_from(instance=instance)
+
+        galaxy_image_dict = {}
+
+        for path, image in self.adapt_image_path_list:
+            galaxy = instance
+
+            try:
+                for name in path:
+                    galaxy = getattr(galaxy, name)
+            except AttributeError:
+                return super().adapt_images_via_instance_from(instance=instance)
+
+            galaxy_image_dict[galaxy] = image
+
+        return ag.AdaptImages(galaxy_image_dict=galaxy_image_dict)
+
+    def log_likelihood_via_cascade_from(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the figure of merit of the fit of a model instance, which if the analysis has a `LikelihoodCascade`
+        is computed via the cascade, such that the full fit is only performed if no stage of the cascade rejects
+        the model.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        if self.likelihood_cascade is None:
+            return self.figure_of_merit_from(instance=instance)
+
+        return self.likelihood_cascade.log_likelihood_from(
+            analysis=self,
+            instance=instance,
+            log_likelihood_func=lambda: self.figure_of_merit_from(instance=instance),
+        )
+
+    def figure_of_merit_from(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the figure of merit of the fit of a model instance, which if the analysis has a `LikelihoodTelemetry`
+        and this call is sampled by it, is performed with a `HierarchicalProfiler` enabled to record the run times of
+        its stages.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        if (
+            self.likelihood_telemetry is None
+            or not self.likelihood_telemetry.is_sampled_call()
+        ):
+            return self.fit_from(instance=instance).figure_of_merit
+
+        return self.likelihood_telemetry.profiled_figure_of_merit_from(
+            fit_func=lambda: self.fit_from(instance=instance)
+        )
+
+    def hierarchical_profiler_from(
+        self, instance: af.ModelInstance
+    ) -> profiling.HierarchicalProfiler:
+        """
+        Returns a `HierarchicalProfiler` which has recorded the ray-tracing, deflection angle, over-sampling, mapper
+        and inversion calculations of one fit of a model instance.
+
+        Unlike the `run_time_dict`, which records the total time of every function decorated with `profile_func`, the
+        profiler records the time of every call under the stack of functions it is called inside, for example the
+        deflection angles of every galaxy in every plane.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        with profiling.HierarchicalProfiler() as profiler:
+            with profiling.section(name="fit_from"):
+                self.fit_from(instance=instance).figure_of_merit
+
+        return profiler
+
+    def output_flame_graph(
+        self, instance: af.ModelInstance, paths: Optional[af.DirectoryPaths]
+    ):
+        """
+        Output a flame graph of one fit of a model instance (see `hierarchical_profiler_from`) to the file
+        `flame_graph.txt` alongside the other profiling information of the analysis.
+
+        The file uses the collapsed stack format, which is read by flame graph tools such as `flamegraph.pl` and
+        `speedscope`.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        """
+        if paths is None:
+            return
+
+        self.hierarchical_profiler_from(instance=instance).output_flame_graph(
+            file_path=os.path.join(paths.profile_path, "flame_graph.txt")
+        )
+
+    def output_profiling_info(
+        self, paths: Optional[af.DirectoryPaths], run_time_dict: Dict, info_dict: Dict
+    ):
+        """
+        Output the log likelihood function profiling information to hard-disk as a json file.
+
+        If the analysis has a `LikelihoodCascade`, the timings and rejection counts of every stage of the cascade,
+        summed over every process, are also output to the file `likelihood_cascade.json`.
+
+        Parameters
+        ----------
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization and the pickled objects used by the aggregator output by this function.
+        run_time_dict
+            A dictionary containing the profiling times of the functions called by the `log_likelihood_function`.
+        info_dict
+            A dictionary containing information on the model and dataset used to perform the profiling, where these
+            settings typically control the overall run-time.
+        """
+        super().output_profiling_info(
+            paths=paths, run_time_dict=run_time_dict, info_dict=info_dict
+        )
+
+        if paths is None or self.likelihood_cascade is None:
+            return
+
+        self.likelihood_cascade.output_to_json(
+            file_path=os.path.join(paths.profile_path, "likelihood_cascade.json")
+        )
+
     def raise_exceptions(self, model):
         has_pix = model.has_model(cls=(aa.Pixelization,)) or model.has_instance(
             cls=(aa.Pixelization,)
@@ -164,6 +468,10 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
 
         - The maximum log likelihood tracer of the fit.
 
+        - The summary of the `LikelihoodCascade` of the fit, if the analysis has one.
+
+        - The summary of the `LikelihoodTelemetry` of the fit, if the analysis has one.
+
         Parameters
         ----------
         paths
@@ -180,6 +488,18 @@ class AnalysisDataset(AgAnalysisDataset, AnalysisLens):
         except AttributeError:
             pass
 
+        if self.likelihood_cascade is not None:
+            paths.save_json(
+                name="likelihood_cascade",
+                object_dict=self.likelihood_cascade.summary_dict,
+            )
+
+        if self.likelihood_telemetry is not None:
+            paths.save_json(
+                name="likelihood_telemetry",
+                object_dict=self.likelihood_telemetry.summary_dict,
+            )
+
         image_mesh_list = []
 
         for galaxy in result.instance.galaxies:
@@ -6,8 +6,11 @@ import autofit as af
 import autoarray as aa
 import autogalaxy as ag
 
+from autolens.analysis.macro_deflections import MacroDeflectionCache
 from autolens.analysis.positions import PositionsLHResample
 from autolens.analysis.positions import PositionsLHPenalty
+from autolens.lens.sparse_deflections import SparseDeflections
+from autolens.lens.tree_deflections import TreeDeflections
 from autolens.lens.tracer import Tracer
 
 from autolens.lens import tracer_util
@@ -26,6 +29,9 @@ class AnalysisLens:
             Union[PositionsLHResample, PositionsLHPenalty]
         ] = None,
         cosmology: ag.cosmo.LensingCosmology = ag.cosmo.Planck15(),
+        macro_deflection_cache: Optional[MacroDeflectionCache] = None,
+        sparse_deflections: Optional[SparseDeflections] = None,
+        tree_deflections: Optional[TreeDeflections] = None,
     ):
         """
         Analysis classes are used by PyAutoFit to fit a model to a dataset via a non-linear search.
@@ -41,9 +47,22 @@ class AnalysisLens:
         ----------
         cosmology
             The Cosmology assumed for this analysis.
+        macro_deflection_cache
+            Optionally computes the deflection angles of the macro lens model via a first-order expansion around a
+            reference model (e.g. the fit without a subhalo), which speeds up the fits of a subhalo grid search.
+        sparse_deflections
+            Optionally approximates the deflection angles of every galaxy far from its centre via the monopole of its
+            mass distribution, within an input tolerance, which speeds up models with many halos (see
+            `SparseDeflections`).
+        tree_deflections
+            Optionally computes the deflection angles of planes with many halos (e.g. line-of-sight halos) via a tree
+            code when ray-tracing (see `TreeDeflections`), where None sums the deflection angles of every halo.
         """
         self.cosmology = cosmology
         self.positions_likelihood = positions_likelihood
+        self.macro_deflection_cache = macro_deflection_cache
+        self.sparse_deflections = sparse_deflections
+        self.tree_deflections = tree_deflections
 
     def tracer_via_instance_from(
         self,
@@ -83,22 +102,36 @@ class AnalysisLens:
 
             instance.galaxies.subhalo.mass.centre = tuple(subhalo_centre.in_list[0])
 
+        if self.sparse_deflections is not None:
+            self.sparse_deflections.apply_to(galaxies=instance.galaxies)
+
         if hasattr(instance, "cosmology"):
             cosmology = instance.cosmology
         else:
             cosmology = self.cosmology
 
+        deflections_func = None
+
+        if self.macro_deflection_cache is not None:
+            deflections_func = self.macro_deflection_cache.deflections_func_from(
+                galaxies=instance.galaxies
+            )
+
         if hasattr(instance, "extra_galaxies"):
             if getattr(instance, "extra_galaxies", None) is not None:
                 return Tracer(
                     galaxies=instance.galaxies + instance.extra_galaxies,
                     run_time_dict=run_time_dict,
+                    tree_deflections=self.tree_deflections,
+                    deflections_func=deflections_func,
                 )
 
         return Tracer(
             galaxies=instance.galaxies,
             cosmology=cosmology,
             run_time_dict=run_time_dict,
+            tree_deflections=self.tree_deflections,
+            deflections_func=deflections_func,
         )
 
     def log_likelihood_positions_overwrite_from(
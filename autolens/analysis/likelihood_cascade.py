@@ -0,0 +1,485 @@
+import copy
+import glob
+import json
+import os
+import time
+from os import path
+from typing import Callable, Dict, List, Optional
+
+import autofit as af
+import autoarray as aa
+
+from autolens.analysis.positions import log_likelihood_penalty_base_from
+from autolens.analysis.preloads import Preloads
+
+
+class LikelihoodStage:
+    def __init__(
+        self,
+        name: str,
+        margin: float = 100.0,
+        log_likelihood_threshold: Optional[float] = None,
+        dataset_func: Optional[Callable] = None,
+        instance_func: Optional[Callable] = None,
+    ):
+        """
+        A stage of a `LikelihoodCascade`, which computes a cheap estimate of the log likelihood of a model that is
+        used to reject it before the full (expensive) log likelihood is computed.
+
+        The estimate is the log likelihood of a fit which is cheaper than the full fit, because:
+
+        - The dataset is altered via the `dataset_func`, for example using a lower sub-grid size (see
+          `LikelihoodStage.from_over_sampling`) or data binned to a lower resolution.
+
+        - The model instance is altered via the `instance_func`, for example replacing a source pixelization with
+          a coarser mesh.
+
+        A model is rejected if its estimate is below the stage's threshold. This is fixed throughout the model-fit, so
+        whether a model is rejected does not depend on which models were evaluated before it (or by which process of a
+        parallel search). The threshold is the input `log_likelihood_threshold` or, if it is not input, is computed by
+        the `LikelihoodCascade` before every model-fit begins as the estimate of a reference model minus `margin` (see
+        `LikelihoodCascade.set_log_likelihood_thresholds`).
+
+        Estimates of different stages are never compared to one another or the full log likelihood, therefore each
+        stage only needs to rank models in the same way as the full log likelihood, not reproduce its value.
+
+        Parameters
+        ----------
+        name
+            The name of the stage, which labels its timings and rejection counts.
+        margin
+            If the `log_likelihood_threshold` is not input, it is the estimated log likelihood of the reference model
+            minus this value.
+        log_likelihood_threshold
+            A model is rejected if its estimated log likelihood is below this value.
+        dataset_func
+            A function which receives the dataset of the analysis and returns the dataset fitted by this stage. This
+            is called once and the returned dataset reused for every model.
+        instance_func
+            A function which receives a copy of the model instance and returns the instance fitted by this stage.
+        """
+        self.name = name
+        self.margin = margin
+        self.log_likelihood_threshold = log_likelihood_threshold
+        self.dataset_func = dataset_func
+        self.instance_func = instance_func
+
+        self._analysis_dict = {}
+
+    @classmethod
+    def from_over_sampling(
+        cls,
+        sub_size: int = 1,
+        margin: float = 100.0,
+        name: str = "over_sampling",
+    ) -> "LikelihoodStage":
+        """
+        Returns a stage which fits the dataset with its light profile and pixelization grids evaluated using a
+        uniform sub-grid of an input `sub_size` (by default 1, a mask-sized grid without over sampling).
+
+        Parameters
+        ----------
+        sub_size
+            The sub-grid size used to evaluate light profiles and ray-trace the pixelization grid in this stage.
+        margin
+            The rejection threshold of the stage is the estimated log likelihood of the reference model minus this
+            value.
+        name
+            The name of the stage, which labels its timings and rejection counts.
+        """
+
+        def dataset_func(dataset):
+            return dataset.apply_over_sampling(
+                over_sampling=aa.OverSamplingDataset(
+                    uniform=aa.OverSamplingUniform(sub_size=sub_size),
+                    pixelization=aa.OverSamplingUniform(sub_size=sub_size),
+                )
+            )
+
+        return LikelihoodStage(name=name, margin=margin, dataset_func=dataset_func)
+
+    def analysis_from(self, analysis):
+        """
+        Returns a copy of the analysis whose dataset is the dataset fitted by this stage, creating it the first time
+        it is requested.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function the cascade is used in.
+        """
+        if self.dataset_func is None:
+            return analysis
+
+        key = id(analysis)
+
+        if key not in self._analysis_dict:
+            analysis_stage = copy.copy(analysis)
+            analysis_stage.dataset = self.dataset_func(analysis.dataset)
+
+            self._analysis_dict[key] = analysis_stage
+
+        return self._analysis_dict[key]
+
+    def log_likelihood_from(self, analysis, instance: af.ModelInstance) -> float:
+        """
+        Returns the estimated log likelihood of a model instance computed by this stage.
+
+        Preloads of the analysis correspond to the full dataset and model, so are not used by this stage.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function the cascade is used in.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        """
+        if self.instance_func is not None:
+            instance = self.instance_func(copy.deepcopy(instance))
+
+        return (
+            self.analysis_from(analysis=analysis)
+            .fit_from(instance=instance, preload_overwrite=Preloads())
+            .figure_of_merit
+        )
+
+    def rejects(
+        self, log_likelihood: float, log_likelihood_threshold: Optional[float] = None
+    ) -> bool:
+        """
+        Returns whether a model whose estimated log likelihood is an input value is rejected, which is never the case
+        if the stage has neither an input `log_likelihood_threshold` nor a computed threshold.
+
+        Parameters
+        ----------
+        log_likelihood
+            The estimated log likelihood of the model computed by this stage.
+        log_likelihood_threshold
+            The threshold computed for this stage by the `LikelihoodCascade`, which is used if the stage does not
+            have an input `log_likelihood_threshold`.
+        """
+        if self.log_likelihood_threshold is not None:
+            log_likelihood_threshold = self.log_likelihood_threshold
+
+        if log_likelihood_threshold is None:
+            return False
+
+        return log_likelihood < log_likelihood_threshold
+
+
+class LikelihoodCascade:
+    def __init__(
+        self,
+        stage_list: List[LikelihoodStage],
+        instance: Optional[af.ModelInstance] = None,
+    ):
+        """
+        A cascade of progressively more expensive estimates of the log likelihood, which are computed in order
+        before the full log likelihood of a model to reject poor models early.
+
+        The cascade is passed to an `Analysis` class (e.g. `AnalysisImaging`) and used in its
+        `log_likelihood_function` after the positions likelihood. Each `LikelihoodStage` computes a cheap estimate
+        of the log likelihood and, if this is below the fixed threshold of that stage, the model is rejected and the
+        remaining stages and full fit are skipped.
+
+        The thresholds of stages which are not input one are computed before every model-fit begins, from the
+        estimates of a reference model (the input `instance`, or otherwise the median of the model's priors).
+
+        Rejected models are given a penalty log likelihood, which is the log likelihood of a model whose model-data
+        is all zeros (see `log_likelihood_penalty_base_from`) plus the amount the estimate of the rejecting stage is
+        below its threshold. This is below the log likelihood of any reasonable model, but finite, so it does not
+        cause numerical issues for the non-linear search, and it decreases with the estimated log likelihood, so
+        the non-linear search is not given a flat likelihood surface where models are rejected.
+
+        The cascade records how long every stage takes and how many models it rejects. If an `output_path` is set
+        (which the `Analysis` does before the search begins) every process writes these counts to its own file
+        (`likelihood_cascade_<pid>.json`), because the log likelihood of a parallel search is evaluated by many
+        processes. The summary (see `summary_dict`) sums the counts of the files of every process, and is output to
+        the `files` folder at the end of the search as the file `likelihood_cascade.json`.
+
+        Parameters
+        ----------
+        stage_list
+            The stages of the cascade, ordered from cheapest to most expensive.
+        instance
+            The reference model whose estimated log likelihoods set the thresholds of stages which are not input one,
+            for example the maximum likelihood model of a previous non-linear search.
+        """
+        self.stage_list = stage_list
+        self.instance = instance
+
+        self.log_likelihood_threshold_dict = {}
+
+        self.total_calls = 0
+        self.total_full = 0
+        self.time_full = 0.0
+
+        self.stage_dict = {
+            stage.name: {"calls": 0, "rejections": 0, "time": 0.0}
+            for stage in stage_list
+        }
+
+        self._log_likelihood_penalty_dict = {}
+
+        self.output_path = None
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """
+        The path of the .json file the counts of this process are written to, which is None if no `output_path` is
+        set.
+        """
+        if self.output_path is None:
+            return None
+
+        return os.path.join(self.output_path, f"likelihood_cascade_{os.getpid()}.json")
+
+    def reset_counts(self):
+        """
+        Resets the number of models evaluated and rejected by every stage and their run times to zero.
+        """
+        self.total_calls = 0
+        self.total_full = 0
+        self.time_full = 0.0
+
+        for stage_dict in self.stage_dict.values():
+            stage_dict.update({"calls": 0, "rejections": 0, "time": 0.0})
+
+    def set_log_likelihood_thresholds(self, analysis, model: af.AbstractPriorModel):
+        """
+        Computes the threshold of every stage which does not have an input `log_likelihood_threshold`, as the
+        estimated log likelihood of the reference model of the cascade minus the stage's margin, and stores them in
+        the `log_likelihood_threshold_dict` of the cascade.
+
+        This is called before every model-fit begins (see `AnalysisDataset.modify_before_fit`), so that the
+        thresholds are fixed throughout the model-fit and shared by every process of a parallel search, and are
+        recomputed for the model of every model-fit the cascade is reused for. The counts of the cascade are reset,
+        so that its summary only describes the model-fit which is beginning.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function the cascade is used in.
+        model
+            The model fitted by the analysis, the median of whose priors is the reference model if the cascade does
+            not have an `instance`.
+        """
+        instance = self.instance
+
+        if instance is None:
+            instance = model.instance_from_prior_medians()
+
+        self.log_likelihood_threshold_dict = {
+            stage.name: stage.log_likelihood_from(analysis=analysis, instance=instance)
+            - stage.margin
+            for stage in self.stage_list
+            if stage.log_likelihood_threshold is None
+        }
+
+        self.reset_counts()
+
+    def log_likelihood_threshold_from(self, stage: LikelihoodStage) -> Optional[float]:
+        """
+        Returns the threshold of a stage, which is its input `log_likelihood_threshold` or otherwise the threshold
+        computed by `set_log_likelihood_thresholds` (None if this has not been called).
+
+        Parameters
+        ----------
+        stage
+            The stage whose threshold is returned.
+        """
+        if stage.log_likelihood_threshold is not None:
+            return stage.log_likelihood_threshold
+
+        return self.log_likelihood_threshold_dict.get(stage.name)
+
+    def log_likelihood_penalty_from(
+        self, analysis, stage: LikelihoodStage, log_likelihood: float
+    ) -> float:
+        """
+        Returns the penalty log likelihood given to a model rejected by a stage of the cascade, which is the
+        penalty base of the dataset (computed once for every dataset) plus the amount the model's estimated log
+        likelihood is below the threshold of the stage.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function the cascade is used in.
+        stage
+            The stage which rejected the model.
+        log_likelihood
+            The estimated log likelihood of the model computed by the stage.
+        """
+        key = id(analysis.dataset)
+
+        if key not in self._log_likelihood_penalty_dict:
+            self._log_likelihood_penalty_dict[key] = log_likelihood_penalty_base_from(
+                dataset=analysis.dataset
+            )
+
+        return self._log_likelihood_penalty_dict[key] + (
+            log_likelihood - self.log_likelihood_threshold_from(stage=stage)
+        )
+
+    def log_likelihood_from(
+        self, analysis, instance: af.ModelInstance, log_likelihood_func: Callable
+    ) -> float:
+        """
+        Returns the log likelihood of a model instance, computing the estimate of every stage in order and returning
+        the penalty log likelihood if any stage rejects the model, or the full log likelihood otherwise.
+
+        The updated counts of this process are written to its file (see `output_counts`) after every call.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose log likelihood function the cascade is used in.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        log_likelihood_func
+            A function with no arguments which returns the full log likelihood of the model.
+        """
+        self.total_calls += 1
+
+        for stage in self.stage_list:
+            stage_dict = self.stage_dict[stage.name]
+
+            start = time.time()
+
+            log_likelihood = stage.log_likelihood_from(
+                analysis=analysis, instance=instance
+            )
+
+            stage_dict["calls"] += 1
+            stage_dict["time"] += time.time() - start
+
+            if stage.rejects(
+                log_likelihood=log_likelihood,
+                log_likelihood_threshold=self.log_likelihood_threshold_from(
+                    stage=stage
+                ),
+            ):
+                stage_dict["rejections"] += 1
+                self.output_counts()
+
+                return self.log_likelihood_penalty_from(
+                    analysis=analysis, stage=stage, log_likelihood=log_likelihood
+                )
+
+        start = time.time()
+
+        log_likelihood = log_likelihood_func()
+
+        self.total_full += 1
+        self.time_full += time.time() - start
+
+        self.output_counts()
+
+        return log_likelihood
+
+    @property
+    def count_dict(self) -> Dict:
+        """
+        A dictionary of the number of models evaluated and rejected by every stage of this process and their run
+        times, and the same information for the full log likelihood.
+        """
+        return {
+            "pid": os.getpid(),
+            "total_calls": self.total_calls,
+            "stages": self.stage_dict,
+            "full": {"calls": self.total_full, "time": self.time_full},
+        }
+
+    def output_counts(self):
+        """
+        Writes the counts of this process (see `count_dict`) to its .json file (if a `file_path` is set).
+
+        The file is written to a temporary file which then replaces it, so that the summary never reads a file
+        which is partially written.
+        """
+        file_path = self.file_path
+
+        if file_path is None:
+            return
+
+        os.makedirs(self.output_path, exist_ok=True)
+
+        with open(f"{file_path}.tmp", "w") as f:
+            json.dump(self.count_dict, f)
+
+        os.replace(f"{file_path}.tmp", file_path)
+
+    def count_dict_list_from_files(self) -> List[Dict]:
+        """
+        Returns the counts of every process which are written to the .json files in the `output_path`.
+        """
+        count_dict_list = []
+
+        for file_path in glob.glob(
+            os.path.join(self.output_path, "likelihood_cascade_*.json")
+        ):
+            with open(file_path) as f:
+                count_dict_list.append(json.load(f))
+
+        return count_dict_list
+
+    @property
+    def summary_dict(self) -> Dict:
+        """
+        A dictionary summarizing the cascade over every process (or this process if no `output_path` is set),
+        containing for every stage the number of models it evaluated and rejected, and its total and average run
+        time, and the same information for the full log likelihood.
+        """
+        if self.output_path is None:
+            count_dict_list = [self.count_dict]
+        else:
+            count_dict_list = self.count_dict_list_from_files()
+
+        summary_dict = {
+            "total_calls": sum(
+                count_dict["total_calls"] for count_dict in count_dict_list
+            ),
+            "total_processes": len(count_dict_list),
+            "stages": {},
+        }
+
+        for name in self.stage_dict:
+            stage_dict = {
+                key: sum(
+                    count_dict["stages"][name][key] for count_dict in count_dict_list
+                )
+                for key in ("calls", "rejections", "time")
+            }
+
+            summary_dict["stages"][name] = {
+                **stage_dict,
+                "time_per_call": stage_dict["time"] / max(stage_dict["calls"], 1),
+            }
+
+        full_dict = {
+            key: sum(count_dict["full"][key] for count_dict in count_dict_list)
+            for key in ("calls", "time")
+        }
+
+        summary_dict["full"] = {
+            **full_dict,
+            "time_per_call": full_dict["time"] / max(full_dict["calls"], 1),
+        }
+
+        return summary_dict
+
+    def output_to_json(self, file_path: str):
+        """
+        Output the summary of the cascade (see `summary_dict`) to a .json file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the summary is output to.
+        """
+        os.makedirs(path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "w+") as f:
+            json.dump(self.summary_dict, f, indent=4)
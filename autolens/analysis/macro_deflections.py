@@ -0,0 +1,398 @@
+import copy
+import logging
+import numpy as np
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import autofit as af
+import autoarray as aa
+import autogalaxy as ag
+
+logger = logging.getLogger(__name__)
+
+logger.setLevel(level="INFO")
+
+
+def parameter_paths_from(galaxy: ag.Galaxy) -> List[Tuple[str, str, Optional[int]]]:
+    """
+    Returns the paths to every numerical parameter of the mass profiles of a galaxy, in the form
+    `(profile_name, attribute_name, tuple_index)`, where `tuple_index` is None for a float parameter and the index of
+    the value for a tuple parameter (e.g. a `centre` gives the paths `("mass", "centre", 0)` and
+    `("mass", "centre", 1)`).
+
+    Parameters
+    ----------
+    galaxy
+        The galaxy whose mass profile parameters paths are returned.
+    """
+    parameter_path_list = []
+
+    for profile_name, profile in sorted(galaxy.__dict__.items()):
+        if not isinstance(profile, ag.mp.MassProfile):
+            continue
+
+        for attribute_name, value in sorted(vars(profile).items()):
+            if isinstance(value, bool):
+                continue
+
+            if isinstance(value, (int, float)):
+                parameter_path_list.append((profile_name, attribute_name, None))
+            elif isinstance(value, tuple) and all(
+                isinstance(entry, (int, float)) for entry in value
+            ):
+                parameter_path_list += [
+                    (profile_name, attribute_name, index) for index in range(len(value))
+                ]
+
+    return parameter_path_list
+
+
+class GalaxyLinearization:
+    def __init__(self, galaxy: ag.Galaxy, step_size: float = 1.0e-5):
+        """
+        A first-order (linear) expansion of the deflection angles of a galaxy's mass profiles around a reference
+        set of mass profile parameters.
+
+        For every grid registered via `register_grid` (e.g. the image-plane grid of a dataset), the deflection
+        angles of the reference galaxy `alpha_0` and their derivatives with respect to every mass profile parameter
+        `J` (via central finite differences) are stored. The deflection angles of the same galaxy with different
+        parameters `p` are then approximated as `alpha_0 + J (p - p_0)`, which is a single matrix-vector product.
+
+        Registered grids are looked up by their identity rather than their values, so looking up the expansion does
+        not depend on the size of the grid, and all other grids (e.g. grids traced to a higher redshift plane which
+        change with the lens model) are never expanded.
+
+        Derivatives which are not finite (e.g. for a parameter at the edge of its allowed range, like a core radius
+        of zero) are set to zero.
+
+        Parameters
+        ----------
+        galaxy
+            The reference galaxy (e.g. the lens galaxy of the maximum likelihood model without a subhalo) the
+            deflection angles are expanded around.
+        step_size
+            The absolute step size of the finite differences used to compute the derivatives of the deflection
+            angles.
+        """
+        self.galaxy = galaxy
+        self.step_size = step_size
+
+        self.parameter_paths = parameter_paths_from(galaxy=galaxy)
+        self.profile_types = {
+            profile_name: type(getattr(galaxy, profile_name))
+            for profile_name, _, _ in self.parameter_paths
+        }
+        self.parameters = self.parameters_from(galaxy=galaxy)
+
+        self._expansion_dict = {}
+
+    def parameters_from(self, galaxy: ag.Galaxy) -> Optional[np.ndarray]:
+        """
+        Returns the vector of mass profile parameters of a galaxy, in the order of the `parameter_paths` of the
+        reference galaxy.
+
+        If the galaxy's mass profiles are not the same types as the reference galaxy's, None is returned to indicate
+        the galaxy cannot use the expansion.
+
+        Parameters
+        ----------
+        galaxy
+            The galaxy whose mass profile parameters are returned.
+        """
+        parameter_list = []
+
+        for profile_name, attribute_name, index in self.parameter_paths:
+            profile = getattr(galaxy, profile_name, None)
+
+            if type(profile) is not self.profile_types[profile_name]:
+                return None
+
+            value = getattr(profile, attribute_name)
+
+            parameter_list.append(value if index is None else value[index])
+
+        return np.asarray(parameter_list, dtype="float")
+
+    def galaxy_via_parameter_shift_from(
+        self, parameter_index: int, shift: float
+    ) -> ag.Galaxy:
+        """
+        Returns a copy of the reference galaxy with one of its mass profile parameters shifted by an input amount,
+        which is used to compute derivatives via finite differences.
+        """
+        galaxy = copy.deepcopy(self.galaxy)
+
+        profile_name, attribute_name, index = self.parameter_paths[parameter_index]
+
+        profile = getattr(galaxy, profile_name)
+        value = getattr(profile, attribute_name)
+
+        if index is None:
+            value = value + shift
+        else:
+            value = list(value)
+            value[index] += shift
+            value = tuple(value)
+
+        setattr(profile, attribute_name, value)
+
+        return galaxy
+
+    def register_grid(self, grid: aa.type.Grid2DLike):
+        """
+        Computes and stores the reference deflection angles and their derivatives with respect to every mass
+        profile parameter on an input grid, which are used whenever the deflection angles are computed on the same
+        grid object.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates the deflection angles are expanded on.
+        """
+        deflections_0 = self.galaxy.deflections_yx_2d_from(grid=grid)
+
+        jacobian_list = []
+
+        for parameter_index in range(len(self.parameter_paths)):
+            deflections_plus = self.galaxy_via_parameter_shift_from(
+                parameter_index=parameter_index, shift=self.step_size
+            ).deflections_yx_2d_from(grid=grid)
+            deflections_minus = self.galaxy_via_parameter_shift_from(
+                parameter_index=parameter_index, shift=-self.step_size
+            ).deflections_yx_2d_from(grid=grid)
+
+            jacobian_list.append(
+                (np.asarray(deflections_plus) - np.asarray(deflections_minus))
+                / (2.0 * self.step_size)
+            )
+
+        jacobian = np.nan_to_num(
+            np.stack(jacobian_list, axis=-1), nan=0.0, posinf=0.0, neginf=0.0
+        )
+
+        self._expansion_dict[id(grid)] = (grid, deflections_0, jacobian)
+
+    def expansion_from(
+        self, grid: aa.type.Grid2DLike
+    ) -> Optional[Tuple[aa.type.Grid2DLike, np.ndarray]]:
+        """
+        Returns the reference deflection angles and their derivatives with respect to every mass profile parameter
+        on an input grid, or None if the grid was not registered via `register_grid`, indicating exact deflection
+        angles should be used.
+
+        The registered grid is stored with its expansion, so its identity cannot be reused by another grid.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates the deflection angles are computed on.
+        """
+        expansion = self._expansion_dict.get(id(grid))
+
+        if expansion is None or expansion[0] is not grid:
+            return None
+
+        return expansion[1:]
+
+
+class MacroDeflectionCache:
+    def __init__(
+        self,
+        galaxies: Union[af.ModelInstance, Dict[str, ag.Galaxy]],
+        max_parameter_offset: float = 0.1,
+        tolerance: float = 1.0e-4,
+        verify_every: int = 100,
+        step_size: float = 1.0e-5,
+    ):
+        """
+        Computes the deflection angles of the macro lens model during a subhalo detection grid search via a
+        first-order perturbation around a reference macro model.
+
+        In every cell of a subhalo grid search the lens model is refitted with a subhalo included, where the macro
+        lens galaxy (e.g. an `Isothermal` plus `ExternalShear`) is free but remains close to the maximum likelihood
+        model of the fit without a subhalo. Evaluating the macro model's deflection angles on the image-plane grid
+        is typically the most expensive lensing calculation of every likelihood evaluation, therefore this cache
+        approximates them as:
+
+        `alpha(p) = alpha(p_0) + J (p - p_0)`
+
+        where `p_0` are the mass profile parameters of the reference galaxies (e.g. `result_no_subhalo.instance`)
+        and `J` the derivatives of the deflection angles with respect to every parameter, which are computed once
+        for every grid registered via `register_grid` (an `Analysis` registers the image-plane grid of its dataset).
+
+        The galaxies of a model instance are not modified. Instead, `deflections_func_from` returns a function which
+        the `Tracer` of the instance uses to compute the deflection angles of every galaxy when ray-tracing.
+
+        Only reference galaxies with a mass profile at the lowest redshift of the reference galaxies are expanded,
+        as their deflection angles are evaluated on the (fixed) image-plane grid. Galaxies are matched to the
+        reference galaxies by their name in the model (e.g. `galaxies.lens`), so the subhalo galaxy is always
+        computed exactly.
+
+        Exact deflection angles are used as a fallback when:
+
+        - A galaxy's parameters differ from the reference parameters by more than `max_parameter_offset`, where
+          the first-order expansion is not accurate.
+
+        - Every `verify_every` linearized evaluation, where the linearized deflection angles are compared to the
+          exact deflection angles. If the maximum difference exceeds `tolerance`, a warning is logged and the cache
+          is disabled for the rest of the model-fit.
+
+        Parameters
+        ----------
+        galaxies
+            The reference galaxies the deflection angles are expanded around, for example the `galaxies` of the
+            maximum likelihood instance of a model-fit without a subhalo.
+        max_parameter_offset
+            The maximum absolute difference of every mass profile parameter from its reference value for which the
+            linearized deflection angles are used.
+        tolerance
+            The maximum absolute difference (in arc-seconds) between the linearized and exact deflection angles
+            allowed when they are verified.
+        verify_every
+            The linearized deflection angles are verified against the exact deflection angles every this many
+            evaluations.
+        step_size
+            The absolute step size of the finite differences used to compute the derivatives of the deflection
+            angles.
+        """
+        galaxies = dict(galaxies.items())
+
+        mass_galaxies = {
+            name: galaxy
+            for name, galaxy in galaxies.items()
+            if isinstance(galaxy, ag.Galaxy) and galaxy.has(cls=ag.mp.MassProfile)
+        }
+
+        self.linearization_dict = {}
+
+        if mass_galaxies:
+            redshift = min(galaxy.redshift for galaxy in mass_galaxies.values())
+
+            self.linearization_dict = {
+                name: GalaxyLinearization(galaxy=galaxy, step_size=step_size)
+                for name, galaxy in mass_galaxies.items()
+                if galaxy.redshift == redshift
+            }
+
+        self.max_parameter_offset = max_parameter_offset
+        self.tolerance = tolerance
+        self.verify_every = verify_every
+
+        self.is_valid = True
+
+        self.total_linear = 0
+        self.total_exact = 0
+
+    def register_grid(self, grid: aa.type.Grid2DLike):
+        """
+        Computes the expansion of the deflection angles of every reference galaxy on an input grid (e.g. the
+        image-plane grid of the dataset), which is used whenever deflection angles are computed on this grid object.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates the deflection angles are expanded on.
+        """
+        for linearization in self.linearization_dict.values():
+            linearization.register_grid(grid=grid)
+
+    def deflections_func_from(self, galaxies: af.ModelInstance) -> Optional[Callable]:
+        """
+        Returns the function a `Tracer` uses to compute the deflection angles of every galaxy of a model instance,
+        which uses the linearized deflection angles of every galaxy matching a reference galaxy.
+
+        None is returned if the cache has been disabled, in which case every galaxy's deflection angles are computed
+        exactly.
+
+        Parameters
+        ----------
+        galaxies
+            The galaxies of the model instance (e.g. `instance.galaxies`) which are fitted to the data.
+        """
+        if not self.is_valid:
+            return None
+
+        linearized_dict = {}
+
+        for name, linearization in self.linearization_dict.items():
+            galaxy = getattr(galaxies, name, None)
+
+            if galaxy is None or galaxy.redshift != linearization.galaxy.redshift:
+                continue
+
+            parameters = linearization.parameters_from(galaxy=galaxy)
+
+            if parameters is None:
+                continue
+
+            linearized_dict[id(galaxy)] = (galaxy, linearization, parameters)
+
+        return partial(self.deflections_yx_2d_from, linearized_dict)
+
+    def deflections_yx_2d_from(
+        self,
+        linearized_dict: Dict[int, Tuple[ag.Galaxy, GalaxyLinearization, np.ndarray]],
+        galaxy: ag.Galaxy,
+        grid: aa.type.Grid2DLike,
+    ):
+        """
+        Returns the deflection angles of a galaxy via its first-order expansion, or exactly if the galaxy does not
+        match a reference galaxy or the expansion cannot be used for this galaxy and grid.
+
+        Parameters
+        ----------
+        linearized_dict
+            The galaxies of a model instance which match a reference galaxy, with the expansion of the reference
+            galaxy and their mass profile parameters, in the order of the reference galaxy's parameter paths.
+        galaxy
+            The galaxy whose deflection angles are computed.
+        grid
+            The (y,x) coordinates the deflection angles are computed on.
+        """
+        entry = linearized_dict.get(id(galaxy))
+
+        if entry is None or entry[0] is not galaxy:
+            return galaxy.deflections_yx_2d_from(grid=grid)
+
+        _, linearization, parameters = entry
+
+        offset = parameters - linearization.parameters
+
+        if (
+            not self.is_valid
+            or np.max(np.abs(offset), initial=0.0) > self.max_parameter_offset
+        ):
+            self.total_exact += 1
+            return galaxy.deflections_yx_2d_from(grid=grid)
+
+        expansion = linearization.expansion_from(grid=grid)
+
+        if expansion is None:
+            self.total_exact += 1
+            return galaxy.deflections_yx_2d_from(grid=grid)
+
+        deflections_0, jacobian = expansion
+
+        deflections = deflections_0.with_new_array(
+            np.asarray(deflections_0) + jacobian @ offset
+        )
+
+        self.total_linear += 1
+
+        if self.total_linear % self.verify_every == 0:
+            deflections_exact = galaxy.deflections_yx_2d_from(grid=grid)
+
+            error = np.max(np.abs(np.asarray(deflections_exact) - deflections))
+
+            if error > self.tolerance:
+                logger.warning(
+                    f"The linearized macro model deflection angles differ from the exact deflection angles by "
+                    f"{error} (above the tolerance of {self.tolerance}), therefore the MacroDeflectionCache "
+                    f"is disabled and exact deflection angles are used for the rest of the model-fit."
+                )
+
+                self.is_valid = False
+
+            return deflections_exact
+
+        return deflections
@@ -9,6 +9,7 @@ from autogalaxy.analysis.plotter_interface import PlotterInterface as AgPlotterI
 
 from autolens.lens.tracer import Tracer
 from autolens.lens.plot.tracer_plotters import TracerPlotter
+from autolens.lens.plot.tracer_quantities import TracerQuantityProvider
 
 
 class PlotterInterface(AgPlotterInterface):
@@ -37,6 +38,9 @@ class PlotterInterface(AgPlotterInterface):
         Visualization includes individual images of attributes of the tracer (e.g. its image, convergence, deflection
         angles) and a subplot of all these attributes on the same figure.
 
+        All figures, of every output format, are made from one `TracerQuantityProvider`, so every tracer quantity is
+        computed once and the time spent computing each is logged.
+
         The images output by the `PlotterInterface` are customized using the file `config/visualize/plots.yaml` under the
         [tracer] header.
 
@@ -56,11 +60,14 @@ class PlotterInterface(AgPlotterInterface):
 
         mat_plot_2d = self.mat_plot_2d_from(subfolders="tracer")
 
+        tracer_quantities = TracerQuantityProvider(tracer=tracer)
+
         tracer_plotter = TracerPlotter(
             tracer=tracer,
             grid=grid,
             mat_plot_2d=mat_plot_2d,
             include_2d=self.include_2d,
+            tracer_quantities=tracer_quantities,
         )
 
         if should_plot("subplot_galaxies_images"):
@@ -98,6 +105,7 @@ class PlotterInterface(AgPlotterInterface):
                 grid=grid,
                 mat_plot_2d=mat_plot_2d,
                 include_2d=self.include_2d,
+                tracer_quantities=tracer_quantities,
             )
 
             tracer_plotter.figures_2d(
@@ -131,6 +139,7 @@ class PlotterInterface(AgPlotterInterface):
                 grid=grid,
                 mat_plot_2d=mat_plot_2d,
                 include_2d=self.include_2d,
+                tracer_quantities=tracer_quantities,
             )
 
             tracer_plotter.figures_2d(
@@ -143,6 +152,8 @@ class PlotterInterface(AgPlotterInterface):
                 magnification=True,
             )
 
+        tracer_quantities.log_times()
+
     def image_with_positions(self, image: aa.Array2D, positions: aa.Grid2DIrregular):
         """
         Visualizes the positions of a model-fit, where these positions are used to resample lens models where
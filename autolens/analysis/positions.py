@@ -15,11 +15,59 @@ from autogalaxy.analysis.analysis.dataset import AnalysisDataset
 from autolens.lens.tracer import Tracer
 from autolens.point.fit.positions.source.max_separation import (
     FitPositionsSourceMaxSeparation,
+    PositionsMassTracer,
 )
 
 from autolens import exc
 
 
+def log_likelihood_penalty_base_from(
+    dataset: Union[aa.Imaging, aa.Interferometer],
+) -> float:
+    """
+    Returns the log likelihood of a model whose model-data is all zeros, which represents the lowest possible
+    likelihood solutions a model-fit can give. It is the chi-squared of model-data consisting of all zeros plus
+    the noise normalization term.
+
+    This is used as the base value of penalty log likelihoods assigned to models which are rejected, for example
+    those whose positions do not trace within a threshold of one another in the source-plane.
+
+    Parameters
+    ----------
+    dataset
+        The imaging or interferometer dataset from which the penalty base is computed.
+    """
+    residual_map = aa.util.fit.residual_map_from(
+        data=dataset.data, model_data=np.zeros(dataset.data.shape)
+    )
+
+    if isinstance(dataset, aa.Imaging):
+        chi_squared_map = aa.util.fit.chi_squared_map_from(
+            residual_map=residual_map, noise_map=dataset.noise_map
+        )
+
+        chi_squared = aa.util.fit.chi_squared_from(chi_squared_map=chi_squared_map)
+
+        noise_normalization = aa.util.fit.noise_normalization_from(
+            noise_map=dataset.noise_map
+        )
+
+    else:
+        chi_squared_map = aa.util.fit.chi_squared_map_complex_from(
+            residual_map=residual_map, noise_map=dataset.noise_map
+        )
+
+        chi_squared = aa.util.fit.chi_squared_complex_from(
+            chi_squared_map=chi_squared_map
+        )
+
+        noise_normalization = aa.util.fit.noise_normalization_complex_from(
+            noise_map=dataset.noise_map
+        )
+
+    return -0.5 * (chi_squared + noise_normalization)
+
+
 class AbstractPositionsLH:
     def __init__(self, positions: aa.Grid2DIrregular, threshold: float):
         """
@@ -138,14 +186,16 @@ class PositionsLHResample(AbstractPositionsLH):
         """
         tracer = analysis.tracer_via_instance_from(instance=instance)
 
-        if not tracer.has(cls=ag.mp.MassProfile) or len(tracer.planes) == 1:
+        positions_tracer = PositionsMassTracer(tracer=tracer)
+
+        if not positions_tracer.has_mass:
             return
 
-        positions_fit = FitPositionsSourceMaxSeparation(
-            data=self.positions, noise_map=None, tracer=tracer
+        max_separation = positions_tracer.max_separation_of_source_plane_positions_from(
+            positions=self.positions
         )
 
-        if not positions_fit.max_separation_within_threshold(self.threshold):
+        if not max_separation <= self.threshold:
             if os.environ.get("PYAUTOFIT_TEST_MODE") == "1":
                 return
 
@@ -214,36 +264,7 @@ class PositionsLHPenalty(AbstractPositionsLH):
         dataset
             The imaging or interferometer dataset from which the penalty base is computed.
         """
-
-        residual_map = aa.util.fit.residual_map_from(
-            data=dataset.data, model_data=np.zeros(dataset.data.shape)
-        )
-
-        if isinstance(dataset, aa.Imaging):
-            chi_squared_map = aa.util.fit.chi_squared_map_from(
-                residual_map=residual_map, noise_map=dataset.noise_map
-            )
-
-            chi_squared = aa.util.fit.chi_squared_from(chi_squared_map=chi_squared_map)
-
-            noise_normalization = aa.util.fit.noise_normalization_from(
-                noise_map=dataset.noise_map
-            )
-
-        else:
-            chi_squared_map = aa.util.fit.chi_squared_map_complex_from(
-                residual_map=residual_map, noise_map=dataset.noise_map
-            )
-
-            chi_squared = aa.util.fit.chi_squared_complex_from(
-                chi_squared_map=chi_squared_map
-            )
-
-            noise_normalization = aa.util.fit.noise_normalization_complex_from(
-                noise_map=dataset.noise_map
-            )
-
-        return -0.5 * (chi_squared + noise_normalization)
+        return log_likelihood_penalty_base_from(dataset=dataset)
 
     def log_likelihood_penalty_from(self, tracer: Tracer) -> Optional[float]:
         """
@@ -261,16 +282,18 @@ class PositionsLHPenalty(AbstractPositionsLH):
         dataset
             The imaging or interferometer dataset from which the penalty base is computed.
         """
-        if not tracer.has(cls=ag.mp.MassProfile) or len(tracer.planes) == 1:
+        positions_tracer = PositionsMassTracer(tracer=tracer)
+
+        if not positions_tracer.has_mass:
             return
 
-        positions_fit = FitPositionsSourceMaxSeparation(
-            data=self.positions, noise_map=None, tracer=tracer
+        max_separation = positions_tracer.max_separation_of_source_plane_positions_from(
+            positions=self.positions
         )
 
-        if not positions_fit.max_separation_within_threshold(self.threshold):
+        if not max_separation <= self.threshold:
             return self.log_likelihood_penalty_factor * (
-                positions_fit.max_separation_of_source_plane_positions - self.threshold
+                max_separation - self.threshold
             )
 
     def log_likelihood_function_positions_overwrite(
@@ -290,9 +313,6 @@ class PositionsLHPenalty(AbstractPositionsLH):
         """
         tracer = analysis.tracer_via_instance_from(instance=instance)
 
-        if not tracer.has(cls=ag.mp.MassProfile) or len(tracer.planes) == 1:
-            return
-
         log_likelihood_positions_penalty = self.log_likelihood_penalty_from(
             tracer=tracer
         )
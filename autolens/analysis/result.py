@@ -13,6 +13,9 @@ from autolens.analysis.positions import PositionsLHPenalty
 from autolens.point.fit.positions.source.max_separation import (
     FitPositionsSourceMaxSeparation,
 )
+from autolens.point.fit.positions.source.max_separation import (
+    max_separations_via_tracer_list_from,
+)
 from autolens.lens.tracer import Tracer
 from autolens.point.solver import PointSolver
 
@@ -91,26 +94,97 @@ class Result(AgResultDataset):
 
         These image-plane positions are used by the next search in a pipeline if automatic position updating is turned
         on."""
+        multiple_images = self.image_plane_multiple_image_positions_from()
+
+        if len(multiple_images.in_list) == 1:
+            return self.image_plane_multiple_image_positions_for_single_image_from()
 
+        return multiple_images
+
+    def image_plane_multiple_image_positions_from(
+        self, coarse_factor: int = 4, seed_magnification: Optional[float] = 5.0
+    ) -> aa.Grid2DIrregular:
+        """
+        Backwards ray-trace the source-plane centre to the image-plane via the mass model of the maximum likelihood
+        tracer, using a point solver.
+
+        Tiling the whole mask with triangles the size of an image pixel traces many triangles far from the critical
+        curves and multiple images. By default a coarse solver is therefore used, which starts from triangles
+        `coarse_factor` times larger, and whose first step keeps both the triangles containing the source-plane
+        centre and every triangle whose magnification is above `seed_magnification`, which are those on or near the
+        critical curves where coarse triangles can miss images.
+
+        The coarse solver may still miss multiple images (e.g. return 2 or 3 images of a 4 image system), which
+        would change the positions used by the position thresholds of later searches. The number of images it finds
+        is therefore compared with the number expected, which is 4 if the source-plane centre is inside a tangential
+        caustic of the tracer and otherwise 2. If it finds fewer, the solver tiling the full mask at the pixel scale
+        is used instead. The number of triangles traced and run time of every solver used are logged.
+
+        Parameters
+        ----------
+        coarse_factor
+            The side length of the initial triangles of the coarse solver in units of the pixel scale of the mask,
+            where 1 uses the full solver only.
+        seed_magnification
+            The magnification above which initial triangles of the coarse solver are kept, if None only triangles
+            containing the source-plane centre are kept.
+        """
         grid = self.analysis.dataset.mask.derive_grid.all_false
 
+        tracer = self.max_log_likelihood_tracer
+
+        source_plane_coordinate = self.source_plane_centre.in_list[0]
+
         solver = PointSolver.for_grid(
             grid=grid,
             pixel_scale_precision=0.001,
+            coarse_factor=coarse_factor,
+            seed_magnification=seed_magnification,
         )
 
-        multiple_images = solver.solve(
-            tracer=self.max_log_likelihood_tracer,
-            source_plane_coordinate=self.source_plane_centre.in_list[0],
+        multiple_images, info_dict = solver.solve_with_info(
+            tracer=tracer,
+            source_plane_coordinate=source_plane_coordinate,
         )
 
-        if multiple_images.shape[0] == 1:
-            return self.image_plane_multiple_image_positions_for_single_image_from()
+        logger.info(
+            f"Point solver (coarse factor {coarse_factor}) traced {info_dict['total_triangles']} triangles "
+            f"in {info_dict['time']:.3f}s and found {len(multiple_images.in_list)} multiple images."
+        )
+
+        if coarse_factor == 1:
+            return multiple_images
+
+        lensing_geometry = tracer.lensing_geometry_from(grid=grid)
+
+        total_caustics = lensing_geometry.total_tangential_caustics_enclosing_from(
+            coordinate=source_plane_coordinate
+        )
+
+        expected_images = 4 if total_caustics > 0 else 2
+
+        if len(multiple_images.in_list) >= expected_images:
+            return multiple_images
+
+        solver = PointSolver.for_grid(
+            grid=grid,
+            pixel_scale_precision=0.001,
+        )
 
-        return aa.Grid2DIrregular(values=multiple_images)
+        multiple_images, info_dict = solver.solve_with_info(
+            tracer=tracer,
+            source_plane_coordinate=source_plane_coordinate,
+        )
+
+        logger.info(
+            f"Full point solver ({expected_images} multiple images expected) traced {info_dict['total_triangles']} "
+            f"triangles in {info_dict['time']:.3f}s and found {len(multiple_images.in_list)} multiple images."
+        )
+
+        return multiple_images
 
     def image_plane_multiple_image_positions_for_single_image_from(
-        self, increments: int = 20
+        self, increments: int = 20, number_of_cores: int = 1
     ) -> aa.Grid2DIrregular:
         """
         If the standard point solver only locates one multiple image, finds one or more additional images, which are
@@ -129,10 +203,16 @@ class Result(AgResultDataset):
         for the model being fitted, but as the factor decrease the multiple images may move furhter from their observed
         positions.
 
+        The maximum likelihood tracer is computed once and the initial triangles of the point solver are traced to the
+        source-plane once, and shared by the solves of every factor. The search stops at the first (largest) factor
+        which forms multiple images.
+
         Parameters
         ----------
         increments
             The number of increments the source-plane centre is moved to compute multiple images.
+        number_of_cores
+            The number of threads used to solve for the multiple images of different factors at once.
         """
 
         logger.info(
@@ -153,16 +233,23 @@ class Result(AgResultDataset):
             pixel_scale_precision=0.001,
         )
 
+        source_plane_coordinate_list = []
+
         for i in range(1, increments):
             factor = 1.0 - (1.0 * (i / increments))
 
-            multiple_images = solver.solve(
-                tracer=self.max_log_likelihood_tracer,
-                source_plane_coordinate=(centre[0] * factor, centre[1] * factor),
+            source_plane_coordinate_list.append(
+                (centre[0] * factor, centre[1] * factor)
             )
 
-            if multiple_images.shape[0] > 1:
-                return aa.Grid2DIrregular(values=multiple_images)
+        multiple_images = solver.solve_first_multiple_images_from(
+            tracer=self.max_log_likelihood_tracer,
+            source_plane_coordinate_list=source_plane_coordinate_list,
+            number_of_cores=number_of_cores,
+        )
+
+        if multiple_images is not None:
+            return aa.Grid2DIrregular(values=multiple_images)
 
         logger.info(
             """
@@ -233,6 +320,118 @@ class Result(AgResultDataset):
 
         return threshold
 
+    def positions_separations_via_posterior_from(
+        self,
+        total_samples: int = 200,
+        positions: Optional[aa.Grid2DIrregular] = None,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Returns the distribution of the maximum source-plane separation of the image-plane multiple image positions
+        over the posterior of the lens model, as opposed to only the maximum log likelihood `Tracer` used by
+        `positions_threshold_from`.
+
+        The samples are drawn randomly from the posterior, weighted by their sample weights. Non-linear searches
+        (e.g. nested samplers) often draw the same sample more than once, so a `Tracer` is only created for every
+        unique sample drawn, via the analysis so that it uses the same cosmology as the log likelihood function, and
+        the positions are ray-traced using only the galaxies with mass profiles of every
+        `Tracer` (see `max_separations_via_tracer_list_from`), with the separations of all samples computed in one
+        vectorized calculation.
+
+        Parameters
+        ----------
+        total_samples
+            The number of samples drawn from the posterior.
+        positions
+            If input, these positions are used instead of the computed multiple image positions from the lens mass
+            model.
+        seed
+            The seed of the random number generator which draws the samples, where None gives a random seed.
+
+        Returns
+        -------
+        np.ndarray
+            The maximum source plane separation of the multiple images for every sample drawn from the posterior.
+        """
+        positions = (
+            self.image_plane_multiple_image_positions
+            if positions is None
+            else positions
+        )
+
+        weights = np.asarray(self.samples.weight_list, dtype="float")
+
+        sample_indexes = np.random.default_rng(seed).choice(
+            len(weights), size=total_samples, p=weights / np.sum(weights)
+        )
+
+        unique_sample_indexes, inverse = np.unique(sample_indexes, return_inverse=True)
+
+        tracer_list = [
+            self.analysis.tracer_via_instance_from(
+                instance=self.samples.from_sample_index(sample_index=sample_index)
+            )
+            for sample_index in unique_sample_indexes
+        ]
+
+        max_separations = max_separations_via_tracer_list_from(
+            positions=positions, tracer_list=tracer_list
+        )
+
+        return max_separations[inverse]
+
+    def positions_threshold_via_posterior_from(
+        self,
+        quantile: float = 0.95,
+        factor=1.0,
+        minimum_threshold=None,
+        total_samples: int = 200,
+        positions: Optional[aa.Grid2DIrregular] = None,
+        seed: Optional[int] = None,
+    ) -> float:
+        """
+        Compute a new position threshold from these results corresponding to a quantile of the distribution of the
+        maximum source-plane separations of the image-plane multiple image positions over the posterior (see
+        `positions_separations_via_posterior_from`).
+
+        This is a more robust alternative to `positions_threshold_from`, whose threshold depends on how well only
+        the maximum log likelihood `Tracer` ray-traces the multiple images to one another.
+
+        Parameters
+        ----------
+        quantile
+            The quantile of the distribution of the maximum source-plane separations used as the threshold.
+        factor
+            The value the computed threshold is multiplied by to make the position threshold larger or smaller.
+        minimum_threshold
+            The output threshold is rounded up to this value if it is below it, to avoid extremely small threshold
+            values.
+        total_samples
+            The number of samples drawn from the posterior.
+        positions
+            If input, these positions are used instead of the computed multiple image positions from the lens mass
+            model.
+        seed
+            The seed of the random number generator which draws the samples, where None gives a random seed.
+
+        Returns
+        -------
+        float
+            The quantile of the maximum source plane separations over the posterior multiplied by `factor` and
+            rounded up to the `threshold`.
+        """
+        max_separations = self.positions_separations_via_posterior_from(
+            total_samples=total_samples, positions=positions, seed=seed
+        )
+
+        threshold = factor * float(np.quantile(max_separations, quantile))
+
+        if minimum_threshold is not None:
+            if threshold < minimum_threshold:
+                return minimum_threshold
+
+        return threshold
+
     def positions_likelihood_from(
         self,
         factor=1.0,
@@ -240,6 +439,7 @@ class Result(AgResultDataset):
         use_resample=False,
         positions: Optional[aa.Grid2DIrregular] = None,
         mass_centre_radial_distance_min: float = None,
+        quantile: Optional[float] = None,
     ) -> Union[PositionsLHPenalty, PositionsLHResample]:
         """
         Returns a `PositionsLH` object from the result of a lens model-fit, where the maximum log likelihood mass
@@ -274,6 +474,10 @@ class Result(AgResultDataset):
             The minimum radial distance from the mass model centre that a multiple image position must be to be
             included in the likelihood penalty or resampling. If `None` all positions are used. This is an additional
             method to remove central images that may make it through the point solver's magnification threshold.
+        quantile
+            If input, the threshold is this quantile of the maximum source-plane separations of the positions over
+            the posterior (see `positions_threshold_via_posterior_from`), instead of the maximum separation of the
+            maximum log likelihood model.
 
         Returns
         -------
@@ -300,9 +504,17 @@ class Result(AgResultDataset):
 
             positions = positions[distances > mass_centre_radial_distance_min]
 
-        threshold = self.positions_threshold_from(
-            factor=factor, minimum_threshold=minimum_threshold, positions=positions
-        )
+        if quantile is None:
+            threshold = self.positions_threshold_from(
+                factor=factor, minimum_threshold=minimum_threshold, positions=positions
+            )
+        else:
+            threshold = self.positions_threshold_via_posterior_from(
+                quantile=quantile,
+                factor=factor,
+                minimum_threshold=minimum_threshold,
+                positions=positions,
+            )
 
         if not use_resample:
             return PositionsLHPenalty(positions=positions, threshold=threshold)
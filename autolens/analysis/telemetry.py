@@ -0,0 +1,193 @@
+import glob
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from autolens import profiling
+
+
+class LikelihoodTelemetry:
+    def __init__(self, every: int = 100, window: int = 1000):
+        """
+        Records the run times of the sub-stages of every Nth log likelihood evaluation throughout a model-fit.
+
+        The profiling performed by `profile_log_likelihood_function` only runs once at the start of a model-fit,
+        however the cost of the log likelihood changes throughout a search (e.g. as the number of source pixels of an
+        adaptive pixelization changes with the adapt images and sampled parameters). This class is passed to an
+        `Analysis` class (e.g. `AnalysisImaging`) and every `every` calls of the log likelihood function the fit is
+        performed with a `HierarchicalProfiler` enabled.
+
+        The run time of every stage called directly inside the fit (e.g. `image_2d_list_from`, `inversion`) is
+        stored, alongside the total run time of the fit and the time not attributed to a profiled stage (`other`).
+        Only calls which are sampled have any overhead, which is that of the profiler itself.
+
+        If an `output_path` is set (which the `Analysis` does before the search begins) every sample is appended as a
+        line of JSON to a file in this folder, giving a time-series of the log likelihood cost over the search. Every
+        process writes its own file (`likelihood_telemetry_<pid>.jsonl`), because the log likelihood of a parallel
+        search is evaluated by many processes. The summary (see `summary_dict`) is computed from the samples of the
+        files of every process, and is output to the `files` folder at the end of the search so that it can be
+        loaded via the aggregator (see `LikelihoodTelemetryAgg`).
+
+        The most recent `window` samples of this process are also held in memory, which are summarized if no
+        `output_path` is set.
+
+        Parameters
+        ----------
+        every
+            The log likelihood function is profiled once every this many calls.
+        window
+            The maximum number of the most recent samples which are summarized.
+        """
+        self.every = every
+        self.window = window
+
+        self.total_calls = 0
+
+        self.sample_list = deque(maxlen=window)
+
+        self.output_path = None
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """
+        The path of the .jsonl file the samples of this process are appended to, which is None if no `output_path`
+        is set.
+        """
+        if self.output_path is None:
+            return None
+
+        return os.path.join(
+            self.output_path, f"likelihood_telemetry_{os.getpid()}.jsonl"
+        )
+
+    def is_sampled_call(self) -> bool:
+        """
+        Counts a call of the log likelihood function and returns whether it is profiled.
+        """
+        self.total_calls += 1
+
+        return self.total_calls % self.every == 0
+
+    def add_sample_from(self, profiler: profiling.HierarchicalProfiler):
+        """
+        Adds the run times of the stages of a fit recorded by a `HierarchicalProfiler`, whose outermost section is
+        `fit_from`, to the samples and appends them to the time-series file (if a `file_path` is set).
+
+        Parameters
+        ----------
+        profiler
+            The profiler which recorded one fit of the log likelihood function.
+        """
+        total = profiler.time_dict.get("fit_from", 0.0)
+
+        stage_dict = {
+            key.partition(";")[2]: value
+            for key, value in profiler.time_dict.items()
+            if key.startswith("fit_from;") and key.count(";") == 1
+        }
+
+        stage_dict["other"] = max(total - sum(stage_dict.values()), 0.0)
+        stage_dict["total"] = total
+
+        sample = {
+            "pid": os.getpid(),
+            "call": self.total_calls,
+            "time": time.time(),
+            "stages": stage_dict,
+        }
+
+        self.sample_list.append(sample)
+
+        file_path = self.file_path
+
+        if file_path is not None:
+            os.makedirs(self.output_path, exist_ok=True)
+
+            with open(file_path, "a") as f:
+                f.write(json.dumps(sample) + "\n")
+
+    def sample_list_from_files(self) -> List[Dict]:
+        """
+        Returns the samples of every process which are written to the .jsonl files in the `output_path`, ordered by
+        the time they were recorded.
+        """
+        sample_list = []
+
+        for file_path in glob.glob(
+            os.path.join(self.output_path, "likelihood_telemetry_*.jsonl")
+        ):
+            with open(file_path) as f:
+                sample_list += [json.loads(line) for line in f if line.strip()]
+
+        return sorted(sample_list, key=lambda sample: sample["time"])
+
+    @property
+    def summary_dict(self) -> Dict:
+        """
+        A dictionary summarizing the most recent `window` samples of every process (or of this process if no
+        `output_path` is set), containing for every stage the number of samples it appears in and the mean, median
+        (p50) and 95th percentile (p95) of its run time.
+
+        The total number of calls is the sum over every process of its number of calls up to its last sample.
+        """
+        if self.output_path is None:
+            sample_list = list(self.sample_list)
+            total_calls = self.total_calls
+            total_processes = 1
+        else:
+            sample_list = self.sample_list_from_files()
+
+            call_dict = {}
+
+            for sample in sample_list:
+                call_dict[sample["pid"]] = max(
+                    call_dict.get(sample["pid"], 0), sample["call"]
+                )
+
+            sample_list = sample_list[-self.window :]
+            total_calls = sum(call_dict.values())
+            total_processes = len(call_dict)
+
+        stage_time_dict = {}
+
+        for sample in sample_list:
+            for name, value in sample["stages"].items():
+                stage_time_dict.setdefault(name, []).append(value)
+
+        return {
+            "total_calls": total_calls,
+            "total_samples": len(sample_list),
+            "total_processes": total_processes,
+            "every": self.every,
+            "stages": {
+                name: {
+                    "samples": len(value_list),
+                    "mean": float(np.mean(value_list)),
+                    "p50": float(np.percentile(value_list, 50)),
+                    "p95": float(np.percentile(value_list, 95)),
+                }
+                for name, value_list in stage_time_dict.items()
+            },
+        }
+
+    def profiled_figure_of_merit_from(self, fit_func: Callable) -> float:
+        """
+        Returns the figure of merit of a fit, performing it with a `HierarchicalProfiler` enabled and adding its
+        stage run times to the samples.
+
+        Parameters
+        ----------
+        fit_func
+            A function with no arguments which returns the fit.
+        """
+        with profiling.HierarchicalProfiler() as profiler:
+            with profiling.section(name="fit_from"):
+                figure_of_merit = fit_func().figure_of_merit
+
+        self.add_sample_from(profiler=profiler)
+
+        return figure_of_merit
@@ -0,0 +1,165 @@
+import logging
+import multiprocessing
+import queue
+from typing import Optional
+
+import autofit as af
+
+logger = logging.getLogger(__name__)
+
+
+def _visualize_loop(analysis, request_queue):
+    """
+    The loop run by the background process of a `VisualizationWorker`, which visualizes the requests it receives
+    until it receives a `None`.
+
+    Every time the loop takes a request from the queue it also takes all other pending requests, and only visualizes
+    the newest of them, as the older requests are of models which are no longer the maximum likelihood model.
+
+    Parameters
+    ----------
+    analysis
+        The analysis whose `Visualizer` performs the visualization.
+    request_queue
+        The queue the requests, tuples of the paths, instance and `during_analysis` bool, are received on.
+    """
+    stop = False
+
+    while not stop:
+        request_list = [request_queue.get()]
+
+        while True:
+            try:
+                request_list.append(request_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        stop = None in request_list
+
+        request_list = [request for request in request_list if request is not None]
+
+        if len(request_list) == 0:
+            continue
+
+        if len(request_list) > 1:
+            logger.debug(
+                f"Visualization worker skipped {len(request_list) - 1} superseded requests."
+            )
+
+        paths, instance, during_analysis = request_list[-1]
+
+        try:
+            analysis.Visualizer.visualize(
+                analysis=analysis,
+                paths=paths,
+                instance=instance,
+                during_analysis=during_analysis,
+            )
+        except Exception:
+            logger.exception("Visualization worker failed to visualize a model.")
+
+
+class VisualizationWorker:
+    def __init__(self, start_method: Optional[str] = None):
+        """
+        Performs the visualization of a non-linear search in a background process, so that the search does not
+        stall whilst the maximum likelihood model is visualized.
+
+        The worker is passed to an `Analysis` class (e.g. `AnalysisImaging`). When the search visualizes a model
+        midway through the model-fit, the `Analysis` sends the model instance to the worker and returns immediately.
+        The background process is started the first time a model is sent, and receives a copy of the analysis (and
+        therefore the dataset) once, with only the instance and paths sent for every request.
+
+        Requests are coalesced: if the worker is still visualizing a model when further requests are sent, the
+        pending requests are replaced by the newest when it finishes, so it never falls behind the search.
+
+        The final visualization at the end of the search is performed in the main process, after the worker has
+        finished its pending request and stopped, so that the final images are never overwritten by an older model.
+
+        Within a single visualization all plots are made from the same fit and tracer, such that quantities
+        memoized on them (e.g. the critical curves and caustics of `Tracer.lensing_geometry_from`) are shared by
+        every output format.
+
+        Parameters
+        ----------
+        start_method
+            The `multiprocessing` start method of the background process (e.g. "fork", "spawn"), where None uses the
+            default of the platform.
+        """
+        self.start_method = start_method
+
+        self.total_requests = 0
+
+        self._process = None
+        self._queue = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        state["_process"] = None
+        state["_queue"] = None
+
+        return state
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self, analysis):
+        """
+        Start the background process of the worker, which visualizes models using a copy of the input analysis.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose `Visualizer` performs the visualization.
+        """
+        context = multiprocessing.get_context(self.start_method)
+
+        self._queue = context.Queue()
+        self._process = context.Process(
+            target=_visualize_loop, args=(analysis, self._queue), daemon=True
+        )
+        self._process.start()
+
+    def submit(
+        self,
+        analysis,
+        paths: af.DirectoryPaths,
+        instance: af.ModelInstance,
+        during_analysis: bool = True,
+    ):
+        """
+        Send a model to the worker to be visualized, starting its background process if it is not running.
+
+        Parameters
+        ----------
+        analysis
+            The analysis whose `Visualizer` performs the visualization.
+        paths
+            The paths object which manages all paths, e.g. where the non-linear search outputs are stored,
+            visualization, and the pickled objects used by the aggregator output by this function.
+        instance
+            An instance of the model that is being fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        during_analysis
+            If True the visualization is being performed midway through the non-linear search before it is finished,
+            which may change which images are output.
+        """
+        if not self.is_running:
+            self.start(analysis=analysis)
+
+        self._queue.put((paths, instance, during_analysis))
+
+        self.total_requests += 1
+
+    def stop(self):
+        """
+        Stop the background process of the worker, waiting for it to visualize its newest pending request.
+        """
+        if self.is_running:
+            self._queue.put(None)
+            self._process.join()
+
+        self._process = None
+        self._queue = None
@@ -14,6 +14,7 @@ from autolens.analysis.preloads import Preloads
 from autolens.imaging.model.result import ResultImaging
 from autolens.imaging.model.visualizer import VisualizerImaging
 from autolens.imaging.fit_imaging import FitImaging
+from autolens.imaging.model.parametric_likelihood import ParametricImagingLikelihood
 
 from autolens import exc
 
@@ -110,7 +111,7 @@ class AnalysisImaging(AnalysisDataset):
             return log_likelihood_positions_overwrite
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.log_likelihood_via_cascade_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -175,6 +176,25 @@ class AnalysisImaging(AnalysisDataset):
             run_time_dict=run_time_dict,
         )
 
+    def parametric_likelihood_from(
+        self, model: af.Collection
+    ) -> ParametricImagingLikelihood:
+        """
+        Returns the log likelihood function of this analysis for a lens model composed only of parametric light
+        profiles, as a function of a flat vector of the model's physical parameters (see
+        `ParametricImagingLikelihood`).
+
+        All steps of the fit which do not depend on the parameters (e.g. setting up the over sampled grid and PSF
+        convolution) are performed once, and the array calculations of the log likelihood are compiled via `jit`
+        when JAX is enabled.
+
+        Parameters
+        ----------
+        model
+            The model whose physical parameter vectors are input into the log likelihood function.
+        """
+        return ParametricImagingLikelihood(analysis=self, model=model)
+
     def save_attributes(self, paths: af.DirectoryPaths):
         """
         Before the non-linear search begins, this routine saves attributes of the `Analysis` object to the `files`
@@ -241,6 +261,9 @@ class AnalysisImaging(AnalysisDataset):
         The results of this profiling are then output to hard-disk in the `preloads` folder of the model-fit results,
         which they can be inspected to ensure run-times are as expected.
 
+        A flame graph of one fit, which breaks the run time down by the stack of functions every calculation is called
+        inside (e.g. the deflection angles of every galaxy in every plane), is also output (see `output_flame_graph`).
+
         Parameters
         ----------
         instance
@@ -261,6 +284,8 @@ class AnalysisImaging(AnalysisDataset):
 
         info_dict["psf_shape_2d"] = self.dataset.psf.shape_native
 
+        self.output_flame_graph(instance=instance, paths=paths)
+
         self.output_profiling_info(paths=paths, run_time_dict=run_time_dict, info_dict=info_dict)
 
-        return run_time_dict, info_dict
\ No newline at end of file
+        return run_time_dict, info_dict
\ No newline at end of file
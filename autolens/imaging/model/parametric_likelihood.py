@@ -0,0 +1,296 @@
+import numpy as np
+from typing import Tuple
+
+import autofit as af
+import autoarray as aa
+
+from autofit.jax_wrapper import jit, numpy as jnp
+
+from autogalaxy.profiles.light.linear import LightProfileLinear
+from autogalaxy.profiles.light.operated import LightProfileOperated
+
+from autolens import exc
+
+
+def gather_operator_from(
+    output_indexes: np.ndarray,
+    input_indexes: np.ndarray,
+    weights: np.ndarray,
+    total_outputs: int,
+    fill_index: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the index and weight arrays of a sparse linear operator in gather form, where the i-th output value is the
+    sum of the input values at `index[i]` multiplied by `weight[i]`.
+
+    The operator is input as its non-zero entries, where every entry adds an input value multiplied by a weight to
+    an output value. The entries of every output value are padded to the same length with the `fill_index`, which
+    points to a zero appended to the end of the input values, and a weight of zero. The operator is therefore applied
+    using only indexing, a multiplication and a sum, which are performed identically by NumPy and JAX.
+
+    Parameters
+    ----------
+    output_indexes
+        The index of the output value of every entry.
+    input_indexes
+        The index of the input value of every entry.
+    weights
+        The weight of every entry.
+    total_outputs
+        The total number of output values.
+    fill_index
+        The index the entries of every output value are padded with.
+    """
+    order = np.argsort(output_indexes, kind="stable")
+
+    output_indexes = output_indexes[order]
+
+    counts = np.bincount(output_indexes, minlength=total_outputs)
+    entry_indexes = (
+        np.arange(len(output_indexes)) - (np.cumsum(counts) - counts)[output_indexes]
+    )
+
+    index = np.full((total_outputs, np.max(counts)), fill_index, dtype="int")
+    weight = np.zeros((total_outputs, np.max(counts)))
+
+    index[output_indexes, entry_indexes] = input_indexes[order]
+    weight[output_indexes, entry_indexes] = weights[order]
+
+    return index, weight
+
+
+def gather_from(values, index: np.ndarray, weight: np.ndarray):
+    """
+    Apply a sparse linear operator in gather form (see `gather_operator_from`) to an array of values.
+    """
+    return jnp.sum(jnp.append(values, 0.0)[index] * weight, axis=1)
+
+
+class ParametricImagingLikelihood:
+    def __init__(self, analysis, model: af.Collection):
+        """
+        Builds the log likelihood function of an `AnalysisImaging` for a lens model composed only of parametric
+        light profiles, as a function of a flat vector of the model's physical parameters.
+
+        The log likelihood of `AnalysisImaging` creates a `FitImaging` object, whose light profile images pass through
+        decorators that set up their over sampling and wrap every array in an autoarray structure, before being
+        convolved with the PSF and fitted. For parametric models all of the steps which do not depend on the
+        parameters are instead performed once, when this object is created:
+
+        - The over sampled image-plane grid and the blurring grid are stored as plain (y,x) coordinate arrays.
+
+        - The binning of the over sampled image and the PSF convolution are stored as sparse linear operators in gather
+          form (see `gather_operator_from`).
+
+        - The data, noise-map and noise normalization are stored as arrays.
+
+        For every parameter vector the tracer is created and its image is evaluated on these arrays. The remaining
+        calculation (binning, PSF convolution, chi-squared) is a pure function of arrays written with the NumPy
+        interface of `autofit.jax_wrapper`, which is compiled via `jit` when JAX is enabled (`USE_JAX=1`). The log
+        likelihood is identical to that of `AnalysisImaging.log_likelihood_function` up to numerical precision.
+
+        Only models with parametric light profiles, fixed uniform over sampling and no `dataset_model` are supported,
+        and an `AnalysisException` is raised otherwise.
+
+        Parameters
+        ----------
+        analysis
+            The `AnalysisImaging` whose dataset is fitted and which creates the tracer of every model instance.
+        model
+            The model whose physical parameter vectors are input into the log likelihood function.
+        """
+        self.analysis = analysis
+        self.model = model
+
+        dataset = analysis.dataset
+
+        over_sampling = dataset.grids.uniform.over_sampling
+
+        if not isinstance(over_sampling, aa.OverSamplingUniform):
+            raise exc.AnalysisException(
+                "A ParametricImagingLikelihood requires the dataset to use an OverSamplingUniform over sampling, "
+                "such that the over sampled grid does not depend on the model parameters."
+            )
+
+        instance = model.instance_from_prior_medians()
+
+        if hasattr(instance, "dataset_model"):
+            raise exc.AnalysisException(
+                "A ParametricImagingLikelihood does not support models with a dataset_model."
+            )
+
+        tracer = analysis.tracer_via_instance_from(instance=instance)
+
+        if tracer.has(cls=LightProfileLinear) or tracer.has(cls=aa.Pixelization):
+            raise exc.AnalysisException(
+                "A ParametricImagingLikelihood only supports models with parametric light profiles, not linear "
+                "light profiles or pixelizations."
+            )
+
+        over_sampler = dataset.grids.uniform.over_sampler
+
+        self.grid = aa.Grid2DIrregular(values=over_sampler.over_sampled_grid)
+        self.blurring_grid = aa.Grid2DIrregular(values=dataset.grids.blurring)
+
+        sub_lengths = np.asarray(over_sampler.sub_length).astype("int")
+
+        self.binning_index, self.binning_weight = gather_operator_from(
+            output_indexes=np.repeat(np.arange(len(sub_lengths)), sub_lengths),
+            input_indexes=np.arange(np.sum(sub_lengths)),
+            weights=np.repeat(1.0 / sub_lengths, sub_lengths),
+            total_outputs=len(sub_lengths),
+            fill_index=np.sum(sub_lengths),
+        )
+
+        self.convolution_index, self.convolution_weight = (
+            self.convolution_operator_from(convolver=dataset.convolver)
+        )
+
+        self.data = np.asarray(dataset.data.slim)
+        self.noise_map = np.asarray(dataset.noise_map.slim)
+        self.noise_normalization = float(
+            np.sum(np.log(2 * np.pi * self.noise_map**2.0))
+        )
+
+        self._log_likelihood_via_images_from = jit(self.log_likelihood_via_images_from)
+
+    @staticmethod
+    def convolution_operator_from(
+        convolver: aa.Convolver,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the PSF convolution of an image and its blurring image performed by a `Convolver`, as a sparse linear
+        operator in gather form acting on the image concatenated with the blurring image.
+
+        Parameters
+        ----------
+        convolver
+            The convolver of the dataset, whose frames define which pixels every pixel is blurred into.
+        """
+        total_pixels = len(convolver.image_frame_1d_lengths)
+        total_blurring_pixels = len(convolver.blurring_frame_1d_lengths)
+
+        output_indexes_list = []
+        input_indexes_list = []
+        weights_list = []
+
+        for frame_1d_indexes, frame_1d_kernels, frame_1d_lengths, offset in [
+            (
+                convolver.image_frame_1d_indexes,
+                convolver.image_frame_1d_kernels,
+                convolver.image_frame_1d_lengths,
+                0,
+            ),
+            (
+                convolver.blurring_frame_1d_indexes,
+                convolver.blurring_frame_1d_kernels,
+                convolver.blurring_frame_1d_lengths,
+                total_pixels,
+            ),
+        ]:
+            frame_1d_lengths = np.asarray(frame_1d_lengths).astype("int")
+
+            in_frame = (
+                np.arange(np.asarray(frame_1d_indexes).shape[1])
+                < frame_1d_lengths[:, None]
+            )
+
+            output_indexes_list.append(np.asarray(frame_1d_indexes)[in_frame])
+            input_indexes_list.append(
+                offset + np.repeat(np.arange(len(frame_1d_lengths)), frame_1d_lengths)
+            )
+            weights_list.append(np.asarray(frame_1d_kernels)[in_frame])
+
+        return gather_operator_from(
+            output_indexes=np.concatenate(output_indexes_list).astype("int"),
+            input_indexes=np.concatenate(input_indexes_list),
+            weights=np.concatenate(weights_list),
+            total_outputs=total_pixels,
+            fill_index=total_pixels + total_blurring_pixels,
+        )
+
+    def images_from(self, parameters: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Returns the images of the tracer of a parameter vector which are input into the log likelihood: the over
+        sampled image and blurring image of all light profiles which are convolved with the PSF, and the over sampled
+        image of all light profiles which are not (see `LightProfileOperated`).
+
+        Parameters
+        ----------
+        parameters
+            The physical parameters of the model.
+        """
+        instance = self.model.instance_from_vector(vector=list(parameters))
+
+        tracer = self.analysis.tracer_via_instance_from(instance=instance)
+
+        image = np.asarray(tracer.image_2d_from(grid=self.grid, operated_only=False))
+        blurring_image = np.asarray(
+            tracer.image_2d_from(grid=self.blurring_grid, operated_only=False)
+        )
+
+        if tracer.has(cls=LightProfileOperated):
+            operated_image = np.asarray(
+                tracer.image_2d_from(grid=self.grid, operated_only=True)
+            )
+        else:
+            operated_image = np.zeros(image.shape)
+
+        return image, blurring_image, operated_image
+
+    def log_likelihood_via_images_from(self, image, blurring_image, operated_image):
+        """
+        Returns the log likelihood of the over sampled images of a tracer (see `images_from`), by binning them,
+        convolving the image and blurring image with the PSF and computing the chi-squared of the fit.
+
+        This is a pure function of arrays, which is compiled via `jit` when JAX is enabled.
+        """
+        image = gather_from(
+            values=image, index=self.binning_index, weight=self.binning_weight
+        )
+        operated_image = gather_from(
+            values=operated_image, index=self.binning_index, weight=self.binning_weight
+        )
+
+        blurred_image = gather_from(
+            values=jnp.concatenate((image, blurring_image)),
+            index=self.convolution_index,
+            weight=self.convolution_weight,
+        )
+
+        chi_squared = jnp.sum(
+            ((self.data - blurred_image - operated_image) / self.noise_map) ** 2.0
+        )
+
+        return -0.5 * (chi_squared + self.noise_normalization)
+
+    def log_likelihood_from(self, parameters: np.ndarray) -> float:
+        """
+        Returns the log likelihood of a vector of the physical parameters of the model.
+
+        If the analysis has a positions likelihood which overwrites the log likelihood of this model (e.g. because
+        the multiple images do not trace within the threshold), that value is returned instead.
+
+        Parameters
+        ----------
+        parameters
+            The physical parameters of the model.
+        """
+        if self.analysis.positions_likelihood is not None:
+            instance = self.model.instance_from_vector(vector=list(parameters))
+
+            log_likelihood_positions_overwrite = (
+                self.analysis.log_likelihood_positions_overwrite_from(instance=instance)
+            )
+
+            if log_likelihood_positions_overwrite is not None:
+                return log_likelihood_positions_overwrite
+
+        return float(
+            self._log_likelihood_via_images_from(
+                *self.images_from(parameters=parameters)
+            )
+        )
+
+    def __call__(self, parameters: np.ndarray) -> float:
+        return self.log_likelihood_from(parameters=parameters)
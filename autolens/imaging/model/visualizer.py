@@ -3,7 +3,6 @@ from autoarray import exc
 import autofit as af
 import autogalaxy as ag
 
-from autolens.imaging.model.plotter_interface import PlotterInterfaceImaging
 from autolens import exc
 
 
@@ -29,6 +28,8 @@ class VisualizerImaging(af.Visualizer):
             the imaging data.
         """
 
+        from autolens.imaging.model.plotter_interface import PlotterInterfaceImaging
+
         plotter_interface = PlotterInterfaceImaging(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -94,6 +95,8 @@ class VisualizerImaging(af.Visualizer):
             except exc.InversionException:
                 return
 
+        from autolens.imaging.model.plotter_interface import PlotterInterfaceImaging
+
         plotter_interface = PlotterInterfaceImaging(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -152,6 +155,8 @@ class VisualizerImaging(af.Visualizer):
         if analyses is None:
             return
 
+        from autolens.imaging.model.plotter_interface import PlotterInterfaceImaging
+
         plotter = PlotterInterfaceImaging(
             image_path=paths.image_path, title_prefix=analyses[0].title_prefix
         )
@@ -190,6 +195,8 @@ class VisualizerImaging(af.Visualizer):
         if analyses is None:
             return
 
+        from autolens.imaging.model.plotter_interface import PlotterInterfaceImaging
+
         plotter = PlotterInterfaceImaging(
             image_path=paths.image_path, title_prefix=analyses[0].title_prefix
         )
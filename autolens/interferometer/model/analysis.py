@@ -12,6 +12,12 @@ from autoarray.exc import PixelizationException
 
 from autolens.analysis.analysis.dataset import AnalysisDataset
 from autolens.analysis.preloads import Preloads
+from autolens.analysis.likelihood_cascade import LikelihoodCascade
+from autolens.analysis.telemetry import LikelihoodTelemetry
+from autolens.analysis.visualization_worker import VisualizationWorker
+from autolens.analysis.macro_deflections import MacroDeflectionCache
+from autolens.lens.sparse_deflections import SparseDeflections
+from autolens.lens.tree_deflections import TreeDeflections
 from autolens.analysis.positions import PositionsLHResample
 from autolens.analysis.positions import PositionsLHPenalty
 from autolens.interferometer.model.result import ResultInterferometer
@@ -40,6 +46,12 @@ class AnalysisInterferometer(AnalysisDataset):
         settings_inversion: aa.SettingsInversion = None,
         raise_inversion_positions_likelihood_exception: bool = True,
         title_prefix: str = None,
+        macro_deflection_cache: Optional[MacroDeflectionCache] = None,
+        sparse_deflections: Optional[SparseDeflections] = None,
+        tree_deflections: Optional[TreeDeflections] = None,
+        likelihood_cascade: Optional[LikelihoodCascade] = None,
+        likelihood_telemetry: Optional[LikelihoodTelemetry] = None,
+        visualization_worker: Optional[VisualizationWorker] = None,
     ):
         """
         Analysis classes are used by PyAutoFit to fit a model to a dataset via a non-linear search.
@@ -80,6 +92,25 @@ class AnalysisInterferometer(AnalysisDataset):
         title_prefix
             A string that is added before the title of all figures output by visualization, for example to
             put the name of the dataset and galaxy in the title.
+        macro_deflection_cache
+            Optionally computes the deflection angles of the macro lens model via a first-order expansion around a
+            reference model (e.g. the fit without a subhalo), which speeds up the fits of a subhalo grid search.
+        sparse_deflections
+            Optionally approximates the deflection angles of every galaxy far from its centre via the monopole of its
+            mass distribution, within an input tolerance, which speeds up models with many halos (see
+            `SparseDeflections`).
+        tree_deflections
+            Optionally computes the deflection angles of planes with many halos (e.g. line-of-sight halos) via a tree
+            code when ray-tracing (see `TreeDeflections`), where None sums the deflection angles of every halo.
+        likelihood_cascade
+            Optionally computes progressively more expensive estimates of the log likelihood before the full fit,
+            which reject poor models early (see `LikelihoodCascade`).
+        likelihood_telemetry
+            Optionally records the run times of the stages of every Nth log likelihood evaluation throughout the
+            model-fit (see `LikelihoodTelemetry`).
+        visualization_worker
+            Optionally performs the visualization midway through the model-fit in a background process, so that
+            the non-linear search does not stall whilst it is performed (see `VisualizationWorker`).
         """
         super().__init__(
             dataset=dataset,
@@ -89,6 +120,12 @@ class AnalysisInterferometer(AnalysisDataset):
             settings_inversion=settings_inversion,
             raise_inversion_positions_likelihood_exception=raise_inversion_positions_likelihood_exception,
             title_prefix=title_prefix,
+            macro_deflection_cache=macro_deflection_cache,
+            sparse_deflections=sparse_deflections,
+            tree_deflections=tree_deflections,
+            likelihood_cascade=likelihood_cascade,
+            likelihood_telemetry=likelihood_telemetry,
+            visualization_worker=visualization_worker,
         )
 
     @property
@@ -173,7 +210,7 @@ class AnalysisInterferometer(AnalysisDataset):
             raise e
 
         try:
-            return self.fit_from(instance=instance).figure_of_merit
+            return self.log_likelihood_via_cascade_from(instance=instance)
         except (
             PixelizationException,
             exc.PixelizationException,
@@ -300,6 +337,9 @@ class AnalysisInterferometer(AnalysisDataset):
         The results of this profiling are then output to hard-disk in the `preloads` folder of the model-fit results,
         which they can be inspected to ensure run-times are as expected.
 
+        A flame graph of one fit, which breaks the run time down by the stack of functions every calculation is called
+        inside (e.g. the deflection angles of every galaxy in every plane), is also output (see `output_flame_graph`).
+
         Parameters
         ----------
         instance
@@ -321,6 +361,8 @@ class AnalysisInterferometer(AnalysisDataset):
         info_dict["number_of_visibilities"] = self.dataset.data.shape[0]
         info_dict["transformer_cls"] = self.dataset.transformer.__class__.__name__
 
+        self.output_flame_graph(instance=instance, paths=paths)
+
         self.output_profiling_info(
             paths=paths, run_time_dict=run_time_dict, info_dict=info_dict
         )
@@ -1,8 +1,5 @@
 import autofit as af
 
-from autolens.interferometer.model.plotter_interface import (
-    PlotterInterfaceInterferometer,
-)
 from autogalaxy import exc
 
 
@@ -28,6 +25,10 @@ class VisualizerInterferometer(af.Visualizer):
             the imaging data.
         """
 
+        from autolens.interferometer.model.plotter_interface import (
+            PlotterInterfaceInterferometer,
+        )
+
         plotter_interface = PlotterInterfaceInterferometer(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -95,6 +96,10 @@ class VisualizerInterferometer(af.Visualizer):
             except exc.InversionException:
                 return
 
+        from autolens.interferometer.model.plotter_interface import (
+            PlotterInterfaceInterferometer,
+        )
+
         plotter_interface = PlotterInterfaceInterferometer(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -0,0 +1,3 @@
+# The plotters of this package subclass those of `autolens.plot`, whose `__init__` imports every plotter, so it is
+# imported first such that the plotter modules can be imported directly without circular import errors.
+import autolens.plot  # noqa
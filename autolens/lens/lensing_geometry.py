@@ -0,0 +1,197 @@
+import numpy as np
+from typing import List, Tuple, Union
+
+from autoconf import cached_property
+import autoarray as aa
+
+from autogalaxy.operate.deflections import evaluation_grid
+
+
+@evaluation_grid
+def _evaluation_grid_via_decorator_from(lensing_obj, grid, pixel_scale):
+    return grid
+
+
+def evaluation_grid_from(
+    grid: aa.type.Grid2DLike, pixel_scale: Union[Tuple[float, float], float] = 0.05
+) -> aa.Grid2D:
+    """
+    Returns the uniform 2D grid on which critical curves and caustics are computed for an input grid, which is
+    the grid created by the `evaluation_grid` decorator of the `OperateDeflections` critical curve and caustic
+    functions (e.g. `tangential_critical_curve_list_from`).
+
+    Parameters
+    ----------
+    grid
+        The 2D grid of (y,x) arc-second coordinates whose zoomed extent the evaluation grid covers.
+    pixel_scale
+        The resolution of the evaluation grid.
+    """
+    return _evaluation_grid_via_decorator_from(None, grid, pixel_scale)
+
+
+def is_inside_curve_from(
+    curve: aa.Grid2DIrregular, coordinate: Tuple[float, float]
+) -> bool:
+    """
+    Returns whether an input (y,x) coordinate is inside a closed curve (e.g. a caustic), using the even-odd rule:
+    a horizontal ray from the coordinate crosses the curve an odd number of times if the coordinate is inside it.
+
+    Parameters
+    ----------
+    curve
+        The (y,x) coordinates of the closed curve, in order along the curve.
+    coordinate
+        The (y,x) coordinate which is tested for being inside the curve.
+    """
+    curve = np.asarray(curve)
+
+    if len(curve) < 3:
+        return False
+
+    y, x = coordinate
+
+    y_0, x_0 = curve[:, 0], curve[:, 1]
+    y_1, x_1 = np.roll(y_0, -1), np.roll(x_0, -1)
+
+    crosses = (y_0 > y) != (y_1 > y)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x_0 + (y - y_0) * (x_1 - x_0) / (y_1 - y_0)
+
+    return bool(np.sum(crosses & (x < x_cross)) % 2 == 1)
+
+
+class LensingGeometry:
+    def __init__(self, tracer, grid: aa.Grid2D):
+        """
+        The critical curves, caustics and the areas within the critical curves of a tracer, which are all derived
+        from a single lensing jacobian computed on a uniform evaluation grid.
+
+        The functions `tangential_critical_curve_list_from`, `radial_critical_curve_list_from`,
+        `tangential_caustic_list_from`, `radial_caustic_list_from` and `radial_critical_curve_area_list_from` of a
+        `Tracer` each compute the deflection angles, the jacobian and a marching squares contouring pass from scratch.
+        Visualization (e.g. `GetVisuals2D.via_tracer_from`) calls many of these functions for the same tracer and
+        grid, so this class computes every quantity once, lazily, and reuses them.
+
+        The deflection angles of the critical curves used to compute the caustics are also computed in a single
+        call for all curves, rather than one call per curve.
+
+        Instances are created and memoized on a tracer via `Tracer.lensing_geometry_from`, so every plotter using
+        the same tracer shares them.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose critical curves and caustics are computed.
+        grid
+            The uniform evaluation grid on which the jacobian is computed (see `evaluation_grid_from`).
+        """
+        self.tracer = tracer
+        self.grid = grid
+
+    @cached_property
+    def jacobian(self) -> List:
+        """
+        The lensing jacobian of the tracer on the evaluation grid.
+        """
+        return self.tracer.jacobian_from(grid=self.grid)
+
+    @cached_property
+    def tangential_eigen_values(self) -> aa.Array2D:
+        return self.tracer.tangential_eigen_value_from(
+            grid=self.grid, jacobian=self.jacobian
+        )
+
+    @cached_property
+    def radial_eigen_values(self) -> aa.Array2D:
+        return self.tracer.radial_eigen_value_from(
+            grid=self.grid, jacobian=self.jacobian
+        )
+
+    @cached_property
+    def tangential_critical_curve_list(self) -> List[aa.Grid2DIrregular]:
+        return self.tracer.contour_list_from(
+            grid=self.grid, contour_array=self.tangential_eigen_values
+        )
+
+    @cached_property
+    def radial_critical_curve_list(self) -> List[aa.Grid2DIrregular]:
+        return self.tracer.contour_list_from(
+            grid=self.grid, contour_array=self.radial_eigen_values
+        )
+
+    @cached_property
+    def tangential_caustic_list(self) -> List[aa.Grid2DIrregular]:
+        return self.caustic_list_from(
+            critical_curve_list=self.tangential_critical_curve_list
+        )
+
+    @cached_property
+    def radial_caustic_list(self) -> List[aa.Grid2DIrregular]:
+        return self.caustic_list_from(
+            critical_curve_list=self.radial_critical_curve_list
+        )
+
+    @cached_property
+    def tangential_critical_curve_area_list(self) -> List[float]:
+        return self.tracer.area_within_curve_list_from(
+            curve_list=self.tangential_critical_curve_list
+        )
+
+    @cached_property
+    def radial_critical_curve_area_list(self) -> List[float]:
+        return self.tracer.area_within_curve_list_from(
+            curve_list=self.radial_critical_curve_list
+        )
+
+    def total_tangential_caustics_enclosing_from(
+        self, coordinate: Tuple[float, float]
+    ) -> int:
+        """
+        Returns the number of tangential caustics which enclose an input (y,x) source-plane coordinate.
+
+        A source inside a tangential caustic forms at least four bright multiple images (e.g. a quad lens), whereas
+        a source outside every tangential caustic forms two or fewer.
+
+        Parameters
+        ----------
+        coordinate
+            The (y,x) source-plane coordinate which is tested for being inside each tangential caustic.
+        """
+        return sum(
+            is_inside_curve_from(curve=caustic, coordinate=coordinate)
+            for caustic in self.tangential_caustic_list
+        )
+
+    def caustic_list_from(
+        self, critical_curve_list: List[aa.Grid2DIrregular]
+    ) -> List[aa.Grid2DIrregular]:
+        """
+        Returns the caustics of a list of critical curves, by ray-tracing every critical curve to the source-plane
+        using the deflection angles of the tracer, which are computed for all critical curves in one call.
+
+        Parameters
+        ----------
+        critical_curve_list
+            The critical curves which are ray-traced to the source-plane to give the caustics.
+        """
+        if len(critical_curve_list) == 0:
+            return []
+
+        curves = np.concatenate(
+            [np.asarray(critical_curve) for critical_curve in critical_curve_list]
+        )
+
+        deflections = np.asarray(
+            self.tracer.deflections_yx_2d_from(grid=aa.Grid2DIrregular(values=curves))
+        )
+
+        split_indices = np.cumsum(
+            [len(critical_curve) for critical_curve in critical_curve_list]
+        )[:-1]
+
+        return [
+            aa.Grid2DIrregular(values=caustic)
+            for caustic in np.split(curves - deflections, split_indices)
+        ]
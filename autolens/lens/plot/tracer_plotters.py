@@ -8,6 +8,7 @@ from autogalaxy.plot.mass_plotter import MassPlotter
 
 from autolens.plot.abstract_plotters import Plotter
 from autolens.lens.tracer import Tracer
+from autolens.lens.plot.tracer_quantities import TracerQuantityProvider
 
 from autolens import exc
 
@@ -23,6 +24,7 @@ class TracerPlotter(Plotter):
         mat_plot_2d: aplt.MatPlot2D = aplt.MatPlot2D(),
         visuals_2d: aplt.Visuals2D = aplt.Visuals2D(),
         include_2d: aplt.Include2D = aplt.Include2D(),
+        tracer_quantities: Optional[TracerQuantityProvider] = None,
     ):
         """
         Plots the attributes of `Tracer` objects using the matplotlib methods `plot()` and `imshow()` and many
@@ -55,6 +57,9 @@ class TracerPlotter(Plotter):
             Contains 2D visuals that can be overlaid on 2D plots.
         include_2d
             Specifies which attributes of the `MassProfile` are extracted and plotted as visuals for 2D plots.
+        tracer_quantities
+            Computes and memoizes the tracer quantities that are plotted, which can be shared by many plotters of the
+            same tracer so that each quantity is only computed once. If not input, the plotter creates its own.
         """
 
         from autogalaxy.profiles.light.linear import (
@@ -78,8 +83,12 @@ class TracerPlotter(Plotter):
         self.tracer = tracer
         self.grid = grid
 
+        self.tracer_quantities = tracer_quantities or TracerQuantityProvider(
+            tracer=tracer
+        )
+
         self._mass_plotter = MassPlotter(
-            mass_obj=self.tracer,
+            mass_obj=self.tracer_quantities,
             grid=self.grid,
             get_visuals_2d=self.get_visuals_2d,
             mat_plot_2d=self.mat_plot_2d,
@@ -104,7 +113,9 @@ class TracerPlotter(Plotter):
         plane_index
             The index of the plane in the `Tracer` used to make the `GalaxiesPlotter`.
         """
-        plane_grid = self.tracer.traced_grid_2d_list_from(grid=self.grid)[plane_index]
+        plane_grid = self.tracer_quantities.traced_grid_2d_list_from(grid=self.grid)[
+            plane_index
+        ]
 
         return aplt.GalaxiesPlotter(
             galaxies=ag.Galaxies(galaxies=self.tracer.planes[plane_index]),
@@ -153,7 +164,7 @@ class TracerPlotter(Plotter):
 
         if image:
             self.mat_plot_2d.plot_array(
-                array=self.tracer.image_2d_from(grid=self.grid),
+                array=self.tracer_quantities.image_2d_from(grid=self.grid),
                 visuals_2d=self.get_visuals_2d(),
                 auto_labels=aplt.AutoLabels(title="Image", filename="image_2d"),
             )
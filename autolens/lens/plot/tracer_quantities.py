@@ -0,0 +1,110 @@
+import logging
+import time
+from typing import Callable, List
+
+import autoarray as aa
+import autogalaxy as ag
+
+logger = logging.getLogger(__name__)
+
+
+class TracerQuantityProvider(ag.OperateDeflections):
+    def __init__(self, tracer):
+        """
+        Computes the quantities of a tracer plotted by a `TracerPlotter` (its image, traced grids, convergence,
+        potential, deflection angles and magnification), memoizing every quantity for every grid it is computed on.
+
+        Visualization often plots the same tracer quantities more than once, for example as individual .png figures,
+        on subplots and as .fits files. Passing one provider to every `TracerPlotter` of a visualization (as
+        `PlotterInterface.tracer` does) means every quantity is computed once per grid.
+
+        The provider inherits the lensing calculations of `OperateDeflections` (e.g. `jacobian_from`,
+        `magnification_2d_from`), which therefore use the memoized deflection angles.
+
+        Values are memoized under the name of the quantity and the identity of the grid, and the grid is stored
+        alongside its values so that its identity is not reused whilst the provider exists. The time spent computing
+        each quantity is stored in the `time_dict` and can be logged via `log_times`.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose quantities are computed.
+        """
+        self.tracer = tracer
+
+        self.time_dict = {}
+
+        self._value_dict = {}
+
+    def value_from(self, name: str, grid: aa.type.Grid2DLike, func: Callable):
+        """
+        Returns the value of a quantity of the tracer on a grid, computing it via an input function if it has not
+        been computed for this grid before.
+
+        Parameters
+        ----------
+        name
+            The name of the quantity, which labels its memoized values and run time.
+        grid
+            The 2D grid of (y,x) arc-second coordinates the quantity is computed on.
+        func
+            The function of the tracer which computes the quantity, which receives the grid.
+        """
+        key = (name, id(grid))
+
+        if key not in self._value_dict:
+            start = time.time()
+
+            value = func(grid=grid)
+
+            self.time_dict[name] = self.time_dict.get(name, 0.0) + time.time() - start
+
+            self._value_dict[key] = (grid, value)
+
+        return self._value_dict[key][1]
+
+    def image_2d_from(self, grid: aa.type.Grid2DLike) -> aa.Array2D:
+        return self.value_from(name="image", grid=grid, func=self.tracer.image_2d_from)
+
+    def traced_grid_2d_list_from(
+        self, grid: aa.type.Grid2DLike
+    ) -> List[aa.type.Grid2DLike]:
+        return self.value_from(
+            name="traced_grids", grid=grid, func=self.tracer.traced_grid_2d_list_from
+        )
+
+    def deflections_yx_2d_from(self, grid: aa.type.Grid2DLike):
+        return self.value_from(
+            name="deflections", grid=grid, func=self.tracer.deflections_yx_2d_from
+        )
+
+    def convergence_2d_from(self, grid: aa.type.Grid2DLike) -> aa.Array2D:
+        return self.value_from(
+            name="convergence", grid=grid, func=self.tracer.convergence_2d_from
+        )
+
+    def potential_2d_from(self, grid: aa.type.Grid2DLike) -> aa.Array2D:
+        return self.value_from(
+            name="potential", grid=grid, func=self.tracer.potential_2d_from
+        )
+
+    def magnification_2d_from(self, grid: aa.type.Grid2DLike) -> aa.Array2D:
+        return self.value_from(
+            name="magnification",
+            grid=grid,
+            func=super().magnification_2d_from,
+        )
+
+    def log_times(self):
+        """
+        Log the time spent computing every quantity.
+        """
+        if len(self.time_dict) == 0:
+            return
+
+        logger.info(
+            "Tracer quantities computed for visualization: "
+            + ", ".join(
+                f"{name} {value:.3f}s" for name, value in self.time_dict.items()
+            )
+        )
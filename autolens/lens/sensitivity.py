@@ -1,15 +1,20 @@
 import numpy as np
+from autoconf import cached_property
 from typing import Optional, List, Tuple
 
 from autofit.non_linear.grid.sensitivity.result import SensitivityResult
 
 import autofit as af
 import autoarray as aa
+import autogalaxy as ag
 
 
 from autoarray.plot.abstract_plotters import AbstractPlotter
 from autoarray.plot.auto_labels import AutoLabels
 
+from autolens.lens.subhalo import SubhaloResultColumns
+from autolens.lens.subhalo import _values_1d_from
+from autolens.imaging.simulator import SimulatorImaging
 from autolens.lens.tracer import Tracer
 
 import autolens.plot as aplt
@@ -83,25 +88,26 @@ class SubhaloSensitivityResult(SensitivityResult):
         -------
         The 2D array of values, where the values are mapped from the input list of lists.
         """
-        values_reshaped = [value for values in values.native for value in values]
-
-        pixel_scale_list = []
-
-        for i in range(len(values_reshaped) - 1):
-            pixel_scale = abs(self.x[i] - self.x[i + 1])
-            if pixel_scale > 0.0:
-                pixel_scale_list.append(pixel_scale)
-
-        pixel_scales = np.min(pixel_scale_list)
-
         return aa.Array2D.from_yx_and_values(
             y=self.y,
             x=self.x,
-            values=values_reshaped,
-            pixel_scales=(pixel_scales, pixel_scales),
+            values=np.ravel(values.native),
+            pixel_scales=self.pixel_scales,
             shape_native=self.shape,
         )
 
+    @property
+    def pixel_scales(self) -> Tuple[float, float]:
+        """
+        The (y,x) pixel scales of the sensitivity mapping grid, which are the smallest non-zero separation between
+        neighboring x coordinates of the grid.
+        """
+        pixel_scale_array = np.abs(np.diff(np.asarray(self.x, dtype="float")))
+
+        pixel_scales = np.min(pixel_scale_array[pixel_scale_array > 0.0])
+
+        return (pixel_scales, pixel_scales)
+
     def figure_of_merit_array(
         self,
         use_log_evidences: bool = True,
@@ -136,6 +142,312 @@ class SubhaloSensitivityResult(SensitivityResult):
 
         return self._array_2d_from(values=figures_of_merits)
 
+    @property
+    def columns(self) -> SubhaloResultColumns:
+        """
+        Returns the results of the sensitivity mapping as a `SubhaloResultColumns` object, where the grid
+        coordinates and the log evidence and log likelihood increases of the perturbed models are stored as 1D
+        NumPy arrays.
+
+        This can be output to a `.npz` file via its `output_to_npz` method and then loaded and plotted without
+        unpickling this result.
+        """
+        try:
+            log_evidences = _values_1d_from(values=self.log_evidence_differences)
+        except TypeError:
+            log_evidences = None
+
+        return SubhaloResultColumns(
+            y=_values_1d_from(values=self.y),
+            x=_values_1d_from(values=self.x),
+            shape=self.shape,
+            pixel_scales=self.pixel_scales,
+            log_evidences=log_evidences,
+            log_likelihoods=_values_1d_from(values=self.log_likelihood_differences),
+        )
+
+    def output_to_npz(self, file_path: str):
+        """
+        Output the results of the sensitivity mapping to a `.npz` file in the columnar format of
+        `SubhaloResultColumns`.
+
+        Parameters
+        ----------
+        file_path
+            The path the `.npz` file is output to.
+        """
+        self.columns.output_to_npz(file_path=file_path)
+
+
+class PreloadedImaging(aa.Imaging):
+    def __init__(
+        self,
+        data: aa.Array2D,
+        noise_map: aa.Array2D,
+        psf: aa.Kernel2D,
+        over_sampling: aa.OverSamplingDataset,
+        reference: aa.Imaging,
+    ):
+        """
+        A masked `Imaging` dataset which reuses the convolver, grids and w-tilde preload of a reference dataset with
+        the same mask and PSF, instead of computing them from its own mask and PSF.
+
+        Every masked dataset of a sensitivity mapping analysis has the same mask and PSF, so these quantities are
+        computed once for the first dataset and reused by the dataset of every other cell (see
+        `SubhaloSensitivitySimulator.masked_dataset_from`). The w-tilde preload also depends on the noise-map, so it
+        is only reused if the noise-maps are identical (e.g. when Poisson noise is not added) and is otherwise
+        computed for this dataset.
+
+        Parameters
+        ----------
+        data
+            The masked image data.
+        noise_map
+            The masked noise-map.
+        psf
+            The PSF the data was convolved with.
+        over_sampling
+            The over sampling of the dataset's grids.
+        reference
+            A masked dataset with the same mask, PSF and over sampling, whose convolver, grids and w-tilde preload
+            are reused.
+        """
+        super().__init__(
+            data=data,
+            noise_map=noise_map,
+            psf=psf,
+            over_sampling=over_sampling,
+            pad_for_convolver=True,
+        )
+
+        self.reference = reference
+
+    @property
+    def convolver(self) -> aa.Convolver:
+        return self.reference.convolver
+
+    @property
+    def grids(self):
+        return self.reference.grids
+
+    @cached_property
+    def w_tilde(self):
+        if np.array_equal(self.noise_map, self.reference.noise_map):
+            return self.reference.w_tilde
+
+        return super().w_tilde
+
+
+class SubhaloSensitivitySimulator:
+    def __init__(
+        self,
+        tracer_base: Tracer,
+        grid: aa.Grid2D,
+        simulator: SimulatorImaging,
+        mask: Optional[aa.Mask2D] = None,
+    ):
+        """
+        Simulates the datasets of a subhalo sensitivity mapping analysis, where every cell of the sensitivity grid
+        simulates the same strong lens with a dark matter subhalo added at a different location.
+
+        The lens, source, PSF and mask are identical in every cell and only the subhalo changes. This class therefore
+        computes the quantities which do not depend on the subhalo once, when it is created:
+
+        - The deflection angles of the base (no subhalo) `Tracer`, to which only the deflection angles of the subhalo
+          are added for every cell before ray-tracing to the source-plane.
+
+        - The image of the lens-plane galaxies, which is not affected by the subhalo.
+
+        - The masked dataset's convolver and grids, which depend only on the mask and PSF and are reused by the
+          masked dataset of every cell (as is the w-tilde preload if the noise-maps are identical).
+
+        This only speeds up the simulation and masking of every cell, not the non-linear searches which fit it.
+
+        Adding the subhalo deflection angles to the base deflection angles is exact when the tracer has two planes and
+        the subhalo is at the lens-plane redshift. For other configurations (e.g. a subhalo along the line-of-sight)
+        the dataset is simulated via a full `Tracer` instead.
+
+        Instances of this class can be passed as the `simulate_cls` of an `af.Sensitivity` object, where the subhalo
+        galaxy is the `perturb` attribute of the simulation instance. Because the cached quantities are computed on
+        creation, they are pickled with the object and reused when cells are run in parallel processes.
+
+        Parameters
+        ----------
+        tracer_base
+            The tracer of the strong lens without a subhalo, which is perturbed in every cell of the sensitivity grid.
+        grid
+            The 2D grid of (y,x) coordinates the strong lens is simulated on.
+        simulator
+            The simulator which convolves the image with the PSF and adds noise to create every simulated dataset.
+        mask
+            If input, the simulated datasets are returned masked with this mask.
+        """
+        self.tracer_base = tracer_base
+        self.grid = grid
+        self.simulator = simulator
+        self.mask = mask
+
+        self.tracer_base.set_snr_of_snr_light_profiles(
+            grid=grid,
+            exposure_time=simulator.exposure_time,
+            background_sky_level=simulator.background_sky_level,
+        )
+
+        self.padded_grid = grid.padded_grid_from(
+            kernel_shape_native=simulator.psf.shape_native
+        )
+
+        self.over_sampler = None
+        self.grid_input = self.padded_grid
+
+        if isinstance(self.padded_grid.over_sampling, aa.OverSamplingUniform):
+            self.over_sampler = self.padded_grid.over_sampler
+            self.grid_input = self.over_sampler.over_sampled_grid
+            self.grid_input.over_sampling = None
+
+        self.deflections_base = None
+        self.image_2d_lens = None
+
+        if self.tracer_base.total_planes == 2:
+            self.deflections_base = np.array(
+                self.tracer_base.deflections_yx_2d_from(grid=self.grid_input)
+            )
+            self.image_2d_lens = np.array(
+                self.tracer_base.image_2d_list_from(
+                    grid=self.padded_grid, operated_only=False
+                )[0]
+            )
+
+        self._masked_dataset_reference = None
+
+    def use_base_deflections_for(self, subhalo: ag.Galaxy) -> bool:
+        """
+        Returns whether the dataset of a subhalo can be simulated by adding its deflection angles to the cached
+        deflection angles of the base tracer, which requires a two plane tracer and a subhalo at the lens-plane
+        redshift whose light profiles (if it has any) are not signal-to-noise light profiles, whose intensities
+        depend on the image of the full tracer.
+
+        Parameters
+        ----------
+        subhalo
+            The galaxy containing the subhalo's mass profile.
+        """
+        return (
+            self.deflections_base is not None
+            and subhalo.redshift == self.tracer_base.plane_redshifts[0]
+            and not subhalo.has(cls=ag.lp_snr.LightProfileSNR)
+        )
+
+    def dataset_from(self, subhalo: ag.Galaxy) -> aa.Imaging:
+        """
+        Returns the simulated `Imaging` dataset of the strong lens with an input subhalo added to the lens.
+
+        The image is identical to that produced by `SimulatorImaging.via_tracer_from` using a `Tracer` of the base
+        galaxies and subhalo, but only the subhalo's deflection angles and image and the source-plane image are
+        computed.
+
+        Parameters
+        ----------
+        subhalo
+            The galaxy containing the subhalo's mass profile.
+        """
+        if not self.use_base_deflections_for(subhalo=subhalo):
+            tracer = Tracer(
+                galaxies=list(self.tracer_base.galaxies) + [subhalo],
+                cosmology=self.tracer_base.cosmology,
+            )
+
+            return self.simulator.via_tracer_from(tracer=tracer, grid=self.grid)
+
+        deflections = self.deflections_base + np.array(
+            subhalo.deflections_yx_2d_from(grid=self.grid_input)
+        )
+
+        traced_grid = self.grid_input.copy()
+        traced_grid -= deflections
+
+        image_2d_source = sum(
+            np.array(galaxy.image_2d_from(grid=traced_grid, operated_only=False))
+            for galaxy in self.tracer_base.planes[-1]
+        )
+
+        if self.over_sampler is not None:
+            image_2d_source = self.over_sampler.binned_array_2d_from(
+                array=image_2d_source
+            )
+
+        image_2d_lens = self.image_2d_lens
+
+        if subhalo.has(cls=ag.LightProfile):
+            image_2d_lens = image_2d_lens + np.array(
+                subhalo.image_2d_from(grid=self.padded_grid, operated_only=False)
+            )
+
+        image = aa.Array2D(
+            values=image_2d_lens + np.array(image_2d_source),
+            mask=self.padded_grid.mask,
+        )
+
+        dataset = self.simulator.via_image_from(image=image)
+
+        return dataset.trimmed_after_convolution_from(
+            kernel_shape=self.simulator.psf.shape_native
+        )
+
+    def masked_dataset_from(self, dataset: aa.Imaging) -> aa.Imaging:
+        """
+        Returns a simulated dataset masked with the input `mask`, reusing the quantities of the first masked
+        dataset which depend only on the mask and PSF.
+
+        The convolver and grids are identical for every cell and are reused via a `PreloadedImaging`. The w-tilde
+        preload also depends on the noise-map, so is only reused when the noise-maps are identical (e.g. when Poisson
+        noise is not added).
+
+        Parameters
+        ----------
+        dataset
+            A simulated dataset of a cell of the sensitivity grid.
+        """
+        reference = self._masked_dataset_reference
+
+        if reference is None:
+            self._masked_dataset_reference = dataset.apply_mask(mask=self.mask)
+            return self._masked_dataset_reference
+
+        masked_dataset = PreloadedImaging(
+            data=aa.Array2D(values=dataset.data.native, mask=self.mask),
+            noise_map=aa.Array2D(values=dataset.noise_map.native, mask=self.mask),
+            psf=dataset.psf,
+            over_sampling=dataset.over_sampling,
+            reference=reference,
+        )
+
+        masked_dataset.unmasked = dataset
+
+        return masked_dataset
+
+    def __call__(self, instance: af.ModelInstance, simulate_path=None) -> aa.Imaging:
+        """
+        Returns the simulated dataset of a cell of the sensitivity grid, using the interface of the `simulate_cls`
+        of an `af.Sensitivity` object.
+
+        Only the subhalo galaxy, the `perturb` attribute of the instance, is used, with every other galaxy taken
+        from the base tracer.
+
+        Parameters
+        ----------
+        instance
+            The simulation instance of the sensitivity cell, whose `perturb` attribute is the subhalo galaxy.
+        simulate_path
+            The path where the simulated dataset is output, which is not used.
+        """
+        dataset = self.dataset_from(subhalo=instance.perturb)
+
+        if self.mask is None:
+            return dataset
+
+        return self.masked_dataset_from(dataset=dataset)
+
 
 class SubhaloSensitivityPlotter(AbstractPlotter):
     def __init__(
@@ -248,14 +560,15 @@ class SubhaloSensitivityPlotter(AbstractPlotter):
 
         grid = self.mask.derive_grid.unmasked
 
+        tracer_perturb_geometry = self.tracer_perturb.lensing_geometry_from(grid=grid)
+        tracer_no_perturb_geometry = self.tracer_no_perturb.lensing_geometry_from(
+            grid=grid
+        )
+
         visuals_2d = aplt.Visuals2D(
             mask=self.mask,
-            tangential_critical_curves=self.tracer_perturb.tangential_critical_curve_list_from(
-                grid=grid
-            ),
-            radial_critical_curves=self.tracer_perturb.radial_critical_curve_list_from(
-                grid=grid
-            ),
+            tangential_critical_curves=tracer_perturb_geometry.tangential_critical_curve_list,
+            radial_critical_curves=tracer_perturb_geometry.radial_critical_curve_list,
         )
 
         plotter = aplt.Array2DPlotter(
@@ -268,10 +581,8 @@ class SubhaloSensitivityPlotter(AbstractPlotter):
 
         visuals_2d = aplt.Visuals2D(
             mask=self.mask,
-            tangential_caustics=self.tracer_perturb.tangential_caustic_list_from(
-                grid=grid
-            ),
-            radial_caustics=self.tracer_perturb.radial_caustic_list_from(grid=grid),
+            tangential_caustics=tracer_perturb_geometry.tangential_caustic_list,
+            radial_caustics=tracer_perturb_geometry.radial_caustic_list,
         )
 
         plotter = aplt.Array2DPlotter(
@@ -291,12 +602,8 @@ class SubhaloSensitivityPlotter(AbstractPlotter):
 
         visuals_2d = aplt.Visuals2D(
             mask=self.mask,
-            tangential_critical_curves=self.tracer_no_perturb.tangential_critical_curve_list_from(
-                grid=grid
-            ),
-            radial_critical_curves=self.tracer_no_perturb.radial_critical_curve_list_from(
-                grid=grid
-            ),
+            tangential_critical_curves=tracer_no_perturb_geometry.tangential_critical_curve_list,
+            radial_critical_curves=tracer_no_perturb_geometry.radial_critical_curve_list,
         )
 
         plotter = aplt.Array2DPlotter(
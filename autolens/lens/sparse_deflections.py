@@ -0,0 +1,257 @@
+import numpy as np
+from functools import partial
+from typing import Callable, List, Optional, Tuple, Union
+
+import autofit as af
+import autoarray as aa
+import autogalaxy as ag
+
+
+def vector_yx_from(values: np.ndarray, grid: aa.type.Grid2DLike):
+    """
+    Returns deflection angles computed as an ndarray in the same structure the deflection angles of a mass profile
+    are returned in for an input grid (e.g. a `VectorYX2D` for a `Grid2D`).
+    """
+    if isinstance(grid, aa.Grid2D):
+        return aa.VectorYX2D(values=values, grid=grid, mask=grid.mask)
+    if isinstance(grid, aa.Grid2DIrregular):
+        return aa.VectorYX2DIrregular(values=values, grid=grid)
+    return values
+
+
+class SparseDeflections:
+    def __init__(
+        self,
+        tolerance: float = 1.0e-3,
+        total_rings: int = 16,
+        ring_factor: float = np.sqrt(2.0),
+        total_angles: int = 8,
+    ):
+        """
+        Approximates the deflection angles of every galaxy far from its centre, where its contribution to the
+        deflection angles is smooth, via the monopole of its mass distribution.
+
+        In cluster and line-of-sight models the deflection angles of hundreds of small halos are computed on every
+        (y,x) coordinate of the grid, although far from its centre the deflection angles of a halo are set almost
+        entirely by the mass it encloses. For every galaxy and grid the deflection angles are computed exactly on
+        `total_rings` rings of `total_angles` coordinates around the galaxy's mass centre, whose radii are spaced by
+        `ring_factor` out to the furthest coordinate of the grid. The mass enclosed within every ring follows from the
+        mean radial deflection angle on the ring, and bounds the galaxy's contribution at every distance.
+
+        The error of the monopole approximation between two neighbouring rings is estimated as the largest
+        difference between the exact and monopole deflection angles on the rings (the contribution of the higher
+        multipoles of the mass distribution), plus the change in enclosed mass between the rings divided by the
+        inner ring's radius (the error of interpolating the enclosed mass). Coordinates outside the smallest radius
+        beyond which every estimated error is below the `tolerance` use the monopole approximation, and all other
+        coordinates are computed exactly. Galaxies whose mass is not concentrated (e.g. an elliptical lens galaxy or
+        an external shear) therefore keep their exact deflection angles, whereas for point masses and truncated halos
+        most coordinates are approximated.
+
+        The approximation is applied to galaxies by `apply_to`, which is called with the galaxies of every model
+        instance (e.g. by passing this object to an `Analysis` class) or before creating a `Tracer`. The largest
+        estimated error of every galaxy whose deflection angles are approximated, over the evaluations performed since
+        `apply_to` was last called, are summed in the `error_budget`. This bounds the error of the summed deflection
+        angles of these galaxies at any coordinate of any of these evaluations, and does not grow with the number of
+        evaluations.
+
+        Parameters
+        ----------
+        tolerance
+            The maximum estimated error (in arc-seconds) of the approximated deflection angles of every galaxy.
+        total_rings
+            The number of rings around every galaxy on which the exact deflection angles are computed.
+        ring_factor
+            The ratio of the radii of neighbouring rings.
+        total_angles
+            The number of coordinates on every ring.
+        """
+        self.tolerance = tolerance
+        self.total_rings = total_rings
+        self.ring_factor = ring_factor
+        self.total_angles = total_angles
+
+        angles = 2.0 * np.pi * (np.arange(total_angles) + 0.5) / total_angles
+
+        self.unit_vectors = np.stack((np.sin(angles), np.cos(angles)), axis=-1)
+
+        self._error_dict = {}
+        self.max_error_budget = 0.0
+
+        self.total_approximated = 0
+        self.total_exact = 0
+
+    @property
+    def error_budget(self) -> float:
+        """
+        The sum over every galaxy whose deflection angles are approximated of its largest estimated error since
+        `apply_to` was last called.
+        """
+        return sum(self._error_dict.values(), 0.0)
+
+    @staticmethod
+    def centre_from(galaxy: ag.Galaxy) -> Optional[Tuple[float, float]]:
+        """
+        Returns the centre of the mass profiles of a galaxy, or None if it has no mass profiles or they do not
+        share one centre, in which case its deflection angles are not approximated.
+        """
+        centre_list = [
+            getattr(mass_profile, "centre", None)
+            for mass_profile in galaxy.cls_list_from(cls=ag.mp.MassProfile)
+        ]
+
+        if len(centre_list) == 0 or any(centre is None for centre in centre_list):
+            return None
+
+        if len(set(tuple(centre) for centre in centre_list)) > 1:
+            return None
+
+        return tuple(centre_list[0])
+
+    def apply_to(self, galaxies: Union[List[ag.Galaxy], af.ModelInstance]):
+        """
+        Attaches the approximated deflection angles to every galaxy with mass profiles, such that a `Tracer` created
+        from these galaxies uses them when ray-tracing, and resets the `error_budget`.
+
+        Galaxies the approximation was previously attached to (e.g. fixed galaxies of a model, which are the same
+        objects in every instance) have it replaced rather than applied twice.
+
+        Parameters
+        ----------
+        galaxies
+            The galaxies whose deflection angles are approximated (e.g. `instance.galaxies`).
+        """
+        self._error_dict = {}
+
+        if hasattr(galaxies, "items"):
+            galaxies = [galaxy for _, galaxy in galaxies.items()]
+
+        for galaxy in galaxies:
+            if not isinstance(galaxy, ag.Galaxy):
+                continue
+
+            centre = self.centre_from(galaxy=galaxy)
+
+            if centre is None:
+                continue
+
+            func = galaxy.deflections_yx_2d_from
+
+            if isinstance(func, partial) and func.func == self.deflections_yx_2d_from:
+                func = func.args[0]
+
+            galaxy.deflections_yx_2d_from = partial(
+                self.deflections_yx_2d_from, func, centre
+            )
+
+    def monopole_from(
+        self, func: Callable, centre: Tuple[float, float], radius: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the radii of the rings around a galaxy's centre out to an input radius, the mass enclosed within every
+        ring (divided by pi, in arc-seconds squared) and the estimated error of the monopole approximation between
+        every pair of neighbouring rings.
+
+        Parameters
+        ----------
+        func
+            The function computing the exact deflection angles of the galaxy.
+        centre
+            The centre of the galaxy's mass profiles.
+        radius
+            The radius of the outermost ring.
+        """
+        ring_radii = radius / self.ring_factor ** np.arange(self.total_rings)[::-1]
+
+        ring_grid = np.asarray(centre) + ring_radii[:, None, None] * self.unit_vectors
+
+        ring_deflections = np.asarray(
+            func(grid=aa.Grid2DIrregular(values=ring_grid.reshape(-1, 2)))
+        ).reshape(ring_grid.shape)
+
+        masses = ring_radii * np.mean(
+            np.sum(ring_deflections * self.unit_vectors, axis=-1), axis=1
+        )
+
+        residuals = np.max(
+            np.linalg.norm(
+                ring_deflections
+                - (masses / ring_radii)[:, None, None] * self.unit_vectors,
+                axis=-1,
+            ),
+            axis=1,
+        )
+
+        errors = (
+            np.maximum(residuals[:-1], residuals[1:])
+            + np.abs(np.diff(masses)) / ring_radii[:-1]
+        )
+
+        return ring_radii, masses, errors
+
+    def deflections_yx_2d_from(
+        self,
+        func: Callable,
+        centre: Tuple[float, float],
+        grid: aa.type.Grid2DLike,
+        **kwargs,
+    ):
+        """
+        Returns the deflection angles of a galaxy, approximating them via the monopole of its mass distribution at
+        all coordinates beyond the radius where its estimated error is below the `tolerance`.
+
+        Grids with fewer coordinates than the rings are computed exactly, as the approximation would be slower.
+
+        Parameters
+        ----------
+        func
+            The function computing the exact deflection angles of the galaxy.
+        centre
+            The centre of the galaxy's mass profiles.
+        grid
+            The (y,x) coordinates the deflection angles are computed on.
+        """
+        values = np.asarray(grid)
+
+        if kwargs or len(values) <= self.total_rings * self.total_angles:
+            self.total_exact += len(values)
+            return func(grid=grid, **kwargs)
+
+        offsets = values - np.asarray(centre)
+        radii = np.sqrt(np.sum(offsets**2.0, axis=1))
+
+        ring_radii, masses, errors = self.monopole_from(
+            func=func, centre=centre, radius=np.max(radii)
+        )
+
+        above_tolerance = np.nonzero(errors > self.tolerance)[0]
+
+        ring_index = above_tolerance[-1] + 1 if len(above_tolerance) > 0 else 0
+
+        if ring_index >= len(errors):
+            self.total_exact += len(values)
+            return func(grid=grid)
+
+        is_approximated = radii >= ring_radii[ring_index]
+
+        deflections = np.zeros(values.shape)
+
+        if not np.all(is_approximated):
+            deflections[~is_approximated] = np.asarray(
+                func(grid=aa.Grid2DIrregular(values=values[~is_approximated]))
+            )
+
+        approximated_radii = radii[is_approximated]
+
+        deflections[is_approximated] = (
+            np.interp(approximated_radii, ring_radii, masses) / approximated_radii**2.0
+        )[:, None] * offsets[is_approximated]
+
+        self.total_approximated += int(np.sum(is_approximated))
+        self.total_exact += int(np.sum(~is_approximated))
+
+        self._error_dict[id(func)] = max(
+            self._error_dict.get(id(func), 0.0), float(np.max(errors[ring_index:]))
+        )
+        self.max_error_budget = max(self.max_error_budget, self.error_budget)
+
+        return vector_yx_from(values=deflections, grid=grid)
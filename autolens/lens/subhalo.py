@@ -1,5 +1,5 @@
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import autofit as af
 import autoarray as aa
@@ -11,6 +11,267 @@ from autolens.imaging.fit_imaging import FitImaging
 from autolens.imaging.plot.fit_imaging_plotters import FitImagingPlotter
 
 
+class SubhaloResultColumns:
+    def __init__(
+        self,
+        y: np.ndarray,
+        x: np.ndarray,
+        shape: Tuple[int, int],
+        pixel_scales: Tuple[float, float],
+        log_evidences: Optional[np.ndarray] = None,
+        log_likelihoods: Optional[np.ndarray] = None,
+        subhalo_masses: Optional[np.ndarray] = None,
+        subhalo_centres: Optional[np.ndarray] = None,
+        npz: Optional[np.lib.npyio.NpzFile] = None,
+    ):
+        """
+        A columnar representation of the results of a subhalo grid search or sensitivity mapping, where every
+        quantity is stored as a 1D NumPy array with one entry per grid cell.
+
+        Survey-wide subhalo analyses aggregate thousands of results. Storing them as columns means they can be written
+        to and read from a single uncompressed `.npz` file, queried with vectorized NumPy and turned into the 2D
+        arrays used for visualization, without unpickling the `GridSearchResult` of every lens.
+
+        The methods of this class mirror those of `SubhaloGridSearchResult` (e.g. `figure_of_merit_array`), so it
+        can be used in their place for plotting.
+
+        Parameters
+        ----------
+        y
+            The y coordinates of the centre of every grid cell.
+        x
+            The x coordinates of the centre of every grid cell.
+        shape
+            The 2D shape of the grid.
+        pixel_scales
+            The (y,x) size of each grid cell, used to map the values to an `Array2D`.
+        log_evidences
+            The log evidence of every grid cell (for sensitivity mapping, the log evidence increase of the perturbed
+            model).
+        log_likelihoods
+            The log likelihood of every grid cell (for sensitivity mapping, the log likelihood increase of the
+            perturbed model).
+        subhalo_masses
+            The `mass_at_200` of the subhalo in every grid cell.
+        subhalo_centres
+            The inferred (y,x) centre of the subhalo in every grid cell, with shape [total_cells, 2].
+        npz
+            An open `.npz` file (see `from_npz`) from which every column which is not input is read the first time
+            it is accessed.
+        """
+        self.shape = tuple(int(value) for value in shape)
+        self.pixel_scales = tuple(float(value) for value in pixel_scales)
+
+        self._column_dict = {
+            "y": None if y is None else np.asarray(y, dtype="float"),
+            "x": None if x is None else np.asarray(x, dtype="float"),
+            "log_evidences": log_evidences,
+            "log_likelihoods": log_likelihoods,
+            "subhalo_masses": subhalo_masses,
+            "subhalo_centres": subhalo_centres,
+        }
+
+        self._npz = npz
+
+    column_names = (
+        "y",
+        "x",
+        "log_evidences",
+        "log_likelihoods",
+        "subhalo_masses",
+        "subhalo_centres",
+    )
+
+    @classmethod
+    def from_npz(cls, file_path: str) -> "SubhaloResultColumns":
+        """
+        Load the columns from a `.npz` file output by the `output_to_npz` method.
+
+        Only the shape and pixel scales are read when the file is loaded. The file is kept open and every column is
+        read the first time it is accessed, so that analyses using a few columns of many results do not read the
+        others.
+
+        Parameters
+        ----------
+        file_path
+            The path to the `.npz` file.
+        """
+        npz = np.load(file_path)
+
+        return cls(
+            y=None,
+            x=None,
+            shape=tuple(npz["shape"]),
+            pixel_scales=tuple(npz["pixel_scales"]),
+            npz=npz,
+        )
+
+    def _column_from(self, name: str) -> Optional[np.ndarray]:
+        """
+        Returns a column, reading it from the `.npz` file the columns were loaded from the first time it is
+        accessed.
+
+        Parameters
+        ----------
+        name
+            The name of the column (see `column_names`).
+        """
+        if (
+            self._column_dict[name] is None
+            and self._npz is not None
+            and name in self._npz.files
+        ):
+            self._column_dict[name] = self._npz[name]
+
+        return self._column_dict[name]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._column_from(name="y")
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._column_from(name="x")
+
+    @property
+    def log_evidences(self) -> Optional[np.ndarray]:
+        return self._column_from(name="log_evidences")
+
+    @property
+    def log_likelihoods(self) -> Optional[np.ndarray]:
+        return self._column_from(name="log_likelihoods")
+
+    @property
+    def subhalo_masses(self) -> Optional[np.ndarray]:
+        return self._column_from(name="subhalo_masses")
+
+    @property
+    def subhalo_centres(self) -> Optional[np.ndarray]:
+        return self._column_from(name="subhalo_centres")
+
+    def output_to_npz(self, file_path: str):
+        """
+        Output the columns to an uncompressed `.npz` file, which can be loaded via `from_npz`.
+
+        Parameters
+        ----------
+        file_path
+            The path the `.npz` file is output to.
+        """
+        column_dict = {
+            name: getattr(self, name)
+            for name in self.column_names
+            if getattr(self, name) is not None
+        }
+
+        np.savez(
+            file_path,
+            shape=np.asarray(self.shape),
+            pixel_scales=np.asarray(self.pixel_scales),
+            **column_dict,
+        )
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """
+        The extent of the grid, which is the minimum and maximum values of the x and y coordinates.
+        """
+        return (np.min(self.x), np.max(self.x), np.min(self.y), np.max(self.y))
+
+    def _array_2d_from(self, values: np.ndarray) -> aa.Array2D:
+        """
+        Returns an `Array2D` where the input values of every grid cell are mapped to their (y,x) coordinates, which
+        is suitable for plotting.
+
+        Every value is placed in the pixel containing its (y,x) coordinates, so the cells can be in any order.
+
+        Parameters
+        ----------
+        values
+            The values of every grid cell (e.g. the log evidences).
+        """
+        pixel_indexes = aa.util.geometry.grid_pixel_indexes_2d_slim_from(
+            grid_scaled_2d_slim=np.stack((self.y, self.x), axis=-1),
+            shape_native=self.shape,
+            pixel_scales=self.pixel_scales,
+        ).astype("int")
+
+        array = np.full(self.shape[0] * self.shape[1], np.nan)
+        array[pixel_indexes] = values
+
+        return aa.Array2D.no_mask(
+            values=array,
+            pixel_scales=self.pixel_scales,
+            shape_native=self.shape,
+        )
+
+    def figure_of_merit_array(
+        self,
+        use_log_evidences: bool = True,
+        relative_to_value: float = 0.0,
+        remove_zeros: bool = False,
+    ) -> aa.Array2D:
+        """
+        Returns an `Array2D` where the values are the figure of merit (`log_evidence` or `log_likelihood`) of every
+        grid cell, which can be computed relative to an input value and have values below zero rounded to zero.
+
+        See `SubhaloGridSearchResult.figure_of_merit_array` for a full description.
+
+        Parameters
+        ----------
+        use_log_evidences
+            If `True`, the figure of merit values are the log evidences, if `False` the log likelihoods.
+        relative_to_value
+            The value to subtract from every figure of merit.
+        remove_zeros
+            If `True`, the figure of merit array is altered so that all values below 0.0 and set to 0.0.
+        """
+        if use_log_evidences:
+            figures_of_merits = self.log_evidences - relative_to_value
+        else:
+            figures_of_merits = self.log_likelihoods - relative_to_value
+
+        if remove_zeros:
+            figures_of_merits = np.maximum(figures_of_merits, 0.0)
+
+        return self._array_2d_from(values=figures_of_merits)
+
+    @property
+    def subhalo_mass_array(self) -> aa.Array2D:
+        """
+        Returns an `Array2D` where the values are the `mass_at_200` of the subhalo of every grid cell.
+        """
+        return self._array_2d_from(values=self.subhalo_masses)
+
+    @property
+    def subhalo_centres_grid(self) -> aa.Grid2D:
+        """
+        Returns a `Grid2D` where the values are the (y,x) coordinates of the subhalo of every grid cell.
+        """
+        return aa.Grid2D.no_mask(
+            values=self.subhalo_centres,
+            pixel_scales=self.pixel_scales,
+            shape_native=self.shape,
+        )
+
+
+def _values_1d_from(values) -> np.ndarray:
+    """
+    Returns the values of a `GridList` (or list of values) as a 1D NumPy array, where values which are `None`
+    (e.g. the log evidence of a non-linear search which does not compute it) are converted to NaN.
+
+    Parameters
+    ----------
+    values
+        The values of every cell of a grid search.
+    """
+    values = np.ravel(values.native) if hasattr(values, "native") else values
+
+    return np.asarray(
+        [np.nan if value is None else value for value in values], dtype="float"
+    )
+
+
 class SubhaloGridSearchResult(af.GridSearchResult):
     def __init__(
         self,
@@ -91,12 +352,10 @@ class SubhaloGridSearchResult(af.GridSearchResult):
         The 2D array of values, where the values are mapped from the input list of lists.
 
         """
-        values_reshaped = [value for values in values.native for value in values]
-
         return aa.Array2D.from_yx_and_values(
             y=self.y,
             x=self.x,
-            values=values_reshaped,
+            values=np.ravel(values.native),
             pixel_scales=self.physical_step_sizes,
             shape_native=self.shape,
         )
@@ -166,11 +425,56 @@ class SubhaloGridSearchResult(af.GridSearchResult):
             shape_native=self.shape,
         )
 
+    @property
+    def columns(self) -> SubhaloResultColumns:
+        """
+        Returns the results of the grid search as a `SubhaloResultColumns` object, where the grid coordinates,
+        figures of merit and subhalo masses are stored as 1D NumPy arrays.
+
+        This can be output to a `.npz` file via its `output_to_npz` method and then loaded and plotted without
+        unpickling this result.
+        """
+        try:
+            subhalo_masses = _values_1d_from(
+                values=self.attribute_grid("galaxies.subhalo.mass.mass_at_200")
+            )
+        except AttributeError:
+            subhalo_masses = None
+
+        try:
+            subhalo_centres = np.asarray(
+                self.attribute_grid("galaxies.subhalo.mass.centre"), dtype="float"
+            )
+        except AttributeError:
+            subhalo_centres = None
+
+        return SubhaloResultColumns(
+            y=_values_1d_from(values=self.y),
+            x=_values_1d_from(values=self.x),
+            shape=self.shape,
+            pixel_scales=self.physical_step_sizes,
+            log_evidences=_values_1d_from(values=self.log_evidences()),
+            log_likelihoods=_values_1d_from(values=self.log_likelihoods()),
+            subhalo_masses=subhalo_masses,
+            subhalo_centres=subhalo_centres,
+        )
+
+    def output_to_npz(self, file_path: str):
+        """
+        Output the results of the grid search to a `.npz` file in the columnar format of `SubhaloResultColumns`.
+
+        Parameters
+        ----------
+        file_path
+            The path the `.npz` file is output to.
+        """
+        self.columns.output_to_npz(file_path=file_path)
+
 
 class SubhaloPlotter(AbstractPlotter):
     def __init__(
         self,
-        result: Optional[SubhaloGridSearchResult] = None,
+        result: Optional[Union[SubhaloGridSearchResult, SubhaloResultColumns]] = None,
         fit_imaging_with_subhalo: Optional[FitImaging] = None,
         fit_imaging_no_subhalo: Optional[FitImaging] = None,
         mat_plot_2d: aplt.MatPlot2D = aplt.MatPlot2D(),
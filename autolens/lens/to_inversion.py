@@ -9,6 +9,7 @@ import autogalaxy as ag
 
 from autoarray.inversion.inversion.factory import inversion_from
 
+from autolens import profiling
 from autolens.analysis.preloads import Preloads
 
 
@@ -106,6 +107,7 @@ class TracerToInversion(ag.AbstractToInversion):
 
     @cached_property
     @aa.profile_func
+    @profiling.profile()
     def traced_grid_2d_list_of_inversion(self) -> List[aa.type.Grid2DLike]:
         """
         Returns a list of the traced grids of the inversion.
@@ -121,11 +123,48 @@ class TracerToInversion(ag.AbstractToInversion):
         -------
         The traced grids of the inversion, which are cached for efficiency.
         """
+        if self.uses_fused_tracing:
+            return self.traced_grid_2d_list_and_mesh_grid_pg_list_of_inversion[0]
+
         return self.tracer.traced_grid_2d_list_from(
             grid=self.dataset.grids.pixelization.over_sampler.over_sampled_grid
         )
 
+    @property
+    def uses_fused_tracing(self) -> bool:
+        """
+        Whether the grid of the inversion and the image-plane mesh grids are ray-traced together in a single call
+        (see `traced_grid_2d_list_and_mesh_grid_pg_list_of_inversion`).
+
+        This is the case when the tracer has a pixelization and neither set of traced grids is preloaded, such that
+        both sets are always ray-traced for the fit.
+        """
+        return (
+            bool(self.has_mapper)
+            and self.preloads.traced_grids_of_planes_for_inversion is None
+            and self.preloads.traced_mesh_grids_list_of_planes is None
+        )
+
+    @cached_property
+    @aa.profile_func
+    @profiling.profile()
+    def traced_grid_2d_list_and_mesh_grid_pg_list_of_inversion(
+        self,
+    ) -> Tuple[List[aa.type.Grid2DLike], List[List]]:
+        """
+        Returns the traced grids of the inversion (see `traced_grid_2d_list_of_inversion`) and the traced mesh grids
+        (see `traced_mesh_grid_pg_list`) computed via a single ray-tracing calculation.
+
+        For a pixelized source the over sampled grid of the inversion and the image-plane mesh grid cover the same
+        region of the image, therefore they are stacked into one contiguous grid so the deflection angles of every
+        galaxy are computed once for both, with the traced grids returned as views of the stacked grid.
+        """
+        return self.traced_grid_2d_list_and_mesh_grid_pg_list_from(
+            grid=self.dataset.grids.pixelization.over_sampler.over_sampled_grid
+        )
+
     @cached_property
+    @profiling.profile()
     def lp_linear_func_list_galaxy_dict(
         self,
     ) -> Dict[ag.LightProfileLinearObjFuncList, ag.Galaxy]:
@@ -255,6 +294,7 @@ class TracerToInversion(ag.AbstractToInversion):
         return [galaxies.cls_list_from(cls=cls) for galaxies in self.planes]
 
     @cached_property
+    @profiling.profile()
     def adapt_galaxy_image_pg_list(self) -> List[List[np.ndarray]]:
         """
         Returns a list of lists of adapt images, where each inner list corresponds to a single plane.
@@ -313,6 +353,7 @@ class TracerToInversion(ag.AbstractToInversion):
 
     @cached_property
     @aa.profile_func
+    @profiling.profile()
     def image_plane_mesh_grid_pg_list(self) -> List[List]:
         """
         Returns a list of lists of image-plane mesh grids, where each inner list corresponds to a single plane.
@@ -353,6 +394,7 @@ class TracerToInversion(ag.AbstractToInversion):
 
     @cached_property
     @aa.profile_func
+    @profiling.profile()
     def traced_mesh_grid_pg_list(self) -> List[List]:
         """
         Returns a list of lists of traced mesh grids, where each inner list corresponds to a single plane.
@@ -370,38 +412,125 @@ class TracerToInversion(ag.AbstractToInversion):
 
         The notation `_pg_` stands for `plane galaxy`, and indicates that the objects are grouped by plane
 
+        The mesh grids of all planes are ray-traced in a single calculation (see
+        `traced_grid_2d_list_and_mesh_grid_pg_list_from`), which also includes the grid of the inversion when it is
+        needed for the fit (see `uses_fused_tracing`).
+
         Returns
         -------
             The list of lists of traced mesh grids grouped by plane.
         """
+        if self.uses_fused_tracing:
+            return self.traced_grid_2d_list_and_mesh_grid_pg_list_of_inversion[1]
+
+        return self.traced_grid_2d_list_and_mesh_grid_pg_list_from()[1]
+
+    def traced_grid_2d_list_and_mesh_grid_pg_list_from(
+        self, grid: Optional[aa.Grid2DIrregular] = None
+    ) -> Tuple[Optional[List[aa.Grid2DIrregular]], List[List]]:
+        """
+        Returns a list of traced grids of an input grid and a list of lists of traced mesh grids (see
+        `traced_mesh_grid_pg_list`), which are computed via a single ray-tracing calculation.
+
+        The input grid and the mesh grids of all planes are concatenated into a single grid which is ray-traced once.
+        The traced grids are then returned as views of this traced grid, split back into the input grid and the
+        mesh grid of each plane and mapper.
+
+        If no grid is input, only the mesh grids are traced and ray-tracing stops at the highest redshift plane with
+        a mesh grid (via `plane_index_limit`).
+
+        Parameters
+        ----------
+        grid
+            An optional grid (e.g. the over sampled grid of the inversion) which is ray-traced with the mesh grids.
+
+        Returns
+        -------
+            The traced grids of the input grid (None if no grid is input) and the list of lists of traced mesh grids
+            grouped by plane.
+        """
         if self.preloads.image_plane_mesh_grid_pg_list is None:
             image_plane_mesh_grid_pg_list = self.image_plane_mesh_grid_pg_list
         else:
             image_plane_mesh_grid_pg_list = self.preloads.image_plane_mesh_grid_pg_list
 
-        traced_mesh_grid_pg_list = []
+        mesh_grid_index_list = [
+            (plane_index, mapper_index)
+            for plane_index, image_plane_mesh_grid_list in enumerate(
+                image_plane_mesh_grid_pg_list
+            )
+            if image_plane_mesh_grid_list is not None
+            for mapper_index, image_plane_mesh_grid in enumerate(
+                image_plane_mesh_grid_list
+            )
+            if image_plane_mesh_grid is not None
+        ]
+
+        traced_mesh_grid_pg_list = [
+            (
+                None
+                if image_plane_mesh_grid_list is None
+                else [None] * len(image_plane_mesh_grid_list)
+            )
+            for image_plane_mesh_grid_list in image_plane_mesh_grid_pg_list
+        ]
 
-        for plane_index, galaxies in enumerate(self.planes):
-            if image_plane_mesh_grid_pg_list[plane_index] is None:
-                traced_mesh_grid_pg_list.append(None)
-            else:
-                traced_mesh_grids_list = []
+        mesh_grid_list = [
+            np.asarray(image_plane_mesh_grid_pg_list[plane_index][mapper_index])
+            for plane_index, mapper_index in mesh_grid_index_list
+        ]
 
-                for image_plane_mesh_grid in image_plane_mesh_grid_pg_list[plane_index]:
-                    try:
-                        traced_mesh_grids_list.append(
-                            self.tracer.traced_grid_2d_list_from(
-                                grid=image_plane_mesh_grid
-                            )[plane_index]
-                        )
-                    except AttributeError:
-                        traced_mesh_grids_list.append(None)
+        if grid is None:
+            if len(mesh_grid_list) == 0:
+                return None, traced_mesh_grid_pg_list
 
-                traced_mesh_grid_pg_list.append(traced_mesh_grids_list)
+            grid_list = mesh_grid_list
+            plane_index_limit = max(
+                plane_index for plane_index, _ in mesh_grid_index_list
+            )
+        else:
+            grid_list = [np.asarray(grid)] + mesh_grid_list
+            plane_index_limit = None
+
+        traced_values_list = [
+            np.asarray(traced_grid)
+            for traced_grid in self.tracer.traced_grid_2d_list_from(
+                grid=aa.Grid2DIrregular(
+                    values=(
+                        grid_list[0]
+                        if len(grid_list) == 1
+                        else np.concatenate(grid_list)
+                    )
+                ),
+                plane_index_limit=plane_index_limit,
+            )
+        ]
+
+        end_index_list = np.cumsum([len(values) for values in grid_list])
+
+        if grid is None:
+            traced_grid_list = None
+        else:
+            traced_grid_list = [
+                aa.Grid2DIrregular(values=traced_values[: len(grid)])
+                for traced_values in traced_values_list
+            ]
+
+            end_index_list = end_index_list[1:]
+
+        for (plane_index, mapper_index), end_index, mesh_grid in zip(
+            mesh_grid_index_list, end_index_list, mesh_grid_list
+        ):
+            traced_mesh_grid_pg_list[plane_index][mapper_index] = aa.Grid2DIrregular(
+                values=traced_values_list[plane_index][
+                    end_index - len(mesh_grid) : end_index
+                ]
+            )
 
-        return traced_mesh_grid_pg_list
+        return traced_grid_list, traced_mesh_grid_pg_list
 
     @cached_property
+    @profiling.profile()
     def mapper_galaxy_dict(self) -> Dict[aa.AbstractMapper, ag.Galaxy]:
         """
         Returns a dictionary associating each `Mapper` object with the galaxy it belongs to.
@@ -499,6 +628,7 @@ class TracerToInversion(ag.AbstractToInversion):
         return mapper_galaxy_dict
 
     @cached_property
+    @profiling.profile()
     def inversion(self):
         """
         Returns an inversion object from the dataset, galaxies and inversion settings.
@@ -2,7 +2,7 @@ from abc import ABC
 import numpy as np
 from functools import wraps
 from scipy.interpolate import griddata
-from typing import Dict, List, Optional, Type, Union
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
 import autofit as af
 import autoarray as aa
@@ -11,7 +11,11 @@ import autogalaxy as ag
 from autogalaxy.profiles.geometry_profiles import GeometryProfile
 from autogalaxy.profiles.light.snr import LightProfileSNR
 
+from autolens import profiling
 from autolens.lens import tracer_util
+from autolens.lens.lensing_geometry import LensingGeometry
+from autolens.lens.lensing_geometry import evaluation_grid_from
+from autolens.lens.tree_deflections import TreeDeflections
 
 
 def over_sample(func):
@@ -75,17 +79,18 @@ def over_sample(func):
         result = func(obj, grid_input, *args, **kwargs)
 
         if over_sampler_used:
-            if isinstance(result, list):
-                return [
-                    over_sampler.binned_array_2d_from(array=result_i)
-                    for result_i in result
-                ]
-            elif isinstance(result, dict):
-                return {
-                    key: over_sampler.binned_array_2d_from(array=result_i)
-                    for key, result_i in result.items()
-                }
-            return over_sampler.binned_array_2d_from(array=result)
+            with profiling.section(name="over_sampling_binning"):
+                if isinstance(result, list):
+                    return [
+                        over_sampler.binned_array_2d_from(array=result_i)
+                        for result_i in result
+                    ]
+                elif isinstance(result, dict):
+                    return {
+                        key: over_sampler.binned_array_2d_from(array=result_i)
+                        for key, result_i in result.items()
+                    }
+                return over_sampler.binned_array_2d_from(array=result)
 
         return result
 
@@ -93,11 +98,15 @@ def over_sample(func):
 
 
 class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
+    __nullify_fields__ = ("deflections_func",)
+
     def __init__(
         self,
         galaxies: Union[List[ag.Galaxy], af.ModelInstance],
         cosmology: ag.cosmo.LensingCosmology = ag.cosmo.Planck15(),
         run_time_dict: Optional[Dict] = None,
+        tree_deflections: Optional[TreeDeflections] = None,
+        deflections_func: Optional[Callable] = None,
     ):
         """
         Performs gravitational lensing ray-tracing calculations based on an input list of galaxies and a cosmology.
@@ -119,6 +128,11 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         ray-tracing calculations. This uses the input cosmology so that deflection-angles are rescaled according to
         the lens-geometry of the multi-plane system.
 
+        If a `TreeDeflections` is input, planes with many spherical halos of finite mass (e.g. the line-of-sight halos
+        of `sliced_tracer_from`) have their deflection angles computed via its tree code when ray-tracing, which is
+        used automatically for planes with more than its `halo_threshold` halos. By default the deflection angles of
+        every halo are summed exactly.
+
         The `Tracer` object is also the core of the lens modeling API, whereby a model tracer is created via
         the `PyAutoFit` `af.Model` object.
 
@@ -131,6 +145,13 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         run_time_dict
             A dictionary of information on the run-times of function calls, including the total time and time spent on
             different calculations.
+        tree_deflections
+            Computes the deflection angles of planes with many halos via a tree code when ray-tracing, where None sums
+            the deflection angles of every halo.
+        deflections_func
+            Computes the deflection angles of a galaxy on a grid when ray-tracing (e.g. the linearized deflection
+            angles of a `MacroDeflectionCache`), where None uses the galaxy's `deflections_yx_2d_from` method. It is
+            not output when the tracer is written to a .json file.
         """
 
         self.galaxies = galaxies
@@ -139,6 +160,12 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
         self.run_time_dict = run_time_dict
 
+        self.tree_deflections = tree_deflections
+
+        self.deflections_func = deflections_func
+
+        self._lensing_geometry_dict = {}
+
     @property
     def galaxies_ascending_redshift(self) -> List[ag.Galaxy]:
         """
@@ -346,6 +373,8 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
             grid=grid,
             cosmology=self.cosmology,
             plane_index_limit=plane_index_limit,
+            tree_deflections=self.tree_deflections,
+            deflections_func=self.deflections_func,
         )
 
     def grid_2d_at_redshift_from(
@@ -421,6 +450,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         )
 
     @over_sample
+    @profiling.profile()
     def image_2d_list_from(
         self,
         grid: aa.type.Grid2DLike,
@@ -483,17 +513,18 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         for plane_index in range(len(traced_grid_list)):
             galaxies = self.planes[plane_index]
 
-            image_2d_list.append(
-                sum(
-                    [
-                        galaxy.image_2d_from(
-                            grid=traced_grid_list[plane_index],
-                            operated_only=operated_only,
-                        )
-                        for galaxy in galaxies
-                    ]
+            with profiling.section(name=lambda: f"light_plane_{plane_index}"):
+                image_2d_list.append(
+                    sum(
+                        [
+                            galaxy.image_2d_from(
+                                grid=traced_grid_list[plane_index],
+                                operated_only=operated_only,
+                            )
+                            for galaxy in galaxies
+                        ]
+                    )
                 )
-            )
 
         if self.upper_plane_index_with_light_profile < self.total_planes - 1:
             if isinstance(grid, aa.Grid2D):
@@ -772,7 +803,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
 
             for plane_lp_index in range(self.total_planes):
                 if plane_lp_index != plane_index:
-                    image += image_list[plane_lp_index]
+                    image = image + image_list[plane_lp_index]
 
         return aa.Array2D(
             values=image,
@@ -823,6 +854,7 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         return galaxy_image_2d_dict
 
     @aa.grid_dec.to_vector_yx
+    @profiling.profile()
     def deflections_yx_2d_from(
         self, grid: aa.type.Grid2DLike
     ) -> Union[aa.VectorYX2D, aa.VectorYX2DIrregular]:
@@ -966,6 +998,37 @@ class Tracer(ABC, ag.OperateImageGalaxies, ag.OperateDeflections):
         """
         return sum([galaxy.potential_2d_from(grid=grid) for galaxy in self.galaxies])
 
+    def lensing_geometry_from(
+        self,
+        grid: aa.type.Grid2DLike,
+        pixel_scale: Union[Tuple[float, float], float] = 0.05,
+    ) -> LensingGeometry:
+        """
+        Returns the `LensingGeometry` of the tracer for an input grid, which contains its critical curves, caustics
+        and the areas within its critical curves, all computed from one lensing jacobian.
+
+        The critical curves and caustics are computed on the same uniform evaluation grid used by functions like
+        `tangential_critical_curve_list_from`, and are identical to those functions.
+
+        The `LensingGeometry` is memoized on the tracer for every evaluation grid, so that every plotter which
+        visualizes the critical curves or caustics of the same tracer reuses the same calculation.
+
+        Parameters
+        ----------
+        grid
+            The 2D grid of (y,x) arc-second coordinates whose zoomed extent the critical curves are computed over.
+        pixel_scale
+            The resolution of the uniform grid on which the critical curves and caustics are computed.
+        """
+        grid = evaluation_grid_from(grid=grid, pixel_scale=pixel_scale)
+
+        key = (grid.shape_native, grid.pixel_scales, grid.origin)
+
+        if key not in self._lensing_geometry_dict:
+            self._lensing_geometry_dict[key] = LensingGeometry(tracer=self, grid=grid)
+
+        return self._lensing_geometry_dict[key]
+
     def has(self, cls: Type) -> bool:
         """
         Returns a bool specifying whether this tracer has a galaxy with a certain class type.
@@ -1,9 +1,12 @@
 import numpy as np
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 import autoarray as aa
 import autogalaxy as ag
 
+from autolens import profiling
+from autolens.lens.tree_deflections import TreeDeflections
+
 
 def plane_redshifts_from(galaxies: List[ag.Galaxy]) -> List[float]:
     """
@@ -81,11 +84,30 @@ def planes_from(
     return planes
 
 
+def galaxy_section_name_from(galaxy: ag.Galaxy) -> str:
+    """
+    Returns the name a galaxy's deflection angle calculation is profiled under, which is the class names of its mass
+    profiles joined with a `+` (e.g. `Isothermal+ExternalShear`).
+
+    Parameters
+    ----------
+    galaxy
+        The galaxy whose deflection angles are profiled.
+    """
+    return "+".join(
+        mass_profile.__class__.__name__
+        for mass_profile in galaxy.cls_list_from(cls=ag.mp.MassProfile)
+    )
+
+
+@profiling.profile()
 def traced_grid_2d_list_from(
     planes: List[List[ag.Galaxy]],
     grid: aa.type.Grid2DLike,
     cosmology: ag.cosmo.LensingCosmology = ag.cosmo.Planck15(),
     plane_index_limit: int = Optional[None],
+    tree_deflections: Optional[TreeDeflections] = None,
+    deflections_func: Optional[Callable] = None,
 ):
     """
     Returns a ray-traced grid of 2D Cartesian (y,x) coordinates which accounts for multi-plane ray-tracing.
@@ -109,10 +131,21 @@ def traced_grid_2d_list_from(
     above this value are omitted from the calculation and not included in the returned list of grids (the size of
     this list is reduced accordingly).
 
+    The traced grids are computed without in-place operations, so that the calculation is a pure function of the
+    input grid and mass profile parameters which automatic differentiation libraries (e.g. JAX) can trace.
+
     For example, if `planes` has 3 lists of galaxies, but `plane_index_limit=1`, the third plane (corresponding to
     index 2) will not be calculated. The `plane_index_limit` is used to avoid uncessary ray tracing calculations
     of higher redshift planes whose galaxies do not have mass profile (and only have light profiles).
 
+    If a `TreeDeflections` is input, the deflection angles of every plane with many halos (e.g. the line-of-sight
+    halos of a sliced tracer) are computed via its tree code instead of summing the deflection angles of every galaxy.
+
+    If a `deflections_func` is input, the deflection angles of every galaxy are computed via `deflections_func(galaxy,
+    grid)` instead of the galaxy's `deflections_yx_2d_from` method (e.g. to use precomputed deflection angles of the
+    lens galaxy). The deflection angles of the first plane are computed on the input grid object itself, so that such
+    a function can look up precomputed values by the identity of the grid.
+
     Parameters
     ----------
     galaxies
@@ -125,6 +158,12 @@ def traced_grid_2d_list_from(
     plane_index_limit
         The integer index of the last plane which is used to perform ray-tracing, all planes with an index above
         this value are omitted.
+    tree_deflections
+        Computes the deflection angles of planes with many halos via a tree code, where None sums the deflection
+        angles of every galaxy.
+    deflections_func
+        Computes the deflection angles of a galaxy on a grid, where None uses the galaxy's `deflections_yx_2d_from`
+        method.
 
     Returns
     -------
@@ -137,34 +176,55 @@ def traced_grid_2d_list_from(
 
     redshift_list = [galaxies[0].redshift for galaxies in planes]
 
-    for plane_index, galaxies in enumerate(planes):
-        scaled_grid = grid.copy()
-
-        if plane_index > 0:
-            for previous_plane_index in range(plane_index):
-                scaling_factor = cosmology.scaling_factor_between_redshifts_from(
-                    redshift_0=redshift_list[previous_plane_index],
-                    redshift_1=galaxies[0].redshift,
-                    redshift_final=redshift_list[-1],
-                )
-
-                scaled_deflections = (
-                    scaling_factor * traced_deflection_list[previous_plane_index]
-                )
-
-                scaled_grid -= scaled_deflections
+    def deflections_yx_2d_from(galaxy, grid):
+        with profiling.section(name=lambda: galaxy_section_name_from(galaxy=galaxy)):
+            if deflections_func is not None:
+                return deflections_func(galaxy, grid)
 
-        traced_grid_list.append(scaled_grid)
+            return galaxy.deflections_yx_2d_from(grid=grid)
 
-        if plane_index_limit is not None:
-            if plane_index == plane_index_limit:
-                return traced_grid_list
-
-        deflections_yx_2d = sum(
-            map(lambda g: g.deflections_yx_2d_from(grid=scaled_grid), galaxies)
-        )
+    for plane_index, galaxies in enumerate(planes):
+        with profiling.section(name=lambda: f"plane_{plane_index}"):
+            scaled_grid = grid.copy()
+
+            if plane_index > 0:
+                for previous_plane_index in range(plane_index):
+                    scaling_factor = cosmology.scaling_factor_between_redshifts_from(
+                        redshift_0=redshift_list[previous_plane_index],
+                        redshift_1=galaxies[0].redshift,
+                        redshift_final=redshift_list[-1],
+                    )
+
+                    scaled_deflections = (
+                        scaling_factor * traced_deflection_list[previous_plane_index]
+                    )
+
+                    scaled_grid = scaled_grid - scaled_deflections
+
+            traced_grid_list.append(scaled_grid)
+
+            if plane_index_limit is not None:
+                if plane_index == plane_index_limit:
+                    return traced_grid_list
+
+            if plane_index == 0:
+                scaled_grid = grid
+
+            if tree_deflections is not None and tree_deflections.is_used_for(
+                galaxies=galaxies
+            ):
+                with profiling.section(name="tree_deflections"):
+                    deflections_yx_2d = tree_deflections.deflections_yx_2d_from(
+                        galaxies=galaxies,
+                        grid=scaled_grid,
+                        deflections_func=deflections_yx_2d_from,
+                    )
+            else:
+                deflections_yx_2d = sum(
+                    map(lambda g: deflections_yx_2d_from(g, scaled_grid), galaxies)
+                )
 
-        traced_deflection_list.append(deflections_yx_2d)
+            traced_deflection_list.append(deflections_yx_2d)
 
     return traced_grid_list
 
@@ -198,6 +258,9 @@ def grid_2d_at_redshift_from(
     2) If the input redshift is not the same as the redshift of a plane in the multi-plane system, a plane is inserted
     at this redshift and the grid is ray-traced to this plane.
 
+    In both cases ray-tracing stops at the plane of the input redshift, so only the deflection angles of galaxies in
+    front of it are computed (e.g. when tracing the centre of a subhalo, galaxies behind the subhalo are skipped).
+
     For example, the input list `galaxies` may contained three `ag.Galaxy` objects at redshifts z=0.5, z=1.0 and z=2.0.
     We can input an image-plane grid and request that its coordinates are ray-traced to a plane at z=1.75 in this
     multi-plane system. This will insert a plane at z=1.75 and use the galaxy's at z=0.5 and z=1.0 to compute
@@ -231,7 +294,10 @@ def grid_2d_at_redshift_from(
 
     if plane_index_with_redshift:
         traced_grid_list = traced_grid_2d_list_from(
-            planes=planes, grid=grid, cosmology=cosmology
+            planes=planes,
+            grid=grid,
+            cosmology=cosmology,
+            plane_index_limit=plane_index_with_redshift[0],
         )
 
         return traced_grid_list[plane_index_with_redshift[0]]
@@ -243,7 +309,10 @@ def grid_2d_at_redshift_from(
     planes.insert(plane_index_insert, [ag.Galaxy(redshift=redshift)])
 
     traced_grid_list = traced_grid_2d_list_from(
-        planes=planes, grid=grid, cosmology=cosmology
+        planes=planes,
+        grid=grid,
+        cosmology=cosmology,
+        plane_index_limit=plane_index_insert,
     )
 
     return traced_grid_list[plane_index_insert]
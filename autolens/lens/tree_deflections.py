@@ -0,0 +1,453 @@
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+
+import autoarray as aa
+import autogalaxy as ag
+
+from autolens.lens.sparse_deflections import vector_yx_from
+
+
+def is_tree_profile(mass_profile: ag.mp.MassProfile) -> bool:
+    """
+    Returns whether the deflection angles of a mass profile can be computed by a `TreeDeflections`, which requires
+    a spherical mass profile with a finite total mass (a `PointMass` or a spherical truncated profile).
+    """
+    if isinstance(mass_profile, ag.mp.PointMass):
+        return True
+
+    return (
+        hasattr(mass_profile, "truncation_radius")
+        and hasattr(mass_profile, "centre")
+        and tuple(getattr(mass_profile, "ell_comps", (0.0, 0.0))) == (0.0, 0.0)
+    )
+
+
+def is_tree_galaxy(galaxy: ag.Galaxy) -> bool:
+    """
+    Returns whether the deflection angles of a galaxy can be computed by a `TreeDeflections`, which requires every
+    mass profile of the galaxy to be a tree profile (see `is_tree_profile`) and the galaxy to not have its
+    deflection angles computed by another method (e.g. a `SparseDeflections`).
+    """
+    if "deflections_yx_2d_from" in vars(galaxy):
+        return False
+
+    mass_profile_list = galaxy.cls_list_from(cls=ag.mp.MassProfile)
+
+    return len(mass_profile_list) > 0 and all(map(is_tree_profile, mass_profile_list))
+
+
+class Node:
+    def __init__(
+        self,
+        indexes: np.ndarray,
+        centre: np.ndarray,
+        masses: np.ndarray,
+        size: float,
+        reach: float,
+        children: List["Node"],
+    ):
+        """
+        A node of the quadtree of a `TreeDeflections`, a square containing the centres of a subset of the halos.
+
+        Parameters
+        ----------
+        indexes
+            The indexes of the halos in the node.
+        centre
+            The centre of mass of the halos in the node.
+        masses
+            The summed mass of the halos in the node enclosed within every radius of the tree (divided by pi, in
+            arc-seconds squared).
+        size
+            The side length of the node's square.
+        reach
+            The distance from the node's centre of mass within which the enclosed mass of a halo of the node may not
+            be interpolated.
+        children
+            The four sub-squares of the node, or an empty list if it is a leaf.
+        """
+        self.indexes = indexes
+        self.centre = centre
+        self.masses = masses
+        self.size = size
+        self.reach = reach
+        self.children = children
+
+
+class TreeDeflections:
+    def __init__(
+        self,
+        opening_angle: float = 0.3,
+        halo_threshold: Optional[int] = 100,
+        leaf_size: int = 8,
+        total_octaves: int = 12,
+        radii_per_octave: int = 4,
+    ):
+        """
+        Computes the summed deflection angles of the many halos in a plane (e.g. the line-of-sight halos of
+        `Tracer.sliced_tracer_from`) via a Barnes-Hut tree code, whose cost scales as O(N_pix log N_halos) rather
+        than the O(N_pix N_halos) of summing the deflection angles of every halo.
+
+        Only halos with spherical mass profiles and a finite total mass (`PointMass` and spherical truncated profiles,
+        see `is_tree_profile`) are computed by the tree code, and all other galaxies of the plane are computed
+        exactly. A `Tracer` uses the tree code for every plane with at least `halo_threshold` such mass profiles.
+
+        The deflection angle of a spherical halo at a distance r from its centre is the mass it encloses within r
+        divided by r. For every halo the enclosed mass is therefore computed from its exact deflection angles on
+        log-spaced radii, starting at its truncation radius (or Einstein radius for a `PointMass`) and extending over
+        `total_octaves` factors of 2 (the enclosed masses are cached for halos with the same parameters). Beyond its
+        smallest radius the deflection angles of a halo follow from interpolating its enclosed mass, and within it
+        they are computed exactly.
+
+        The halo centres are sorted into a quadtree, whose nodes store the centre of mass and the summed enclosed
+        masses of their halos. The deflection angles at a coordinate are the sum over nodes of the deflection angles
+        of the node's summed enclosed mass at the node's centre of mass, for every node which is far enough away: its
+        size divided by its distance is below the `opening_angle` and the coordinate is beyond the smallest radius of
+        all of its halos. Nodes which are not far enough away are opened and their sub-nodes used instead. Smaller
+        values of the `opening_angle` are more accurate and slower, with the error of approximating a node by its
+        centre of mass scaling as the `opening_angle` squared.
+
+        The enclosed masses of the halos and the quadtree of the most recent plane are cached on this object, which is
+        therefore not thread-safe. It should be created for an individual tracer or analysis, and not shared by
+        tracers which ray-trace in different threads.
+
+        Parameters
+        ----------
+        opening_angle
+            The maximum ratio of the size of a node to its distance for which its halos are approximated as a single
+            halo at their centre of mass.
+        halo_threshold
+            The minimum number of tree mass profiles in a plane for a `Tracer` to use the tree code, where None never
+            uses it.
+        leaf_size
+            The maximum number of halos in a leaf node of the quadtree.
+        total_octaves
+            The number of factors of 2 spanned by the radii on which the enclosed mass of every halo is computed.
+        radii_per_octave
+            The number of radii per factor of 2 on which the enclosed mass of every halo is computed.
+        """
+        self.opening_angle = opening_angle
+        self.halo_threshold = halo_threshold
+        self.leaf_size = leaf_size
+        self.total_octaves = total_octaves
+        self.radii_per_octave = radii_per_octave
+
+        self._halo_dict = {}
+
+        self._tree_key = None
+        self._tree = None
+        self._log_radii = None
+
+    def is_used_for(self, galaxies: List[ag.Galaxy]) -> bool:
+        """
+        Returns whether the tree code is used to compute the deflection angles of a plane of galaxies, which is the
+        case if the plane has at least `halo_threshold` tree mass profiles.
+        """
+        if self.halo_threshold is None:
+            return False
+
+        total_halos = sum(
+            len(galaxy.cls_list_from(cls=ag.mp.MassProfile))
+            for galaxy in galaxies
+            if is_tree_galaxy(galaxy=galaxy)
+        )
+
+        return total_halos >= self.halo_threshold
+
+    def halo_from(
+        self, mass_profile: ag.mp.MassProfile
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the log-spaced radii of a halo and the mass it encloses within every radius (divided by pi, in
+        arc-seconds squared), which is computed from the radial deflection angle at every radius.
+
+        Parameters
+        ----------
+        mass_profile
+            The spherical mass profile of the halo.
+        """
+        try:
+            key = (type(mass_profile), tuple(sorted(vars(mass_profile).items())))
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None and key in self._halo_dict:
+            return self._halo_dict[key]
+
+        radius = getattr(
+            mass_profile,
+            "truncation_radius",
+            getattr(mass_profile, "einstein_radius", 1.0),
+        )
+
+        radii = radius * 2.0 ** (
+            np.arange(self.total_octaves * self.radii_per_octave + 1)
+            / self.radii_per_octave
+        )
+
+        deflections = np.asarray(
+            mass_profile.deflections_yx_2d_from(
+                grid=aa.Grid2DIrregular(
+                    values=np.stack(
+                        (
+                            np.full(radii.shape, mass_profile.centre[0]),
+                            mass_profile.centre[1] + radii,
+                        ),
+                        axis=-1,
+                    )
+                )
+            )
+        )
+
+        halo = (radii, radii * deflections[:, 1])
+
+        if key is not None:
+            if len(self._halo_dict) > 100000:
+                self._halo_dict = {}
+
+            self._halo_dict[key] = halo
+
+        return halo
+
+    def node_from(
+        self,
+        indexes: np.ndarray,
+        centres: np.ndarray,
+        masses: np.ndarray,
+        min_radii: np.ndarray,
+        square_centre: np.ndarray,
+        size: float,
+        depth: int = 0,
+    ) -> Node:
+        """
+        Returns the node of the quadtree containing the halos of the input indexes, creating its sub-nodes
+        recursively until every leaf contains at most `leaf_size` halos.
+        """
+        node_masses = np.sum(masses[indexes], axis=0)
+
+        total_masses = masses[indexes, -1]
+
+        if np.sum(total_masses) > 0.0:
+            centre = np.sum(centres[indexes] * total_masses[:, None], axis=0) / np.sum(
+                total_masses
+            )
+        else:
+            centre = np.mean(centres[indexes], axis=0)
+
+        reach = np.max(
+            np.sqrt(np.sum((centres[indexes] - centre) ** 2.0, axis=1))
+            + min_radii[indexes]
+        )
+
+        children = []
+
+        if len(indexes) > self.leaf_size and depth < 32:
+            is_upper = centres[indexes, 0] >= square_centre[0]
+            is_right = centres[indexes, 1] >= square_centre[1]
+
+            for upper in (False, True):
+                for right in (False, True):
+                    child_indexes = indexes[(is_upper == upper) & (is_right == right)]
+
+                    if len(child_indexes) == 0:
+                        continue
+
+                    children.append(
+                        self.node_from(
+                            indexes=child_indexes,
+                            centres=centres,
+                            masses=masses,
+                            min_radii=min_radii,
+                            square_centre=square_centre
+                            + 0.25 * size * np.array([2 * upper - 1, 2 * right - 1]),
+                            size=0.5 * size,
+                            depth=depth + 1,
+                        )
+                    )
+
+        return Node(
+            indexes=indexes,
+            centre=centre,
+            masses=node_masses,
+            size=size,
+            reach=reach,
+            children=children,
+        )
+
+    def tree_from(
+        self, centres: np.ndarray, halo_list: List[Tuple[np.ndarray, np.ndarray]]
+    ) -> Tuple[Node, np.ndarray]:
+        """
+        Returns the root node of the quadtree of the input halos and the log radii its enclosed masses are tabulated
+        on, reusing the quadtree of the previous call if the halos are the same (e.g. the fixed line-of-sight halos of
+        a model-fit).
+
+        The enclosed masses of every halo are interpolated onto log-spaced radii spanning the radii of all halos, with
+        the mass within a halo's smallest radius set to the mass enclosed within it (such coordinates are never
+        approximated) and the mass beyond its largest radius set to the mass enclosed within it.
+        """
+        key = hash(
+            centres.tobytes()
+            + b"".join(
+                radii.tobytes() + masses.tobytes() for radii, masses in halo_list
+            )
+        )
+
+        if key != self._tree_key:
+            min_radii = np.array([radii[0] for radii, _ in halo_list])
+            max_radii = np.array([radii[-1] for radii, _ in halo_list])
+
+            total_radii = int(
+                np.ceil(
+                    self.radii_per_octave
+                    * np.log2(np.max(max_radii) / np.min(min_radii))
+                )
+            )
+
+            self._log_radii = np.log(np.min(min_radii)) + np.log(2.0) * (
+                np.arange(total_radii + 1) / self.radii_per_octave
+            )
+
+            masses = np.array(
+                [
+                    np.interp(self._log_radii, np.log(radii), halo_masses)
+                    for radii, halo_masses in halo_list
+                ]
+            )
+
+            lower = np.min(centres, axis=0)
+            upper = np.max(centres, axis=0)
+
+            self._tree = self.node_from(
+                indexes=np.arange(len(centres)),
+                centres=centres,
+                masses=masses,
+                min_radii=min_radii,
+                square_centre=0.5 * (lower + upper),
+                size=float(np.max(upper - lower)) * (1.0 + 1.0e-8) + 1.0e-8,
+            )
+            self._tree_key = key
+
+        return self._tree, self._log_radii
+
+    def deflections_yx_2d_via_profiles_from(
+        self, mass_profile_list: List[ag.mp.MassProfile], grid: aa.type.Grid2DLike
+    ) -> np.ndarray:
+        """
+        Returns the summed deflection angles of a list of tree mass profiles on a grid via the tree code.
+
+        Parameters
+        ----------
+        mass_profile_list
+            The spherical mass profiles with finite total mass whose deflection angles are summed.
+        grid
+            The (y,x) coordinates the deflection angles are computed on.
+        """
+        values = np.asarray(grid).reshape(-1, 2)
+
+        centres = np.array([mass_profile.centre for mass_profile in mass_profile_list])
+        halo_list = list(map(self.halo_from, mass_profile_list))
+
+        tree, log_radii = self.tree_from(centres=centres, halo_list=halo_list)
+
+        deflections = np.zeros(values.shape)
+        exact_dict: Dict[int, List[np.ndarray]] = {}
+
+        stack = [(tree, np.arange(len(values)))]
+
+        while stack:
+            node, indexes = stack.pop()
+
+            offsets = values[indexes] - node.centre
+            distances_squared = np.sum(offsets**2.0, axis=1)
+
+            is_far = (distances_squared > node.reach**2.0) & (
+                node.size**2.0 < self.opening_angle**2.0 * distances_squared
+            )
+
+            deflections[indexes[is_far]] += (
+                np.interp(
+                    0.5 * np.log(distances_squared[is_far]), log_radii, node.masses
+                )
+                / distances_squared[is_far]
+            )[:, None] * offsets[is_far]
+
+            indexes = indexes[~is_far]
+
+            if len(indexes) == 0:
+                continue
+
+            if node.children:
+                stack += [(child, indexes) for child in node.children]
+                continue
+
+            for halo_index in node.indexes:
+                radii, masses = halo_list[halo_index]
+
+                offsets = values[indexes] - centres[halo_index]
+                distances_squared = np.sum(offsets**2.0, axis=1)
+
+                is_far = distances_squared > radii[0] ** 2.0
+
+                deflections[indexes[is_far]] += (
+                    np.interp(
+                        0.5 * np.log(distances_squared[is_far]), np.log(radii), masses
+                    )
+                    / distances_squared[is_far]
+                )[:, None] * offsets[is_far]
+
+                if not np.all(is_far):
+                    exact_dict.setdefault(halo_index, []).append(indexes[~is_far])
+
+        for halo_index, indexes_list in exact_dict.items():
+            indexes = np.concatenate(indexes_list)
+
+            deflections[indexes] += np.asarray(
+                mass_profile_list[halo_index].deflections_yx_2d_from(
+                    grid=aa.Grid2DIrregular(values=values[indexes])
+                )
+            )
+
+        return deflections
+
+    def deflections_yx_2d_from(
+        self,
+        galaxies: List[ag.Galaxy],
+        grid: aa.type.Grid2DLike,
+        deflections_func: Callable,
+    ):
+        """
+        Returns the summed deflection angles of a plane of galaxies, computing the tree galaxies (see
+        `is_tree_galaxy`) via the tree code and all other galaxies via an input function.
+
+        Parameters
+        ----------
+        galaxies
+            The galaxies of the plane.
+        grid
+            The (y,x) coordinates the deflection angles are computed on.
+        deflections_func
+            The function computing the exact deflection angles of a galaxy, which receives the galaxy and grid.
+        """
+        tree_galaxies = [galaxy for galaxy in galaxies if is_tree_galaxy(galaxy=galaxy)]
+
+        deflections = self.deflections_yx_2d_via_profiles_from(
+            mass_profile_list=[
+                mass_profile
+                for galaxy in tree_galaxies
+                for mass_profile in galaxy.cls_list_from(cls=ag.mp.MassProfile)
+            ],
+            grid=grid,
+        )
+
+        deflections = vector_yx_from(values=deflections, grid=grid)
+
+        return sum(
+            [
+                deflections_func(galaxy, grid)
+                for galaxy in galaxies
+                if not is_tree_galaxy(galaxy=galaxy)
+            ],
+            deflections,
+        )
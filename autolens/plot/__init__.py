@@ -95,5 +95,21 @@ from autolens.interferometer.plot.fit_interferometer_plotters import (
 )
 from autolens.point.plot.fit_point_plotters import FitPointDatasetPlotter
 from autolens.lens.plot.tracer_plotters import TracerPlotter
-from autolens.lens.subhalo import SubhaloPlotter
-from autolens.lens.sensitivity import SubhaloSensitivityPlotter
+
+
+def __getattr__(name):
+    """
+    The subhalo plotters are imported when they are first accessed, because their modules import this package and
+    are only used for dark matter subhalo analysis.
+    """
+    if name == "SubhaloPlotter":
+        from autolens.lens.subhalo import SubhaloPlotter
+
+        return SubhaloPlotter
+
+    if name == "SubhaloSensitivityPlotter":
+        from autolens.lens.sensitivity import SubhaloSensitivityPlotter
+
+        return SubhaloSensitivityPlotter
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
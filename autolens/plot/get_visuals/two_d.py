@@ -53,6 +53,9 @@ class GetVisuals2D(gv2d.GetVisuals2D):
         (e.g. the convergence in the image plane, the source in the source plane). Therefore, quantities are only
         extracted from one plane, specified by the  input `plane_index`.
 
+        The critical curves and caustics are taken from the tracer's memoized `LensingGeometry`, so they are computed
+        once per tracer and grid and shared by every plot of the tracer.
+
         Parameters
         ----------
         tracer
@@ -94,17 +97,19 @@ class GetVisuals2D(gv2d.GetVisuals2D):
         tangential_caustics = None
         radial_caustics = None
 
+        lensing_geometry = tracer.lensing_geometry_from(grid=grid)
+
         if plane_index == 0:
             tangential_critical_curves = self.get(
                 "tangential_critical_curves",
-                tracer.tangential_critical_curve_list_from(grid=grid),
+                lensing_geometry.tangential_critical_curve_list,
                 "tangential_critical_curves",
             )
 
             radial_critical_curves = None
 
             radial_critical_curve_area_list = (
-                tracer.radial_critical_curve_area_list_from(grid=grid)
+                lensing_geometry.radial_critical_curve_area_list
             )
 
             if any(
@@ -112,20 +117,20 @@ class GetVisuals2D(gv2d.GetVisuals2D):
             ):
                 radial_critical_curves = self.get(
                     "radial_critical_curves",
-                    tracer.radial_critical_curve_list_from(grid=grid),
+                    lensing_geometry.radial_critical_curve_list,
                     "radial_critical_curves",
                 )
 
         if plane_index > 0:
             tangential_caustics = self.get(
                 "tangential_caustics",
-                tracer.tangential_caustic_list_from(grid=grid),
+                lensing_geometry.tangential_caustic_list,
                 "tangential_caustics",
             )
 
             radial_caustics = self.get(
                 "radial_caustics",
-                tracer.radial_caustic_list_from(grid=grid),
+                lensing_geometry.radial_caustic_list,
                 "radial_caustics",
             )
 
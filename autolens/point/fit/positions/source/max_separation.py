@@ -1,8 +1,158 @@
-from typing import Optional
+import numpy as np
+from typing import List, Optional
 
 import autoarray as aa
+import autogalaxy as ag
 
 from autolens.lens.tracer import Tracer
+from autolens.lens import tracer_util
+
+
+def furthest_separations_from(positions: np.ndarray) -> np.ndarray:
+    """
+    Returns the furthest distance of every (y,x) coordinate in an input array of coordinates to the other
+    coordinates.
+
+    All pairwise separations are computed in a single vectorized NumPy calculation, and the coordinates can have any
+    number of leading batch dimensions, such that the furthest separations of the positions traced by many tracers
+    (e.g. samples of a posterior) are computed in one call.
+
+    For example, for the coordinates [(0.0, 0.0), (0.0, 1.0), (0.0, 3.0)] the furthest separations are
+    [3.0, 2.0, 3.0].
+
+    Parameters
+    ----------
+    positions
+        The (y,x) coordinates whose furthest separations are returned, with shape [..., total_positions, 2].
+    """
+    positions = np.asarray(positions)
+
+    separations = positions[..., :, None, :] - positions[..., None, :, :]
+
+    return np.sqrt(np.max(np.sum(separations**2, axis=-1), axis=-1))
+
+
+def max_separation_from(positions: np.ndarray) -> float:
+    """
+    Returns the maximum separation of any two (y,x) coordinates in an input array of coordinates, which is the
+    maximum of the furthest distance of every coordinate to the other coordinates (see `furthest_separations_from`).
+
+    Parameters
+    ----------
+    positions
+        The (y,x) coordinates whose maximum separation is returned, with shape [total_positions, 2].
+    """
+    return float(np.max(furthest_separations_from(positions=positions)))
+
+
+def max_separations_via_tracer_list_from(
+    positions: aa.Grid2DIrregular, tracer_list: List[Tracer]
+) -> np.ndarray:
+    """
+    Returns the maximum separation of input positions after they are ray-traced to the source-plane of every tracer
+    in a list of tracers (e.g. samples of a posterior), for example to calibrate the threshold of a positions
+    likelihood.
+
+    The positions are ray-traced using only the galaxies with mass profiles of every tracer (see
+    `PositionsMassTracer`), and the separations of all tracers are computed in one vectorized calculation.
+
+    Parameters
+    ----------
+    positions
+        The image-plane (y,x) coordinates which are ray-traced to the source-plane of every tracer.
+    tracer_list
+        The tracers used to ray-trace the positions.
+    """
+    source_plane_positions = np.stack(
+        [
+            np.asarray(
+                PositionsMassTracer(tracer=tracer).source_plane_positions_from(
+                    positions=positions
+                )
+            )
+            for tracer in tracer_list
+        ]
+    )
+
+    return np.max(furthest_separations_from(positions=source_plane_positions), axis=-1)
+
+
+class PositionsMassTracer:
+    def __init__(self, tracer: Tracer):
+        """
+        Ray-traces positions (e.g. the multiple images of a lensed source) to the source-plane using only the galaxies
+        of a tracer which have a mass profile, for quickly checking whether the positions trace within a threshold of
+        one another (see `PositionsLHResample` and `PositionsLHPenalty`).
+
+        The planes of the tracer are computed once when this object is created, keeping only the galaxies with a
+        mass profile (light-only galaxies and planes without mass do not deflect light). The final plane is kept
+        without its galaxies, as its redshift defines the source-plane the positions are traced to, but its
+        deflection angles are not computed.
+
+        Parameters
+        ----------
+        tracer
+            The tracer whose galaxies with mass profiles are used to ray-trace the positions.
+        """
+        planes = tracer.planes
+
+        self.cosmology = tracer.cosmology
+        self.total_planes = len(planes)
+        self.has_mass_profile = any(
+            galaxies.has(cls=ag.mp.MassProfile) for galaxies in planes
+        )
+
+        self.mass_planes: List[List[ag.Galaxy]] = [
+            [galaxy for galaxy in galaxies if galaxy.has(cls=ag.mp.MassProfile)]
+            for galaxies in planes[:-1]
+        ]
+        self.mass_planes = [galaxies for galaxies in self.mass_planes if galaxies]
+
+        self.source_plane_redshift = planes[-1][0].redshift
+
+    @property
+    def has_mass(self) -> bool:
+        """
+        Whether the positions are checked for the tracer, which requires more than one plane and a galaxy with a mass
+        profile.
+        """
+        return self.total_planes > 1 and self.has_mass_profile
+
+    def source_plane_positions_from(
+        self, positions: aa.Grid2DIrregular
+    ) -> aa.Grid2DIrregular:
+        """
+        Returns the input positions ray-traced to the final plane of the tracer via a single multi-plane ray-tracing
+        calculation using only the galaxies with a mass profile.
+
+        Parameters
+        ----------
+        positions
+            The image-plane (y,x) coordinates which are ray-traced to the source-plane.
+        """
+        planes = self.mass_planes + [[ag.Galaxy(redshift=self.source_plane_redshift)]]
+
+        return tracer_util.traced_grid_2d_list_from(
+            planes=planes,
+            grid=positions,
+            cosmology=self.cosmology,
+            plane_index_limit=len(planes) - 1,
+        )[-1]
+
+    def max_separation_of_source_plane_positions_from(
+        self, positions: aa.Grid2DIrregular
+    ) -> float:
+        """
+        Returns the maximum separation of the input positions after they are ray-traced to the source-plane.
+
+        Parameters
+        ----------
+        positions
+            The image-plane (y,x) coordinates which are ray-traced to the source-plane.
+        """
+        return max_separation_from(
+            positions=self.source_plane_positions_from(positions=positions)
+        )
 
 
 class FitPositionsSourceMaxSeparation:
@@ -48,17 +198,21 @@ class FitPositionsSourceMaxSeparation:
 
         source_plane_positions = [3.0, 2.0, 3.0]
 
+        The distances are computed in a single vectorized calculation (see `furthest_separations_from`).
+
         Returns
         -------
         aa.ArrayIrregular
             The further distances of every set of grouped source-plane coordinates the other source-plane coordinates
             that it is grouped with.
         """
-        return self.source_plane_positions.furthest_distances_to_other_coordinates
+        return aa.ArrayIrregular(
+            values=furthest_separations_from(positions=self.source_plane_positions)
+        )
 
     @property
     def max_separation_of_source_plane_positions(self) -> float:
-        return max(self.furthest_separations_of_source_plane_positions)
+        return max_separation_from(positions=self.source_plane_positions)
 
     def max_separation_within_threshold(self, threshold) -> bool:
         return self.max_separation_of_source_plane_positions <= threshold
@@ -1,8 +1,6 @@
 import autofit as af
 import autogalaxy as ag
 
-from autolens.point.model.plotter_interface import PlotterInterfacePoint
-
 
 class VisualizerPoint(af.Visualizer):
     @staticmethod
@@ -26,6 +24,8 @@ class VisualizerPoint(af.Visualizer):
             the imaging data.
         """
 
+        from autolens.point.model.plotter_interface import PlotterInterfacePoint
+
         plotter_interface = PlotterInterfacePoint(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -67,6 +67,8 @@ class VisualizerPoint(af.Visualizer):
         """
         fit = analysis.fit_from(instance=instance)
 
+        from autolens.point.model.plotter_interface import PlotterInterfacePoint
+
         plotter_interface = PlotterInterfacePoint(
             image_path=paths.image_path, title_prefix=analysis.title_prefix
         )
@@ -1,17 +1,20 @@
 import logging
-from typing import Tuple, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Tuple, Optional
 
 from autoarray.numpy_wrapper import np
 
 import autoarray as aa
 from autoarray.numpy_wrapper import use_jax
+from autoarray.structures.triangles.abstract import AbstractTriangles
 from autoarray.structures.triangles.shape import Point
 
 from autofit.jax_wrapper import jit, register_pytree_node_class
 from autogalaxy import OperateDeflections
 from .shape_solver import AbstractSolver
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +26,7 @@ class PointSolver(AbstractSolver):
         tracer: OperateDeflections,
         source_plane_coordinate: Tuple[float, float],
         source_plane_redshift: Optional[float] = None,
+        initial_source_triangles: Optional[AbstractTriangles] = None,
     ) -> aa.Grid2DIrregular:
         """
         Solve for the image plane coordinates that are traced to the source plane coordinate.
@@ -42,6 +46,9 @@ class PointSolver(AbstractSolver):
             The tracer that traces the image plane coordinates to the source plane
         source_plane_redshift
             The redshift of the source plane coordinate.
+        initial_source_triangles
+            The initial triangles traced to the source plane (see `initial_source_triangles_from`), which if input
+            are used instead of tracing the initial triangles again.
 
         Returns
         -------
@@ -51,8 +58,25 @@ class PointSolver(AbstractSolver):
             tracer=tracer,
             shape=Point(*source_plane_coordinate),
             source_plane_redshift=source_plane_redshift,
+            initial_source_triangles=initial_source_triangles,
         )
 
+        return self._multiple_images_from(tracer=tracer, kept_triangles=kept_triangles)
+
+    def _multiple_images_from(
+        self, tracer: OperateDeflections, kept_triangles: AbstractTriangles
+    ) -> aa.Grid2DIrregular:
+        """
+        Returns the means of the triangles kept by the final step of the solver, filtered to keep only those with an
+        absolute magnification above the threshold.
+
+        Parameters
+        ----------
+        tracer
+            The tracer that traces the image plane coordinates to the source plane
+        kept_triangles
+            The triangles of the final step which contain the source plane coordinate.
+        """
         filtered_means = self._filter_low_magnification(
             tracer=tracer, points=kept_triangles.means
         )
@@ -76,3 +100,108 @@ class PointSolver(AbstractSolver):
         return aa.Grid2DIrregular(
             [pair for pair in filtered_means if not np.isnan(pair).all()]
         )
+
+    def solve_with_info(
+        self,
+        tracer: OperateDeflections,
+        source_plane_coordinate: Tuple[float, float],
+        source_plane_redshift: Optional[float] = None,
+    ) -> Tuple[aa.Grid2DIrregular, Dict]:
+        """
+        Solve for the image plane coordinates that are traced to the source plane coordinate (see `solve`), also
+        returning a dictionary with the total number of triangles traced to the source plane over all steps and the
+        time the solve took.
+
+        This is used to compare the cost of solvers with different initial triangles, for example a solver tiling
+        the full image plane with a coarse solver seeded around the critical curves.
+
+        Parameters
+        ----------
+        tracer
+            The tracer that traces the image plane coordinates to the source plane
+        source_plane_coordinate
+            The source plane coordinate to trace to the image plane.
+        source_plane_redshift
+            The redshift of the source plane coordinate.
+        """
+        start = time.time()
+
+        steps = list(
+            self.steps(
+                tracer=tracer,
+                shape=Point(*source_plane_coordinate),
+                source_plane_redshift=source_plane_redshift,
+            )
+        )
+
+        multiple_images = self._multiple_images_from(
+            tracer=tracer, kept_triangles=steps[-1].filtered_triangles
+        )
+
+        info_dict = {
+            "initial_triangles": len(self.initial_triangles),
+            "total_triangles": sum(len(step.initial_triangles) for step in steps),
+            "time": time.time() - start,
+        }
+
+        return multiple_images, info_dict
+
+    def solve_first_multiple_images_from(
+        self,
+        tracer: OperateDeflections,
+        source_plane_coordinate_list: List[Tuple[float, float]],
+        source_plane_redshift: Optional[float] = None,
+        number_of_cores: int = 1,
+    ) -> Optional[aa.Grid2DIrregular]:
+        """
+        Solve for the image plane coordinates of a list of source plane coordinates, returning those of the first
+        coordinate in the list which forms multiple images.
+
+        The initial triangles tiling the image plane are the same for every coordinate, therefore they are traced to
+        the source plane once and shared by every solve.
+
+        If `number_of_cores` is above 1, coordinates are solved in batches of this size in a thread pool. The batches
+        are solved in the order of the list and the search stops at the first batch containing a coordinate which
+        forms multiple images, so the result is the same as solving every coordinate in order.
+
+        Parameters
+        ----------
+        tracer
+            The tracer that traces the image plane coordinates to the source plane
+        source_plane_coordinate_list
+            The source plane coordinates to trace to the image plane, in the order they are searched.
+        source_plane_redshift
+            The redshift of the source plane coordinates.
+        number_of_cores
+            The number of threads used to solve the coordinates.
+
+        Returns
+        -------
+        The image plane coordinates of the first source plane coordinate which forms multiple images, or None if no
+        coordinate forms multiple images.
+        """
+        func = partial(
+            self.solve,
+            tracer,
+            source_plane_redshift=source_plane_redshift,
+            initial_source_triangles=self.initial_source_triangles_from(
+                tracer=tracer, source_plane_redshift=source_plane_redshift
+            ),
+        )
+
+        batch_size = max(number_of_cores, 1)
+
+        for index in range(0, len(source_plane_coordinate_list), batch_size):
+            coordinate_list = source_plane_coordinate_list[index : index + batch_size]
+
+            if batch_size > 1 and len(coordinate_list) > 1:
+                with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                    multiple_images_list = list(executor.map(func, coordinate_list))
+            else:
+                multiple_images_list = [func(coordinate_list[0])]
+
+            for multiple_images in multiple_images_list:
+                if len(multiple_images.in_list) > 1:
+                    return multiple_images
+
+        return None
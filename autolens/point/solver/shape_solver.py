@@ -31,6 +31,7 @@ except ImportError:
 from autoarray.structures.triangles.abstract import AbstractTriangles
 
 from autogalaxy import OperateDeflections
+from autolens import profiling
 from .step import Step
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ class AbstractSolver:
         pixel_scale_precision: float,
         magnification_threshold=0.1,
         neighbor_degree: int = 1,
+        seed_magnification: Optional[float] = None,
     ):
         """
         Determine the image plane coordinates that are traced to be a source plane coordinate.
@@ -60,11 +62,17 @@ class AbstractSolver:
             the source plane coordinate.
         pixel_scale_precision
             The target pixel scale of the image grid.
+        seed_magnification
+            If input, the first step also keeps every initial triangle whose magnification, estimated as the ratio of
+            its image plane and source plane areas, is above this value. These triangles lie on or near the critical
+            curves, where the mapping folds and coarse triangles can miss multiple images, which makes it safe to
+            start from coarser initial triangles.
         """
         self.scale = scale
         self.pixel_scale_precision = pixel_scale_precision
         self.magnification_threshold = magnification_threshold
         self.neighbor_degree = neighbor_degree
+        self.seed_magnification = seed_magnification
 
         self.initial_triangles = initial_triangles
 
@@ -78,6 +86,8 @@ class AbstractSolver:
         array_triangles_cls: Type[AbstractTriangles] = CoordinateArrayTriangles,
         max_containing_size=MAX_CONTAINING_SIZE,
         neighbor_degree: int = 1,
+        coarse_factor: int = 1,
+        seed_magnification: Optional[float] = None,
     ):
         """
         Create a solver for a given grid.
@@ -100,12 +110,18 @@ class AbstractSolver:
             We need to know this in advance to allocate memory for the JAX array.
         neighbor_degree
             The number of times recursively add neighbors for the triangles that contain
+        coarse_factor
+            The side length of the initial triangles is the pixel scale of the grid multiplied by this factor, where
+            values above 1 give fewer initial triangles which take more steps to subdivide.
+        seed_magnification
+            If input, the first step also keeps initial triangles whose magnification is above this value (see
+            `AbstractSolver.__init__`), which should be used with a `coarse_factor` above 1.
 
         Returns
         -------
         The solver.
         """
-        scale = grid.pixel_scale
+        scale = grid.pixel_scale * coarse_factor
 
         y = grid[:, 0]
         x = grid[:, 1]
@@ -126,6 +142,7 @@ class AbstractSolver:
             array_triangles_cls=array_triangles_cls,
             max_containing_size=max_containing_size,
             neighbor_degree=neighbor_degree,
+            seed_magnification=seed_magnification,
         )
 
     @classmethod
@@ -141,6 +158,7 @@ class AbstractSolver:
         array_triangles_cls: Type[AbstractTriangles] = CoordinateArrayTriangles,
         max_containing_size=MAX_CONTAINING_SIZE,
         neighbor_degree: int = 1,
+        seed_magnification: Optional[float] = None,
     ):
         """
         Create a solver for a given grid.
@@ -168,6 +186,9 @@ class AbstractSolver:
             We need to know this in advance to allocate memory for the JAX array.
         neighbor_degree
             The number of times recursively add neighbors for the triangles that contain
+        seed_magnification
+            If input, the first step also keeps initial triangles whose magnification is above this value (see
+            `AbstractSolver.__init__`).
 
         Returns
         -------
@@ -188,6 +209,7 @@ class AbstractSolver:
             pixel_scale_precision=pixel_scale_precision,
             magnification_threshold=magnification_threshold,
             neighbor_degree=neighbor_degree,
+            seed_magnification=seed_magnification,
         )
 
     @property
@@ -230,12 +252,38 @@ class AbstractSolver:
         # noinspection PyTypeChecker
         return grid.grid_2d_via_deflection_grid_from(deflection_grid=deflections)
 
+    def initial_source_triangles_from(
+        self,
+        tracer: OperateDeflections,
+        source_plane_redshift: Optional[float] = None,
+    ) -> AbstractTriangles:
+        """
+        Returns the initial triangles tiling the image plane with their vertices traced to the source plane.
+
+        The initial triangles are the same for every source plane shape, therefore when the solver is used for
+        many shapes (e.g. many source plane coordinates) for the same tracer, they can be traced once via this
+        method and passed to `solve_triangles` as `initial_source_triangles`.
+
+        Parameters
+        ----------
+        tracer
+            The tracer to use to trace the image plane coordinates to the source plane.
+        source_plane_redshift
+            The redshift of the source plane.
+        """
+        return self._source_triangles(
+            tracer=tracer,
+            triangles=self.initial_triangles,
+            source_plane_redshift=source_plane_redshift,
+        )
+
     @jit
     def solve_triangles(
         self,
         tracer: OperateDeflections,
         shape: Shape,
         source_plane_redshift: Optional[float] = None,
+        initial_source_triangles: Optional[AbstractTriangles] = None,
     ) -> AbstractTriangles:
         """
         Solve for the image plane coordinates that are traced to the source plane coordinate.
@@ -255,6 +303,9 @@ class AbstractSolver:
             The shape in the source plane for which we want to identify the image plane coordinates.
         source_plane_redshift
             The redshift of the source plane.
+        initial_source_triangles
+            The initial triangles traced to the source plane (see `initial_source_triangles_from`), which if input
+            are used instead of tracing the initial triangles again.
 
         Returns
         -------
@@ -270,11 +321,13 @@ class AbstractSolver:
                 tracer=tracer,
                 shape=shape,
                 source_plane_redshift=source_plane_redshift,
+                initial_source_triangles=initial_source_triangles,
             )
         )
         final_step = steps[-1]
         return final_step.filtered_triangles
 
+    @profiling.profile()
     def _filter_low_magnification(
         self, tracer: OperateDeflections, points: List[Tuple[float, float]]
     ) -> List[Tuple[float, float]]:
@@ -298,6 +351,39 @@ class AbstractSolver:
         mask = np.abs(magnifications.array) > self.magnification_threshold
         return np.where(mask[:, None], points, np.nan)
 
+    def _magnified_indices_from(
+        self,
+        triangles: aa.AbstractTriangles,
+        source_triangles: aa.AbstractTriangles,
+    ) -> np.ndarray:
+        """
+        Returns the indices of the triangles whose magnification, estimated as the ratio of their image plane area
+        to the area of their vertices traced to the source plane, is above the `seed_magnification`.
+
+        Triangles which straddle a critical curve are folded by the mapping to the source plane, so have a small
+        source plane area and therefore a high estimated magnification.
+
+        Parameters
+        ----------
+        triangles
+            The image plane triangles.
+        source_triangles
+            The same triangles with their vertices traced to the source plane.
+        """
+
+        def area_from(vertices):
+            return 0.5 * np.abs(
+                (vertices[:, 1, 0] - vertices[:, 0, 0])
+                * (vertices[:, 2, 1] - vertices[:, 0, 1])
+                - (vertices[:, 2, 0] - vertices[:, 0, 0])
+                * (vertices[:, 1, 1] - vertices[:, 0, 1])
+            )
+
+        return np.where(
+            area_from(triangles.triangles)
+            > self.seed_magnification * area_from(source_triangles.triangles)
+        )[0]
+
     def _source_triangles(
         self,
         tracer: OperateDeflections,
@@ -319,6 +405,7 @@ class AbstractSolver:
         tracer: OperateDeflections,
         shape: Shape,
         source_plane_redshift: Optional[float] = None,
+        initial_source_triangles: Optional[AbstractTriangles] = None,
     ) -> Iterator[Step]:
         """
         Iterate over the steps of the triangle solver algorithm.
@@ -331,6 +418,9 @@ class AbstractSolver:
             The redshift of the source plane.
         shape
             The shape in the source plane for which we want to identify the image plane coordinates.
+        initial_source_triangles
+            The initial triangles traced to the source plane (see `initial_source_triangles_from`), which if input
+            are used for the first step instead of tracing the initial triangles again.
 
         Returns
         -------
@@ -338,20 +428,35 @@ class AbstractSolver:
         """
         initial_triangles = self.initial_triangles
         for number in range(self.n_steps):
-            source_triangles = self._source_triangles(
-                tracer=tracer,
-                triangles=initial_triangles,
-                source_plane_redshift=source_plane_redshift,
-            )
-
-            indexes = source_triangles.containing_indices(shape=shape)
-            kept_triangles = initial_triangles.for_indexes(indexes=indexes)
-
-            neighbourhood = kept_triangles
-            for _ in range(self.neighbor_degree):
-                neighbourhood = neighbourhood.neighborhood()
-
-            up_sampled = neighbourhood.up_sample()
+            with profiling.section(name=lambda: f"solver_step_{number}"):
+                if number == 0 and initial_source_triangles is not None:
+                    source_triangles = initial_source_triangles
+                else:
+                    with profiling.section(name="trace_triangles"):
+                        source_triangles = self._source_triangles(
+                            tracer=tracer,
+                            triangles=initial_triangles,
+                            source_plane_redshift=source_plane_redshift,
+                        )
+
+                indexes = source_triangles.containing_indices(shape=shape)
+
+                if number == 0 and self.seed_magnification is not None:
+                    indexes = np.union1d(
+                        indexes,
+                        self._magnified_indices_from(
+                            triangles=initial_triangles,
+                            source_triangles=source_triangles,
+                        ),
+                    )
+
+                kept_triangles = initial_triangles.for_indexes(indexes=indexes)
+
+                neighbourhood = kept_triangles
+                for _ in range(self.neighbor_degree):
+                    neighbourhood = neighbourhood.neighborhood()
+
+                up_sampled = neighbourhood.up_sample()
 
             yield Step(
                 number=number,
@@ -370,6 +475,8 @@ class AbstractSolver:
             self.pixel_scale_precision,
             self.magnification_threshold,
             self.initial_triangles,
+            self.neighbor_degree,
+            self.seed_magnification,
         )
 
     @classmethod
@@ -379,6 +486,8 @@ class AbstractSolver:
             pixel_scale_precision=aux_data[1],
             magnification_threshold=aux_data[2],
             initial_triangles=aux_data[3],
+            neighbor_degree=aux_data[4],
+            seed_magnification=aux_data[5],
         )
 
 
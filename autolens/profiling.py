@@ -0,0 +1,186 @@
+import os
+import threading
+import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Union
+
+_profiler = None
+
+_null_section = nullcontext()
+
+
+class HierarchicalProfiler:
+    def __init__(self):
+        """
+        Records how long the functions and code blocks marked with the `profile` decorator and `section` context
+        manager of this module take, keeping track of which are called inside one another.
+
+        Every call is recorded under its stack, the names of all sections it is nested inside joined with a `;`
+        (e.g. `fit_from;traced_grid_2d_list_from;plane_0;Isothermal+ExternalShear`), such that the time spent on
+        every part of a calculation can be attributed to its callers.
+
+        Profiling is enabled by using the profiler as a context manager, for example:
+
+        with HierarchicalProfiler() as profiler:
+            fit = analysis.fit_from(instance=instance)
+
+        When no profiler is active, the `profile` decorator and `section` context manager only check a module level
+        variable, so the hooks placed on the hot paths of the `Tracer`, `TracerToInversion` and `PointSolver` have
+        near-zero overhead in a model-fit.
+
+        Only calls made in the thread which entered the profiler are recorded.
+
+        The recorded stacks can be output in the collapsed stack format read by flame graph tools (e.g. `flamegraph.pl`,
+        `speedscope`, `inferno`) via `output_flame_graph`.
+        """
+        self.time_dict = {}
+        self.calls_dict = {}
+
+        self.thread_id = None
+
+        self._stack = []
+        self._previous_profiler = None
+
+    def __enter__(self) -> "HierarchicalProfiler":
+        global _profiler
+
+        self.thread_id = threading.get_ident()
+
+        self._previous_profiler = _profiler
+        _profiler = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _profiler
+
+        _profiler = self._previous_profiler
+        self._previous_profiler = None
+
+    def push(self, name: str):
+        self._stack.append(name)
+
+    def pop(self, elapsed: float):
+        key = ";".join(self._stack)
+
+        self.time_dict[key] = self.time_dict.get(key, 0.0) + elapsed
+        self.calls_dict[key] = self.calls_dict.get(key, 0) + 1
+
+        self._stack.pop()
+
+    @property
+    def self_time_dict(self) -> Dict[str, float]:
+        """
+        The time of every stack excluding the time spent in the sections nested directly inside it.
+        """
+        self_time_dict = dict(self.time_dict)
+
+        for key, value in self.time_dict.items():
+            parent_key = key.rpartition(";")[0]
+
+            if parent_key in self_time_dict:
+                self_time_dict[parent_key] -= value
+
+        return {key: max(value, 0.0) for key, value in self_time_dict.items()}
+
+    @property
+    def flame_graph_list(self) -> List[str]:
+        """
+        The lines of a flame graph of the recorded stacks in the collapsed stack format, where every line is a stack
+        followed by its self time in integer microseconds.
+        """
+        return [
+            f"{key} {int(round(1e6 * value))}"
+            for key, value in self.self_time_dict.items()
+        ]
+
+    def output_flame_graph(self, file_path: str):
+        """
+        Output the recorded stacks to a file in the collapsed stack format (see `flame_graph_list`).
+
+        Parameters
+        ----------
+        file_path
+            The path of the file the flame graph is output to.
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "w+") as f:
+            f.write("\n".join(self.flame_graph_list) + "\n")
+
+
+class Section:
+    def __init__(self, profiler: HierarchicalProfiler, name: str):
+        """
+        A code block timed by a `HierarchicalProfiler`, created via the `section` function.
+        """
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.profiler.push(name=self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.pop(elapsed=time.perf_counter() - self.start)
+
+
+def active_profiler() -> Optional[HierarchicalProfiler]:
+    """
+    Returns the `HierarchicalProfiler` recording calls made in the current thread, or None if profiling is disabled.
+    """
+    if _profiler is None or _profiler.thread_id != threading.get_ident():
+        return None
+
+    return _profiler
+
+
+def section(name: Union[str, Callable[[], str]]):
+    """
+    Returns a context manager which times the code block it wraps in the active `HierarchicalProfiler`, or a
+    context manager which does nothing if profiling is disabled.
+
+    Parameters
+    ----------
+    name
+        The name of the section in the profiler's stacks, or a function with no arguments returning it, which is only
+        called if profiling is enabled and therefore can be used for names that are expensive to create (e.g. those
+        which list the mass profiles of a galaxy).
+    """
+    if _profiler is None:
+        return _null_section
+
+    profiler = active_profiler()
+
+    if profiler is None:
+        return _null_section
+
+    return Section(profiler=profiler, name=name() if callable(name) else name)
+
+
+def profile(name: Optional[str] = None):
+    """
+    Decorates a function or method such that every call is timed in the active `HierarchicalProfiler`.
+
+    Parameters
+    ----------
+    name
+        The name of the function in the profiler's stacks, which defaults to the name of the function.
+    """
+
+    def decorator(func: Callable):
+        section_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+
+            with section(name=section_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
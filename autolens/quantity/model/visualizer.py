@@ -4,7 +4,6 @@ import autofit as af
 
 from autogalaxy.quantity.model.plotter_interface import PlotterInterfaceQuantity
 
-from autolens.analysis.plotter_interface import PlotterInterface
 from autogalaxy.quantity.plot.fit_quantity_plotters import FitQuantityPlotter
 
 
@@ -53,6 +52,8 @@ class VisualizerQuantity(af.Visualizer):
             fit=fit, fit_quanaity_plotter_cls=FitQuantityPlotter
         )
 
+        from autolens.analysis.plotter_interface import PlotterInterface
+
         plotter_interface = PlotterInterface(image_path=paths.image_path)
         plotter_interface.tracer(
             tracer=fit.tracer,
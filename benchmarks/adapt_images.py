@@ -0,0 +1,97 @@
+"""
+Benchmark: Adapt Image Lookup Overhead
+======================================
+
+Times the per-sample overhead of pairing the adapt images of an analysis with the galaxy instances of every
+likelihood evaluation, comparing searching every galaxy of the instance (`AdaptImages.updated_via_instance_from`)
+with looking up each galaxy via the model paths resolved in `modify_before_fit`.
+
+Run from the root of the repository:
+
+ python benchmarks/adapt_images.py --samples 1000 --galaxies 5
+"""
+
+import argparse
+import time
+
+import autofit as af
+import autolens as al
+
+
+def make_model(total_galaxies):
+    pixelization = al.Pixelization(mesh=al.mesh.Rectangular())
+
+    extra_galaxies = {
+        f"extra_{index}": af.Model(
+            al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph, light=al.lp.SersicSph
+        )
+        for index in range(total_galaxies)
+    }
+
+    return af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(
+                al.Galaxy,
+                redshift=0.5,
+                mass=al.mp.Isothermal,
+                shear=al.mp.ExternalShear,
+            ),
+            source=af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization),
+        ),
+        extra_galaxies=af.Collection(**extra_galaxies),
+    )
+
+
+def main(total_samples: int, total_galaxies: int):
+    mask = al.Mask2D.circular(shape_native=(100, 100), pixel_scales=0.1, radius=3.0)
+
+    dataset = al.Imaging(
+        data=al.Array2D.ones(shape_native=(100, 100), pixel_scales=0.1),
+        noise_map=al.Array2D.ones(shape_native=(100, 100), pixel_scales=0.1),
+    ).apply_mask(mask=mask)
+
+    model = make_model(total_galaxies=total_galaxies)
+
+    image = al.Array2D.ones(shape_native=(100, 100), pixel_scales=0.1).apply_mask(
+        mask=mask
+    )
+
+    analysis = al.AnalysisImaging(dataset=dataset)
+    analysis._adapt_images = al.AdaptImages(
+        galaxy_name_image_dict={
+            str(("galaxies", "lens")): image,
+            str(("galaxies", "source")): image,
+        }
+    )
+
+    instance_list = [model.random_instance() for _ in range(total_samples)]
+
+    start = time.time()
+
+    for instance in instance_list:
+        analysis.adapt_images_via_instance_from(instance=instance)
+
+    time_via_search = (time.time() - start) / total_samples
+
+    analysis.adapt_image_path_list = analysis.adapt_image_path_list_from(model=model)
+
+    start = time.time()
+
+    for instance in instance_list:
+        analysis.adapt_images_via_instance_from(instance=instance)
+
+    time_via_path = (time.time() - start) / total_samples
+
+    print(f"Samples: {total_samples}, Extra Galaxies: {total_galaxies}")
+    print(f"Via instance search: {1e6 * time_via_search:.1f} us per sample")
+    print(f"Via model paths: {1e6 * time_via_path:.1f} us per sample")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--galaxies", type=int, default=5)
+
+    args = parser.parse_args()
+
+    main(total_samples=args.samples, total_galaxies=args.galaxies)
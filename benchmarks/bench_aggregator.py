@@ -0,0 +1,90 @@
+import os
+from os import path
+
+import pytest
+
+import autofit as af
+import autolens as al
+from autoconf import conf
+from autoconf.conf import with_config
+from autofit.non_linear.samples import Sample
+
+
+@with_config(
+    "general",
+    "output",
+    "samples_to_csv",
+    value=True,
+)
+def fit_via_mock_search(model, samples, analysis):
+    search = al.m.MockSearch(
+        samples=samples, result=al.m.MockResult(model=model, samples=samples)
+    )
+    search.paths = af.DirectoryPaths(path_prefix="benchmark")
+    search.fit(model=model, analysis=analysis)
+
+
+@pytest.fixture(name="aggregator", scope="module")
+def make_aggregator(tmp_path_factory, masked_imaging):
+    output_path = str(tmp_path_factory.mktemp("output"))
+
+    os.environ["PYAUTOFIT_TEST_MODE"] = "1"
+
+    conf.instance.push(
+        new_path=path.join(
+            path.dirname(path.dirname(path.realpath(__file__))),
+            "test_autolens",
+            "config",
+        ),
+        output_path=output_path,
+    )
+
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(
+                al.Galaxy,
+                redshift=0.5,
+                bulge=al.lp.Sersic,
+                mass=al.mp.Isothermal,
+            ),
+            source=af.Model(al.Galaxy, redshift=1.0, bulge=al.lp.Sersic),
+        ),
+    )
+
+    sample_list = Sample.from_lists(
+        model=model,
+        parameter_lists=[model.prior_count * [0.5], model.prior_count * [1.0]],
+        log_likelihood_list=[1.0, 2.0],
+        log_prior_list=[0.0, 0.0],
+        weight_list=[0.5, 0.5],
+    )
+
+    samples = al.m.MockSamples(
+        model=model,
+        sample_list=sample_list,
+        prior_means=[1.0] * model.prior_count,
+    )
+
+    fit_via_mock_search(
+        model=model,
+        samples=samples,
+        analysis=al.AnalysisImaging(dataset=masked_imaging),
+    )
+
+    aggregator = af.Aggregator.from_database(
+        filename=path.join(output_path, "benchmark.sqlite")
+    )
+    aggregator.add_directory(directory=path.join(output_path, "benchmark"))
+
+    yield aggregator
+
+    del os.environ["PYAUTOFIT_TEST_MODE"]
+
+
+def bench_aggregator_fit_imaging(benchmark, aggregator):
+    def func():
+        fit_agg = al.agg.FitImagingAgg(aggregator=aggregator)
+
+        return list(fit_agg.max_log_likelihood_gen_from())
+
+    benchmark(func)
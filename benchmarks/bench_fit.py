@@ -0,0 +1,35 @@
+import autolens as al
+
+
+def bench_fit_imaging_parametric(benchmark, masked_imaging, tracer):
+    benchmark(
+        lambda: al.FitImaging(dataset=masked_imaging, tracer=tracer).figure_of_merit
+    )
+
+
+def bench_fit_imaging_pixelized(
+    benchmark, masked_imaging, tracer_pixelized, settings_inversion
+):
+    benchmark(
+        lambda: al.FitImaging(
+            dataset=masked_imaging,
+            tracer=tracer_pixelized,
+            settings_inversion=settings_inversion,
+        ).figure_of_merit
+    )
+
+
+def bench_fit_interferometer_dft(benchmark, interferometer_dft, tracer):
+    benchmark(
+        lambda: al.FitInterferometer(
+            dataset=interferometer_dft, tracer=tracer
+        ).figure_of_merit
+    )
+
+
+def bench_fit_interferometer_nufft(benchmark, interferometer_nufft, tracer):
+    benchmark(
+        lambda: al.FitInterferometer(
+            dataset=interferometer_nufft, tracer=tracer
+        ).figure_of_merit
+    )
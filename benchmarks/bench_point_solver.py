@@ -0,0 +1,9 @@
+import autolens as al
+
+
+def bench_point_solver_solve(benchmark, tracer):
+    grid = al.Grid2D.uniform(shape_native=(100, 100), pixel_scales=0.05)
+
+    solver = al.PointSolver.for_grid(grid=grid, pixel_scale_precision=0.001)
+
+    benchmark(solver.solve, tracer=tracer, source_plane_coordinate=(0.07, 0.07))
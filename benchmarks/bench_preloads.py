@@ -0,0 +1,18 @@
+import autolens as al
+
+
+def bench_preloads_setup_all_via_fits(
+    benchmark, masked_imaging, tracer_pixelized, settings_inversion
+):
+    fit_0 = al.FitImaging(
+        dataset=masked_imaging,
+        tracer=tracer_pixelized,
+        settings_inversion=settings_inversion,
+    )
+    fit_1 = al.FitImaging(
+        dataset=masked_imaging,
+        tracer=tracer_pixelized,
+        settings_inversion=settings_inversion,
+    )
+
+    benchmark(al.Preloads.setup_all_via_fits, fit_0=fit_0, fit_1=fit_1)
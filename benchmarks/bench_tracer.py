@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+from conftest import tracer_with_planes_from
+
+
+def bench_image_2d_from(benchmark, tracer, grid):
+    benchmark(tracer.image_2d_from, grid=grid)
+
+
+@pytest.mark.parametrize("total_planes", [2, 5, 30])
+def bench_traced_grid_2d_list_from(benchmark, grid, total_planes):
+    tracer = tracer_with_planes_from(total_planes=total_planes)
+
+    benchmark(tracer.traced_grid_2d_list_from, grid=grid)
+
+
+@pytest.mark.parametrize("total_halos", [100, 1000])
+def bench_deflections_yx_2d_from__tree_deflections(benchmark, grid, total_halos):
+    centres = np.random.uniform(-5.0, 5.0, (total_halos, 2))
+
+    galaxies = [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.NFWTruncatedSph(
+                centre=tuple(centre),
+                kappa_s=0.05,
+                scale_radius=0.05,
+                truncation_radius=0.3,
+            ),
+        )
+        for centre in centres
+    ] + [al.Galaxy(redshift=1.0)]
+
+    tracer = al.Tracer(
+        galaxies=galaxies, tree_deflections=al.TreeDeflections(halo_threshold=1)
+    )
+
+    benchmark(tracer.deflections_yx_2d_from, grid=grid)
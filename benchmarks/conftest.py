@@ -0,0 +1,163 @@
+"""
+Benchmark Suite
+===============
+
+Times the hot paths of lens modeling (ray-tracing, fits to imaging and interferometer data, the point solver,
+preloads and the aggregator) with `pytest-benchmark`, using synthetic datasets simulated with fixed seeds so that
+every run times identical calculations.
+
+Run from the root of the repository, saving the results as a JSON file in `.benchmarks`:
+
+ python -m pytest benchmarks --benchmark-autosave
+
+Compare a run with the last saved run, failing if any benchmark's median slows down by more than 10%:
+
+ python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+
+The JSON of a run can also be output to a chosen file (e.g. to track results between releases) with
+`--benchmark-json=<file>`, and two saved runs compared offline with `pytest-benchmark compare`.
+
+The scripts in this folder (e.g. `likelihood_cascade.py`) are standalone comparisons of a new feature against the
+calculation it replaces and are not part of the suite.
+"""
+
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+@pytest.fixture(autouse=True)
+def set_seed():
+    np.random.seed(1)
+
+
+@pytest.fixture(name="mask", scope="session")
+def make_mask():
+    return al.Mask2D.circular(shape_native=(60, 60), pixel_scales=0.1, radius=2.5)
+
+
+@pytest.fixture(name="grid", scope="session")
+def make_grid(mask):
+    return al.Grid2D.from_mask(
+        mask=mask, over_sampling=al.OverSamplingUniform(sub_size=2)
+    )
+
+
+@pytest.fixture(name="tracer", scope="session")
+def make_tracer():
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=0.1, effective_radius=0.8, sersic_index=4.0),
+        mass=al.mp.Isothermal(einstein_radius=1.6, ell_comps=(0.05, 0.05)),
+        shear=al.mp.ExternalShear(gamma_1=0.05, gamma_2=0.05),
+    )
+
+    source = al.Galaxy(
+        redshift=1.0,
+        bulge=al.lp.Sersic(
+            centre=(0.1, 0.1), intensity=1.0, effective_radius=0.2, sersic_index=1.0
+        ),
+    )
+
+    return al.Tracer(galaxies=[lens, source])
+
+
+def tracer_with_planes_from(total_planes: int) -> al.Tracer:
+    """
+    Returns a tracer with a galaxy with a mass profile in every plane but the last, which contains the source.
+    """
+    redshift_list = np.linspace(0.2, 2.0, total_planes)
+
+    galaxies = [
+        al.Galaxy(
+            redshift=redshift,
+            mass=al.mp.IsothermalSph(
+                centre=(0.1 * index, -0.1 * index), einstein_radius=0.1
+            ),
+        )
+        for index, redshift in enumerate(redshift_list[:-1])
+    ]
+
+    galaxies.append(
+        al.Galaxy(redshift=redshift_list[-1], light=al.lp.SersicSph(intensity=1.0))
+    )
+
+    return al.Tracer(galaxies=galaxies)
+
+
+@pytest.fixture(name="masked_imaging", scope="session")
+def make_masked_imaging(mask, tracer):
+    simulator = al.SimulatorImaging(
+        exposure_time=300.0,
+        psf=al.Kernel2D.from_gaussian(
+            shape_native=(11, 11), sigma=0.1, pixel_scales=mask.pixel_scales
+        ),
+        background_sky_level=0.1,
+        add_poisson_noise=True,
+        noise_seed=1,
+    )
+
+    grid = al.Grid2D.uniform(
+        shape_native=mask.shape_native, pixel_scales=mask.pixel_scales
+    )
+
+    dataset = simulator.via_tracer_from(tracer=tracer, grid=grid)
+
+    return dataset.apply_mask(mask=mask)
+
+
+def interferometer_from(mask, tracer, transformer_class):
+    simulator = al.SimulatorInterferometer(
+        uv_wavelengths=np.random.RandomState(seed=1).uniform(
+            low=-1.0e5, high=1.0e5, size=(1000, 2)
+        ),
+        exposure_time=300.0,
+        noise_sigma=0.1,
+        transformer_class=transformer_class,
+        noise_seed=1,
+    )
+
+    grid = al.Grid2D.from_mask(mask=mask)
+
+    dataset = simulator.via_tracer_from(tracer=tracer, grid=grid)
+
+    return al.Interferometer(
+        data=dataset.data,
+        noise_map=dataset.noise_map,
+        uv_wavelengths=dataset.uv_wavelengths,
+        real_space_mask=mask,
+        transformer_class=transformer_class,
+    )
+
+
+@pytest.fixture(name="interferometer_dft", scope="session")
+def make_interferometer_dft(mask, tracer):
+    return interferometer_from(
+        mask=mask, tracer=tracer, transformer_class=al.TransformerDFT
+    )
+
+
+@pytest.fixture(name="interferometer_nufft", scope="session")
+def make_interferometer_nufft(mask, tracer):
+    return interferometer_from(
+        mask=mask, tracer=tracer, transformer_class=al.TransformerNUFFT
+    )
+
+
+@pytest.fixture(name="tracer_pixelized", scope="session")
+def make_tracer_pixelized(tracer):
+    source = al.Galaxy(
+        redshift=1.0,
+        pixelization=al.Pixelization(
+            mesh=al.mesh.Rectangular(shape=(20, 20)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        ),
+    )
+
+    return al.Tracer(galaxies=[tracer.galaxies[0], source])
+
+
+@pytest.fixture(name="settings_inversion", scope="session")
+def make_settings_inversion():
+    return al.SettingsInversion(use_w_tilde=False)
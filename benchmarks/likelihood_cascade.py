@@ -0,0 +1,160 @@
+"""
+Benchmark: Likelihood Cascade on a Pixelized Source Search
+==========================================================
+
+Times the log likelihood function of an `AnalysisImaging` fitting a lens model with a pixelized source, with and
+without a `LikelihoodCascade`, over the same set of models drawn randomly from the priors (which is representative
+of the initial stages of a non-linear search, where most models are poor).
+
+The cascade has a single stage, which fits every model with the source's `Rectangular` mesh replaced by a coarser
+mesh, and rejects models whose log likelihood is more than its margin below that of the median of the priors (its
+threshold, which is computed once before the models are fitted).
+
+Run from the root of the repository:
+
+ python benchmarks/likelihood_cascade.py --samples 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import autofit as af
+import autolens as al
+
+
+def make_dataset():
+    grid = al.Grid2D.uniform(shape_native=(50, 50), pixel_scales=0.1)
+
+    psf = al.Kernel2D.from_gaussian(
+        shape_native=(11, 11), sigma=0.1, pixel_scales=grid.pixel_scales
+    )
+
+    simulator = al.SimulatorImaging(
+        exposure_time=300.0,
+        psf=psf,
+        background_sky_level=0.1,
+        add_poisson_noise=True,
+        noise_seed=1,
+    )
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(einstein_radius=1.6, ell_comps=(0.05, 0.05)),
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                bulge=al.lp.Sersic(
+                    centre=(0.1, 0.1),
+                    intensity=1.0,
+                    effective_radius=0.2,
+                    sersic_index=1.0,
+                ),
+            ),
+        ]
+    )
+
+    dataset = simulator.via_tracer_from(tracer=tracer, grid=grid)
+
+    mask = al.Mask2D.circular(
+        shape_native=grid.shape_native, pixel_scales=grid.pixel_scales, radius=2.5
+    )
+
+    return dataset.apply_mask(mask=mask)
+
+
+def make_model(mesh_shape):
+    mass = af.Model(al.mp.Isothermal)
+    mass.centre.centre_0 = af.GaussianPrior(mean=0.0, sigma=0.05)
+    mass.centre.centre_1 = af.GaussianPrior(mean=0.0, sigma=0.05)
+    mass.einstein_radius = af.UniformPrior(lower_limit=1.2, upper_limit=2.0)
+
+    pixelization = al.Pixelization(
+        mesh=al.mesh.Rectangular(shape=mesh_shape),
+        regularization=al.reg.Constant(coefficient=1.0),
+    )
+
+    return af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(al.Galaxy, redshift=0.5, mass=mass),
+            source=af.Model(al.Galaxy, redshift=1.0, pixelization=pixelization),
+        )
+    )
+
+
+def coarse_mesh_instance_from(instance):
+    instance.galaxies.source.pixelization = al.Pixelization(
+        mesh=al.mesh.Rectangular(shape=(10, 10)),
+        regularization=al.reg.Constant(coefficient=1.0),
+    )
+
+    return instance
+
+
+def main(total_samples: int):
+    dataset = make_dataset()
+
+    model = make_model(mesh_shape=(25, 25))
+
+    np.random.seed(1)
+
+    instance_list = [model.random_instance() for _ in range(total_samples)]
+
+    analysis = al.AnalysisImaging(dataset=dataset)
+
+    start = time.time()
+
+    for instance in instance_list:
+        analysis.log_likelihood_function(instance=instance)
+
+    time_full = time.time() - start
+
+    likelihood_cascade = al.LikelihoodCascade(
+        stage_list=[
+            al.LikelihoodStage(
+                name="coarse_mesh",
+                margin=200.0,
+                instance_func=coarse_mesh_instance_from,
+            )
+        ]
+    )
+
+    analysis = al.AnalysisImaging(
+        dataset=dataset, likelihood_cascade=likelihood_cascade
+    )
+
+    likelihood_cascade.set_log_likelihood_thresholds(analysis=analysis, model=model)
+
+    start = time.time()
+
+    for instance in instance_list:
+        analysis.log_likelihood_function(instance=instance)
+
+    time_cascade = time.time() - start
+
+    summary_dict = likelihood_cascade.summary_dict
+
+    print(f"Samples: {total_samples}")
+    print(f"Without cascade: {time_full:.2f}s")
+    print(f"With cascade: {time_cascade:.2f}s")
+
+    for name, stage_dict in summary_dict["stages"].items():
+        print(
+            f"Stage {name}: {stage_dict['rejections']} / {stage_dict['calls']} rejected, "
+            f"{1e3 * stage_dict['time_per_call']:.1f} ms per call"
+        )
+
+    print(
+        f"Full fit: {summary_dict['full']['calls']} calls, "
+        f"{1e3 * summary_dict['full']['time_per_call']:.1f} ms per call"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=100)
+
+    main(total_samples=parser.parse_args().samples)
@@ -0,0 +1,120 @@
+"""
+Benchmark: Coarse-To-Fine Point Solver
+======================================
+
+Compares the number of triangles traced to the source plane and the run time of the `PointSolver` used to compute
+the multiple images of a result's source centre, for:
+
+- The full solver, whose initial triangles tile the whole mask at the pixel scale.
+- The coarse solver, whose initial triangles are `coarse_factor` times larger and whose first step also keeps
+  triangles near the critical curves (those with a magnification above `seed_magnification`).
+
+Run from the root of the repository:
+
+ python benchmarks/point_solver.py --lenses 10
+"""
+
+import argparse
+
+import numpy as np
+
+import autolens as al
+
+
+def make_grid():
+    return al.Grid2D.uniform(shape_native=(150, 150), pixel_scales=0.05)
+
+
+def tracer_and_coordinate_list_from(total_lenses):
+    rng = np.random.default_rng(1)
+
+    tracer_and_coordinate_list = []
+
+    for _ in range(total_lenses):
+        lens = al.Galaxy(
+            redshift=0.5,
+            bulge=al.mp.Sersic(
+                intensity=0.1,
+                effective_radius=0.8,
+                sersic_index=4.0,
+                mass_to_light_ratio=0.5,
+            ),
+            dark=al.mp.NFWSph(kappa_s=0.1, scale_radius=10.0),
+            mass=al.mp.Isothermal(
+                einstein_radius=rng.uniform(0.8, 1.4),
+                ell_comps=tuple(rng.uniform(-0.2, 0.2, 2)),
+            ),
+            shear=al.mp.ExternalShear(
+                gamma_1=rng.uniform(-0.05, 0.05), gamma_2=rng.uniform(-0.05, 0.05)
+            ),
+        )
+
+        tracer = al.Tracer(galaxies=[lens, al.Galaxy(redshift=1.0)])
+
+        tracer_and_coordinate_list.append((tracer, tuple(rng.uniform(-0.3, 0.3, 2))))
+
+    return tracer_and_coordinate_list
+
+
+def main(total_lenses: int, coarse_factor: int, seed_magnification: float):
+    grid = make_grid()
+
+    solver_dict = {
+        "full": al.PointSolver.for_grid(grid=grid, pixel_scale_precision=0.001),
+        "coarse": al.PointSolver.for_grid(
+            grid=grid,
+            pixel_scale_precision=0.001,
+            coarse_factor=coarse_factor,
+            seed_magnification=seed_magnification,
+        ),
+    }
+
+    tracer_and_coordinate_list = tracer_and_coordinate_list_from(
+        total_lenses=total_lenses
+    )
+
+    image_total_dict = {}
+
+    for name, solver in solver_dict.items():
+        total_triangles = 0
+        time = 0.0
+
+        image_total_dict[name] = []
+
+        for tracer, coordinate in tracer_and_coordinate_list:
+            multiple_images, info_dict = solver.solve_with_info(
+                tracer=tracer, source_plane_coordinate=coordinate
+            )
+
+            total_triangles += info_dict["total_triangles"]
+            time += info_dict["time"]
+
+            image_total_dict[name].append(len(multiple_images.in_list))
+
+        print(
+            f"{name}: {len(solver.initial_triangles)} initial triangles, "
+            f"{total_triangles / total_lenses:.0f} triangles traced and "
+            f"{1e3 * time / total_lenses:.1f} ms per solve"
+        )
+
+    total_agree = sum(
+        full == coarse
+        for full, coarse in zip(image_total_dict["full"], image_total_dict["coarse"])
+    )
+
+    print(f"Number of multiple images agrees for {total_agree} / {total_lenses} lenses")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lenses", type=int, default=10)
+    parser.add_argument("--coarse_factor", type=int, default=4)
+    parser.add_argument("--seed_magnification", type=float, default=5.0)
+
+    args = parser.parse_args()
+
+    main(
+        total_lenses=args.lenses,
+        coarse_factor=args.coarse_factor,
+        seed_magnification=args.seed_magnification,
+    )
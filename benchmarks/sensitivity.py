@@ -0,0 +1,134 @@
+"""
+Benchmark: Sensitivity Mapping Cell Throughput
+==============================================
+
+Times how many cells of a subhalo sensitivity grid can be simulated per second, comparing simulation via a full
+`Tracer` for every cell (`SimulatorImaging.via_tracer_from`) with the `SubhaloSensitivitySimulator`, which reuses the
+deflection angles of the base lens and only adds those of the subhalo.
+
+Every cell's simulated dataset is also masked, so the reuse of the masked dataset's convolver and grids across cells
+is included in the timings.
+
+Run from the root of the repository:
+
+ python benchmarks/sensitivity.py --cells 25
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import autofit as af
+import autolens as al
+
+
+def make_grid():
+    return al.Grid2D.uniform(
+        shape_native=(100, 100),
+        pixel_scales=0.05,
+        over_sampling=al.OverSamplingUniform(sub_size=2),
+    )
+
+
+def make_simulator(grid):
+    return al.SimulatorImaging(
+        exposure_time=300.0,
+        psf=al.Kernel2D.from_gaussian(
+            shape_native=(11, 11), sigma=0.1, pixel_scales=grid.pixel_scales
+        ),
+        background_sky_level=0.1,
+        add_poisson_noise=True,
+        noise_seed=1,
+    )
+
+
+def make_tracer_base():
+    lens = al.Galaxy(
+        redshift=0.5,
+        bulge=al.lp.Sersic(intensity=0.1, effective_radius=0.8, sersic_index=4.0),
+        mass=al.mp.Isothermal(einstein_radius=1.6, ell_comps=(0.05, 0.05)),
+        shear=al.mp.ExternalShear(gamma_1=0.05, gamma_2=0.05),
+    )
+
+    source = al.Galaxy(
+        redshift=1.0,
+        bulge=al.lp.Sersic(
+            centre=(0.1, 0.1), intensity=1.0, effective_radius=0.2, sersic_index=1.0
+        ),
+    )
+
+    return al.Tracer(galaxies=[lens, source])
+
+
+def subhalo_list_from(total_cells):
+    shape_size = int(np.ceil(np.sqrt(total_cells)))
+
+    centres = np.linspace(-2.0, 2.0, shape_size)
+
+    return [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.NFWTruncatedMCRLudlowSph(
+                centre=(y, x),
+                mass_at_200=1e10,
+                redshift_object=0.5,
+                redshift_source=1.0,
+            ),
+        )
+        for y in centres
+        for x in centres
+    ][:total_cells]
+
+
+def main(total_cells: int):
+    grid = make_grid()
+    simulator = make_simulator(grid=grid)
+    mask = al.Mask2D.circular(
+        shape_native=grid.shape_native, pixel_scales=grid.pixel_scales, radius=3.0
+    )
+    subhalo_list = subhalo_list_from(total_cells=total_cells)
+
+    start = time.time()
+
+    for subhalo in subhalo_list:
+        tracer = al.Tracer(galaxies=list(make_tracer_base().galaxies) + [subhalo])
+        dataset = simulator.via_tracer_from(tracer=tracer, grid=grid)
+        dataset = dataset.apply_mask(mask=mask)
+        dataset.convolver
+
+    time_via_tracer = time.time() - start
+
+    start = time.time()
+
+    sensitivity_simulator = al.SubhaloSensitivitySimulator(
+        tracer_base=make_tracer_base(), grid=grid, simulator=simulator, mask=mask
+    )
+
+    time_setup = time.time() - start
+
+    start = time.time()
+
+    for subhalo in subhalo_list:
+        dataset = sensitivity_simulator(
+            instance=af.ModelInstance(dict(perturb=subhalo))
+        )
+        dataset.convolver
+
+    time_via_base = time.time() - start
+
+    print(f"Cells: {total_cells}")
+    print(
+        f"Via Tracer: {time_via_tracer:.3f}s ({total_cells / time_via_tracer:.2f} cells/s)"
+    )
+    print(
+        f"Via SubhaloSensitivitySimulator: {time_via_base:.3f}s "
+        f"({total_cells / time_via_base:.2f} cells/s, plus {time_setup:.3f}s setup)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cells", type=int, default=25)
+
+    main(total_cells=parser.parse_args().cells)
@@ -0,0 +1,127 @@
+"""
+Benchmark: Tree Code Deflections of Line-of-Sight Halos
+=======================================================
+
+Compares the run time and accuracy of the deflection angles of a tracer with a plane of many truncated NFW halos
+and point masses, computed by:
+
+- Summing the deflection angles of every halo (a `TreeDeflections` whose `halo_threshold` is None).
+- The tree code of a `TreeDeflections`, for a sweep of opening angles.
+
+The number of halos is swept from 10 to 10^4. Summing every halo is slow for the largest numbers of halos, and is
+skipped above `--max-direct-halos`, with the errors of the tree code then computed against the tree code with the
+smallest opening angle. The tree code is timed on a second call, once its halos and quadtree are cached as they are
+for the fixed line-of-sight halos of a model-fit, with the time of the first call also shown.
+
+Run from the root of the repository:
+
+ python benchmarks/tree_deflections.py --max-direct-halos 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import autolens as al
+
+
+def make_grid():
+    return al.Grid2D.uniform(shape_native=(60, 60), pixel_scales=0.1)
+
+
+def galaxies_from(total_halos):
+    rng = np.random.default_rng(1)
+
+    galaxies = [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.Isothermal(einstein_radius=1.6, ell_comps=(0.05, 0.05)),
+        ),
+        al.Galaxy(redshift=1.0),
+    ]
+
+    for index in range(total_halos):
+        centre = tuple(rng.uniform(-5.0, 5.0, 2))
+
+        if index % 4 == 0:
+            mass = al.mp.PointMass(centre=centre, einstein_radius=0.01)
+        else:
+            mass = al.mp.NFWTruncatedSph(
+                centre=centre,
+                kappa_s=rng.uniform(0.02, 0.1),
+                scale_radius=0.05,
+                truncation_radius=rng.uniform(0.2, 0.5),
+            )
+
+        galaxies.append(al.Galaxy(redshift=0.4, mass=mass))
+
+    return galaxies
+
+
+def deflections_and_time_from(galaxies, grid, tree_deflections):
+    tracer = al.Tracer(galaxies=galaxies, tree_deflections=tree_deflections)
+
+    start = time.time()
+
+    deflections = np.asarray(tracer.deflections_yx_2d_from(grid=grid))
+
+    return deflections, time.time() - start
+
+
+def main(max_direct_halos: int):
+    grid = make_grid()
+
+    opening_angle_list = [0.3, 0.5, 0.7]
+
+    for total_halos in [10, 100, 1000, 10000]:
+        galaxies = galaxies_from(total_halos=total_halos)
+
+        print(f"Halos: {total_halos}")
+
+        if total_halos <= max_direct_halos:
+            deflections_true, time_direct = deflections_and_time_from(
+                galaxies=galaxies,
+                grid=grid,
+                tree_deflections=al.TreeDeflections(halo_threshold=None),
+            )
+
+            print(f"Direct: {time_direct:.2f}s")
+        else:
+            deflections_true, _ = deflections_and_time_from(
+                galaxies=galaxies,
+                grid=grid,
+                tree_deflections=al.TreeDeflections(
+                    opening_angle=0.1, halo_threshold=1
+                ),
+            )
+
+            print(f"Direct: skipped, errors relative to opening angle 0.1")
+
+        for opening_angle in opening_angle_list:
+            tree_deflections = al.TreeDeflections(
+                opening_angle=opening_angle, halo_threshold=1
+            )
+
+            _, time_first = deflections_and_time_from(
+                galaxies=galaxies, grid=grid, tree_deflections=tree_deflections
+            )
+
+            deflections, time_tree = deflections_and_time_from(
+                galaxies=galaxies, grid=grid, tree_deflections=tree_deflections
+            )
+
+            error = np.abs(deflections - deflections_true)
+
+            print(
+                f"Tree (opening angle {opening_angle}): {time_tree:.2f}s "
+                f"(first call {time_first:.2f}s), "
+                f"max error {np.max(error):.1e}, mean error {np.mean(error):.1e}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-direct-halos", type=int, default=1000)
+
+    main(max_direct_halos=parser.parse_args().max_direct_halos)
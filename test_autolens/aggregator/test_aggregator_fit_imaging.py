@@ -125,3 +125,32 @@ def test__fit_imaging__adapt_images(
     assert i == 2
 
     clean(database_file=database_file)
+
+
+def test__fit_imaging_randomly_drawn_via_pdf_gen_from__dataset_cached_and_parallel(
+    analysis_imaging_7x7, samples, model
+):
+    agg = aggregator_from(
+        database_file=database_file,
+        analysis=analysis_imaging_7x7,
+        model=model,
+        samples=samples,
+    )
+
+    fit_agg = al.agg.FitImagingAgg(aggregator=agg, number_of_cores=2)
+    fit_pdf_gen = fit_agg.randomly_drawn_via_pdf_gen_from(total_samples=3)
+
+    i = 0
+
+    for fit_gen in fit_pdf_gen:
+        dataset = fit_gen[0][0].dataset
+
+        for fit_list in fit_gen:
+            i += 1
+
+            assert fit_list[0].dataset is dataset
+            assert fit_list[0].tracer.galaxies[0].light.centre == (10.0, 10.0)
+
+    assert i == 3
+
+    clean(database_file=database_file)
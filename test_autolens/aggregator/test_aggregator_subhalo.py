@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import autofit as af
+import autolens as al
+
+
+class MockFit:
+    def __init__(self, lower_limits, step_sizes, log_likelihood):
+        centre = SimpleNamespace(
+            centre_0=af.UniformPrior(
+                lower_limit=lower_limits[0],
+                upper_limit=lower_limits[0] + step_sizes[0],
+            ),
+            centre_1=af.UniformPrior(
+                lower_limit=lower_limits[1],
+                upper_limit=lower_limits[1] + step_sizes[1],
+            ),
+        )
+
+        self.model = SimpleNamespace(
+            galaxies=SimpleNamespace(
+                subhalo=SimpleNamespace(mass=SimpleNamespace(centre=centre))
+            )
+        )
+        self.instance = SimpleNamespace(
+            galaxies=SimpleNamespace(
+                subhalo=SimpleNamespace(
+                    mass=al.mp.PointMass(centre=(centre.centre_0.mean, 0.0))
+                )
+            )
+        )
+        self.max_log_likelihood = log_likelihood
+
+    def value(self, name):
+        return None
+
+
+class MockGridSearchAggregator:
+    def __init__(self, fit_list):
+        self.fit_list = fit_list
+
+    def __len__(self):
+        return 1
+
+    def children(self):
+        return self.fit_list
+
+
+def test__columns__grid_with_single_row():
+    fit_list = [
+        MockFit(lower_limits=(-1.0, x), step_sizes=(2.0, 0.5), log_likelihood=x)
+        for x in [0.5, -1.0, 0.0, -0.5]
+    ]
+
+    subhalo_agg = al.agg.SubhaloAgg(
+        aggregator_grid_search=MockGridSearchAggregator(fit_list=fit_list)
+    )
+
+    columns = subhalo_agg.columns
+
+    assert columns.shape == (1, 4)
+    assert columns.pixel_scales == (2.0, 0.5)
+    assert columns.figure_of_merit_array(
+        use_log_evidences=False
+    ).native == pytest.approx(np.array([[-1.0, -0.5, 0.0, 0.5]]), 1.0e-4)
@@ -0,0 +1,32 @@
+import autolens as al
+
+from test_autolens.aggregator.conftest import clean, aggregator_from
+
+database_file = "db_telemetry"
+
+
+def test__summary_gen(masked_imaging_7x7, samples, model):
+    likelihood_telemetry = al.LikelihoodTelemetry(every=1)
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, likelihood_telemetry=likelihood_telemetry
+    )
+
+    analysis.log_likelihood_function(instance=model.instance_from_prior_medians())
+
+    agg = aggregator_from(
+        database_file=database_file,
+        analysis=analysis,
+        model=model,
+        samples=samples,
+    )
+
+    telemetry_agg = al.agg.LikelihoodTelemetryAgg(aggregator=agg)
+
+    summary_list = list(telemetry_agg.summary_gen())
+
+    assert len(summary_list) == 1
+    assert summary_list[0]["total_samples"] >= 1
+    assert "p95" in summary_list[0]["stages"]["total"]
+
+    clean(database_file=database_file)
@@ -75,3 +75,57 @@ def test__tracer_all_above_weight_gen(analysis_imaging_7x7, samples, model):
     assert i == 2
 
     clean(database_file=database_file)
+
+
+def test__tracer_randomly_drawn_batch_via_pdf_gen_from(
+    analysis_imaging_7x7, samples, model, grid_2d_7x7
+):
+    agg = aggregator_from(
+        database_file=database_file,
+        analysis=analysis_imaging_7x7,
+        model=model,
+        samples=samples,
+    )
+
+    tracer_agg = al.agg.TracerAgg(aggregator=agg)
+    tracer_batch_gen = tracer_agg.randomly_drawn_batch_via_pdf_gen_from(
+        total_samples=3
+    )
+
+    i = 0
+
+    for tracer_batch in tracer_batch_gen:
+        i += 1
+
+        assert tracer_batch.total_samples == 3
+        assert len(tracer_batch.tracer_list) == 1
+        assert tracer_batch[0].galaxies[0].light.centre == (10.0, 10.0)
+
+        convergence = tracer_batch.convergence_2d_from(grid=grid_2d_7x7)
+
+        assert convergence.shape == (3, grid_2d_7x7.shape[0])
+
+    assert i == 1
+
+    tracer_batch_gen = tracer_agg.all_above_weight_batch_gen_from(
+        minimum_weight=-1.0
+    )
+
+    for tracer_batch in tracer_batch_gen:
+        assert tracer_batch.total_samples == 2
+        assert tracer_batch[0].galaxies[0].light.centre == (1.0, 1.0)
+        assert tracer_batch[1].galaxies[0].light.centre == (10.0, 10.0)
+
+    tracer_batch_gen = tracer_agg.all_above_weight_batch_gen_from(
+        minimum_weight=1.0e8
+    )
+
+    for tracer_batch in tracer_batch_gen:
+        assert tracer_batch.total_samples == 0
+        assert tracer_batch.convergence_2d_from(grid=grid_2d_7x7).shape == (
+            0,
+            grid_2d_7x7.shape[0],
+        )
+        assert tracer_batch.einstein_radius_from(grid=grid_2d_7x7).shape == (0,)
+
+    clean(database_file=database_file)
@@ -40,6 +40,37 @@ def test__modify_before_fit__inversion_no_positions_likelihood__raises_exception
     analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
 
 
+def test__adapt_images_via_instance_from__uses_adapt_image_path_list(
+    masked_imaging_7x7,
+):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph),
+            source=al.Galaxy(
+                redshift=1.0,
+                pixelization=al.Pixelization(mesh=al.mesh.Rectangular()),
+            ),
+        )
+    )
+
+    image = al.Array2D.ones(shape_native=(3, 3), pixel_scales=1.0)
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+    analysis._adapt_images = al.AdaptImages(
+        galaxy_name_image_dict={str(("galaxies", "source")): image}
+    )
+
+    analysis.adapt_image_path_list = analysis.adapt_image_path_list_from(model=model)
+
+    assert analysis.adapt_image_path_list == [(("galaxies", "source"), image)]
+
+    instance = model.instance_from_prior_medians()
+
+    adapt_images = analysis.adapt_images_via_instance_from(instance=instance)
+
+    assert adapt_images.galaxy_image_dict == {instance.galaxies.source: image}
+
+
 def test__check_preloads(masked_imaging_7x7):
     conf.instance["general"]["test"]["check_preloads"] = True
 
@@ -1,4 +1,5 @@
 from os import path
+import numpy as np
 import pytest
 
 import autofit as af
@@ -70,3 +71,66 @@ def test__tracer_for_instance__subhalo_redshift_rescale_used(analysis_imaging_7x
     tracer = analysis_imaging_7x7.tracer_via_instance_from(instance=instance)
 
     assert tracer.galaxies[1].mass.centre == pytest.approx((-0.19959, -0.39919), 1.0e-4)
+
+
+def test__tracer_for_instance__macro_deflection_cache(masked_imaging_7x7):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(centre=(0.0, 0.0), einstein_radius=1.0),
+            ),
+            subhalo=al.Galaxy(redshift=0.5, mass=al.mp.NFWSph(centre=(0.1, 0.2))),
+            source=al.Galaxy(redshift=1.0),
+        )
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7,
+        macro_deflection_cache=al.MacroDeflectionCache(galaxies=instance.galaxies),
+    )
+
+    for _ in range(3):
+        instance = model.instance_from_unit_vector([])
+        tracer = analysis.tracer_via_instance_from(instance=instance)
+        traced_grid_list = tracer.traced_grid_2d_list_from(
+            grid=masked_imaging_7x7.grids.uniform
+        )
+
+    tracer_exact = al.Tracer(galaxies=model.instance_from_unit_vector([]).galaxies)
+
+    assert analysis.macro_deflection_cache.total_linear > 0
+    assert traced_grid_list[1] == pytest.approx(
+        tracer_exact.traced_grid_2d_list_from(grid=masked_imaging_7x7.grids.uniform)[1],
+        1.0e-4,
+    )
+
+
+def test__tracer_for_instance__tree_deflections(masked_imaging_7x7):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=al.Galaxy(redshift=0.5, mass=al.mp.PointMass(einstein_radius=0.1)),
+            source=al.Galaxy(redshift=1.0),
+        )
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    tracer = al.AnalysisImaging(dataset=masked_imaging_7x7).tracer_via_instance_from(
+        instance=instance
+    )
+
+    assert tracer.tree_deflections is None
+
+    tree_deflections = al.TreeDeflections(halo_threshold=1)
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, tree_deflections=tree_deflections
+    )
+
+    tracer = analysis.tracer_via_instance_from(instance=instance)
+
+    assert tracer.tree_deflections is tree_deflections
+    assert tree_deflections.is_used_for(galaxies=tracer.planes[0])
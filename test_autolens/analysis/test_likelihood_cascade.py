@@ -0,0 +1,190 @@
+import json
+import os
+from os import path
+
+import pytest
+
+import autofit as af
+import autolens as al
+
+from autolens.analysis.positions import log_likelihood_penalty_base_from
+
+
+def make_model(intensity):
+    return af.Collection(
+        galaxies=af.Collection(
+            lens=al.Galaxy(
+                redshift=0.5,
+                light=al.lp.SersicSph(intensity=intensity),
+                mass=al.mp.IsothermalSph(einstein_radius=1.0),
+            ),
+            source=al.Galaxy(redshift=1.0, light=al.lp.SersicSph(intensity=0.1)),
+        )
+    )
+
+
+def test__log_likelihood_function__rejects_via_stage(masked_imaging_7x7, tmp_path):
+    likelihood_cascade = al.LikelihoodCascade(
+        stage_list=[al.LikelihoodStage.from_over_sampling(sub_size=1, margin=10.0)]
+    )
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, likelihood_cascade=likelihood_cascade
+    )
+
+    likelihood_cascade.set_log_likelihood_thresholds(
+        analysis=analysis, model=make_model(intensity=0.1)
+    )
+
+    stage = likelihood_cascade.stage_list[0]
+
+    instance = make_model(intensity=0.1).instance_from_prior_medians()
+
+    assert stage.log_likelihood_threshold is None
+    assert likelihood_cascade.log_likelihood_threshold_from(
+        stage=stage
+    ) == pytest.approx(
+        stage.log_likelihood_from(analysis=analysis, instance=instance) - 10.0, 1.0e-8
+    )
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    assert log_likelihood == pytest.approx(
+        analysis.fit_from(instance=instance).figure_of_merit, 1.0e-8
+    )
+
+    instance = make_model(intensity=1000.0).instance_from_prior_medians()
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    assert log_likelihood == pytest.approx(
+        log_likelihood_penalty_base_from(dataset=masked_imaging_7x7)
+        + stage.log_likelihood_from(analysis=analysis, instance=instance)
+        - likelihood_cascade.log_likelihood_threshold_from(stage=stage),
+        1.0e-8,
+    )
+
+    summary_dict = likelihood_cascade.summary_dict
+
+    assert summary_dict["total_calls"] == 2
+    assert summary_dict["stages"]["over_sampling"]["calls"] == 2
+    assert summary_dict["stages"]["over_sampling"]["rejections"] == 1
+    assert summary_dict["full"]["calls"] == 1
+
+    likelihood_cascade.output_to_json(
+        file_path=path.join(tmp_path, "likelihood_cascade.json")
+    )
+
+    with open(path.join(tmp_path, "likelihood_cascade.json")) as f:
+        assert json.load(f)["stages"]["over_sampling"]["rejections"] == 1
+
+    likelihood_cascade.set_log_likelihood_thresholds(
+        analysis=analysis, model=make_model(intensity=1000.0)
+    )
+
+    assert likelihood_cascade.log_likelihood_threshold_from(
+        stage=stage
+    ) == pytest.approx(
+        stage.log_likelihood_from(analysis=analysis, instance=instance) - 10.0, 1.0e-8
+    )
+    assert stage.log_likelihood_threshold is None
+    assert likelihood_cascade.summary_dict["total_calls"] == 0
+
+
+def test__log_likelihood_function__fixed_threshold_and_decreasing_penalty(
+    masked_imaging_7x7,
+):
+    likelihood_cascade = al.LikelihoodCascade(
+        stage_list=[al.LikelihoodStage.from_over_sampling(sub_size=1, margin=10.0)],
+        instance=make_model(intensity=0.1).instance_from_prior_medians(),
+    )
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, likelihood_cascade=likelihood_cascade
+    )
+
+    likelihood_cascade.set_log_likelihood_thresholds(
+        analysis=analysis, model=make_model(intensity=1000.0)
+    )
+
+    stage = likelihood_cascade.stage_list[0]
+
+    log_likelihood_threshold = likelihood_cascade.log_likelihood_threshold_from(
+        stage=stage
+    )
+
+    log_likelihood_0 = analysis.log_likelihood_function(
+        instance=make_model(intensity=1000.0).instance_from_prior_medians()
+    )
+    log_likelihood_1 = analysis.log_likelihood_function(
+        instance=make_model(intensity=2000.0).instance_from_prior_medians()
+    )
+
+    assert log_likelihood_1 < log_likelihood_0
+    assert log_likelihood_0 < log_likelihood_penalty_base_from(
+        dataset=masked_imaging_7x7
+    )
+    assert (
+        likelihood_cascade.log_likelihood_threshold_from(stage=stage)
+        == log_likelihood_threshold
+    )
+    assert analysis.log_likelihood_function(
+        instance=make_model(intensity=1000.0).instance_from_prior_medians()
+    ) == pytest.approx(log_likelihood_0, 1.0e-8)
+
+
+def test__log_likelihood_threshold__input_threshold_is_kept(masked_imaging_7x7):
+    stage = al.LikelihoodStage.from_over_sampling(sub_size=1)
+    stage.log_likelihood_threshold = -1.0e8
+
+    likelihood_cascade = al.LikelihoodCascade(stage_list=[stage])
+
+    likelihood_cascade.set_log_likelihood_thresholds(
+        analysis=al.AnalysisImaging(dataset=masked_imaging_7x7),
+        model=make_model(intensity=0.1),
+    )
+
+    assert likelihood_cascade.log_likelihood_threshold_dict == {}
+    assert likelihood_cascade.log_likelihood_threshold_from(stage=stage) == -1.0e8
+    assert stage.rejects(log_likelihood=-2.0e8) is True
+    assert stage.rejects(log_likelihood=-1.0, log_likelihood_threshold=0.0) is False
+
+
+def test__summary_dict__sums_counts_of_every_process(masked_imaging_7x7, tmp_path):
+    likelihood_cascade = al.LikelihoodCascade(
+        stage_list=[al.LikelihoodStage.from_over_sampling(sub_size=1, margin=10.0)]
+    )
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, likelihood_cascade=likelihood_cascade
+    )
+
+    likelihood_cascade.set_log_likelihood_thresholds(
+        analysis=analysis, model=make_model(intensity=0.1)
+    )
+    likelihood_cascade.output_path = str(tmp_path)
+
+    analysis.log_likelihood_function(
+        instance=make_model(intensity=1000.0).instance_from_prior_medians()
+    )
+
+    with open(path.join(tmp_path, f"likelihood_cascade_{os.getpid()}.json")) as f:
+        count_dict = json.load(f)
+
+    assert count_dict["total_calls"] == 1
+    assert count_dict["stages"]["over_sampling"]["rejections"] == 1
+
+    count_dict["pid"] = -1
+    count_dict["full"] = {"calls": 1, "time": 2.0}
+
+    with open(path.join(tmp_path, "likelihood_cascade_-1.json"), "w") as f:
+        json.dump(count_dict, f)
+
+    summary_dict = likelihood_cascade.summary_dict
+
+    assert summary_dict["total_calls"] == 2
+    assert summary_dict["total_processes"] == 2
+    assert summary_dict["stages"]["over_sampling"]["calls"] == 2
+    assert summary_dict["stages"]["over_sampling"]["rejections"] == 2
+    assert summary_dict["full"]["calls"] == 1
+    assert summary_dict["full"]["time_per_call"] == pytest.approx(2.0, 1.0e-8)
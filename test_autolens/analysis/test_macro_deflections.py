@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autolens as al
+
+
+def make_galaxies(einstein_radius=1.6, gamma_1=0.05):
+    return af.ModelInstance(
+        dict(
+            lens=al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(
+                    centre=(0.01, 0.02),
+                    ell_comps=(0.05, 0.05),
+                    einstein_radius=einstein_radius,
+                ),
+                shear=al.mp.ExternalShear(gamma_1=gamma_1, gamma_2=0.05),
+            ),
+            source=al.Galaxy(redshift=1.0, light=al.lp.SersicSph(intensity=1.0)),
+        )
+    )
+
+
+def test__deflections_via_linearization_match_exact_deflections():
+    grid = al.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.2)
+
+    cache = al.MacroDeflectionCache(galaxies=make_galaxies(), verify_every=1000)
+
+    assert list(cache.linearization_dict.keys()) == ["lens"]
+
+    cache.register_grid(grid=grid)
+
+    for _ in range(3):
+        galaxies = make_galaxies(einstein_radius=1.61, gamma_1=0.051)
+
+        deflections_func = cache.deflections_func_from(galaxies=galaxies)
+
+        deflections = deflections_func(galaxies.lens, grid)
+
+    assert cache.total_exact == 0
+    assert cache.total_linear == 3
+    assert isinstance(deflections, al.VectorYX2D)
+    assert "deflections_yx_2d_from" not in vars(galaxies.lens)
+
+    deflections_exact = make_galaxies(
+        einstein_radius=1.61, gamma_1=0.051
+    ).lens.deflections_yx_2d_from(grid=grid)
+
+    assert np.asarray(deflections) == pytest.approx(
+        np.asarray(deflections_exact), abs=1.0e-4
+    )
+
+
+def test__exact_fallback_and_verification():
+    grid = al.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.2)
+
+    cache = al.MacroDeflectionCache(
+        galaxies=make_galaxies(), max_parameter_offset=0.1, verify_every=1
+    )
+
+    cache.register_grid(grid=grid)
+
+    galaxies = make_galaxies(einstein_radius=1.61)
+    cache.deflections_func_from(galaxies=galaxies)(galaxies.lens, grid.copy())
+
+    assert cache.total_linear == 0
+    assert cache.total_exact == 1
+
+    galaxies = make_galaxies(einstein_radius=1.61)
+    cache.deflections_func_from(galaxies=galaxies)(galaxies.lens, grid)
+
+    assert cache.total_linear == 1
+    assert cache.is_valid is True
+
+    galaxies = make_galaxies(einstein_radius=1.8)
+    cache.deflections_func_from(galaxies=galaxies)(galaxies.lens, grid)
+
+    assert cache.total_linear == 1
+    assert cache.total_exact == 2
+
+    cache.tolerance = 0.0
+
+    galaxies = make_galaxies(gamma_1=0.1)
+    deflections = cache.deflections_func_from(galaxies=galaxies)(galaxies.lens, grid)
+
+    assert cache.is_valid is False
+    assert cache.deflections_func_from(galaxies=galaxies) is None
+    assert np.asarray(deflections) == pytest.approx(
+        np.asarray(make_galaxies(gamma_1=0.1).lens.deflections_yx_2d_from(grid=grid)),
+        1.0e-8,
+    )
@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 
 import autofit as af
+from autofit.non_linear.samples import Sample
 import autolens as al
 from autoarray import Array2D
 
@@ -229,6 +230,85 @@ def test__image_plane_multiple_image_positions(analysis_imaging_7x7):
 
     assert pytest.approx((0.968719, 0.366210), 1.0e-2) in multiple_images.in_list
 
+    multiple_images_full = result.image_plane_multiple_image_positions_from(
+        coarse_factor=1
+    )
+
+    assert len(multiple_images.in_list) == len(multiple_images_full.in_list) == 5
+
+    multiple_images_coarse = result.image_plane_multiple_image_positions_from(
+        coarse_factor=2, seed_magnification=5.0
+    )
+
+    assert len(multiple_images_coarse.in_list) == len(multiple_images_full.in_list)
+    assert pytest.approx((0.968719, 0.366210), 1.0e-2) in multiple_images_coarse.in_list
+
+    # The default coarse solver only finds 3 images of this quad, so the full solver is used instead.
+
+    coarse_solver = al.PointSolver.for_grid(
+        grid=analysis_imaging_7x7.dataset.mask.derive_grid.all_false,
+        pixel_scale_precision=0.001,
+        coarse_factor=4,
+        seed_magnification=5.0,
+    )
+
+    assert (
+        len(coarse_solver.solve(tracer=tracer, source_plane_coordinate=(0.0, 0.05))) < 4
+    )
+
+
+def test__image_plane_multiple_image_positions_for_single_image_from(
+    analysis_imaging_7x7,
+):
+    lens = al.Galaxy(
+        redshift=0.5,
+        mass=al.mp.IsothermalSph(centre=(0.0, 0.0), einstein_radius=1.0),
+    )
+
+    source = al.Galaxy(
+        redshift=1.0,
+        light1=al.lp.SersicSph(centre=(0.0, 2.0), intensity=2.0),
+    )
+
+    tracer = al.Tracer(galaxies=[lens, source])
+
+    samples_summary = al.m.MockSamplesSummary(max_log_likelihood_instance=tracer)
+
+    result = ResultImaging(
+        samples_summary=samples_summary, analysis=analysis_imaging_7x7
+    )
+
+    solver = al.PointSolver.for_grid(
+        grid=analysis_imaging_7x7.dataset.mask.derive_grid.all_false,
+        pixel_scale_precision=0.001,
+    )
+
+    for i in range(1, 20):
+        factor = 1.0 - (1.0 * (i / 20))
+
+        multiple_images = solver.solve(
+            tracer=tracer, source_plane_coordinate=(0.0, 2.0 * factor)
+        )
+
+        if multiple_images.shape[0] > 1:
+            break
+
+    assert multiple_images.shape[0] > 1
+
+    multiple_images_batched = (
+        result.image_plane_multiple_image_positions_for_single_image_from()
+    )
+
+    assert multiple_images_batched.array == pytest.approx(multiple_images.array, 1.0e-4)
+
+    multiple_images_batched = (
+        result.image_plane_multiple_image_positions_for_single_image_from(
+            number_of_cores=2
+        )
+    )
+
+    assert multiple_images_batched.array == pytest.approx(multiple_images.array, 1.0e-4)
+
 
 def test__positions_threshold_from(analysis_imaging_7x7):
     tracer = al.Tracer(
@@ -259,6 +339,108 @@ def test__positions_threshold_from(analysis_imaging_7x7):
     ) == pytest.approx(0.0, 1.0e-4)
 
 
+def test__positions_threshold_via_posterior_from(analysis_imaging_7x7):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph),
+            source=af.Model(al.Galaxy, redshift=1.0),
+        )
+    )
+
+    sample_list = Sample.from_lists(
+        model=model,
+        parameter_lists=[[0.1, 0.0, 1.0], [0.1, 0.0, 2.0], [0.1, 0.0, 1.0]],
+        log_likelihood_list=[1.0, 2.0, 3.0],
+        log_prior_list=[0.0, 0.0, 0.0],
+        weight_list=[0.5, 0.0, 0.5],
+    )
+
+    samples = al.m.MockSamples(
+        model=model,
+        sample_list=sample_list,
+        prior_means=[1.0] * model.prior_count,
+    )
+
+    result = res.Result(
+        samples_summary=al.m.MockSamplesSummary(),
+        samples=samples,
+        analysis=analysis_imaging_7x7,
+    )
+
+    positions = al.Grid2DIrregular([(1.0, 1.0), (-1.0, -1.0)])
+
+    max_separations = result.positions_separations_via_posterior_from(
+        total_samples=10, positions=positions, seed=1
+    )
+
+    assert max_separations.shape == (10,)
+    assert max_separations == pytest.approx(np.full(10, 0.830956162), 1.0e-4)
+
+    assert result.positions_threshold_via_posterior_from(
+        quantile=0.5, factor=2.0, total_samples=10, positions=positions, seed=1
+    ) == pytest.approx(1.661912325, 1.0e-4)
+    assert result.positions_threshold_via_posterior_from(
+        minimum_threshold=10.0, total_samples=10, positions=positions, seed=1
+    ) == pytest.approx(10.0, 1.0e-4)
+
+
+def test__positions_separations_via_posterior_from__uses_analysis_cosmology(
+    masked_imaging_7x7,
+):
+    model = af.Collection(
+        galaxies=af.Collection(
+            lens=af.Model(al.Galaxy, redshift=0.5, mass=al.mp.IsothermalSph),
+            perturber=al.Galaxy(
+                redshift=0.8, mass=al.mp.IsothermalSph(einstein_radius=0.5)
+            ),
+            source=af.Model(al.Galaxy, redshift=1.0),
+        )
+    )
+
+    sample_list = Sample.from_lists(
+        model=model,
+        parameter_lists=[[0.1, 0.0, 1.0]],
+        log_likelihood_list=[1.0],
+        log_prior_list=[0.0],
+        weight_list=[1.0],
+    )
+
+    samples = al.m.MockSamples(
+        model=model, sample_list=sample_list, prior_means=[1.0] * model.prior_count
+    )
+
+    cosmology = al.cosmo.FlatLambdaCDMWrap(H0=70.0, Om0=0.9)
+
+    result = res.Result(
+        samples_summary=al.m.MockSamplesSummary(),
+        samples=samples,
+        analysis=al.AnalysisImaging(dataset=masked_imaging_7x7, cosmology=cosmology),
+    )
+
+    positions = al.Grid2DIrregular([(1.0, 1.0), (-1.0, -1.0)])
+
+    max_separations = result.positions_separations_via_posterior_from(
+        total_samples=2, positions=positions, seed=1
+    )
+
+    galaxies = model.instance_from_vector(vector=[0.1, 0.0, 1.0]).galaxies
+
+    max_separation = al.Tracer(
+        galaxies=galaxies, cosmology=cosmology
+    ).traced_grid_2d_list_from(grid=positions)[-1]
+    max_separation_planck = al.Tracer(galaxies=galaxies).traced_grid_2d_list_from(
+        grid=positions
+    )[-1]
+
+    max_separation = max_separation.furthest_distances_to_other_coordinates.max()
+    max_separation_planck = (
+        max_separation_planck.furthest_distances_to_other_coordinates.max()
+    )
+
+    assert max_separations == pytest.approx(np.full(2, max_separation), 1.0e-4)
+    assert max_separation != pytest.approx(max_separation_planck, 1.0e-4)
+
+
 def test__positions_likelihood_from(analysis_imaging_7x7):
     tracer = al.Tracer(
         galaxies=[
@@ -0,0 +1,58 @@
+import json
+from os import path
+
+import pytest
+
+import autofit as af
+import autolens as al
+
+
+def test__log_likelihood_function__samples_every_nth_call(masked_imaging_7x7, tmp_path):
+    lens = al.Galaxy(redshift=0.5, light=al.lp.Sersic(intensity=0.1))
+    source = al.Galaxy(redshift=1.0, light=al.lp.Sersic(intensity=0.1))
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    instance = model.instance_from_unit_vector([])
+
+    likelihood_telemetry = al.LikelihoodTelemetry(every=2, window=2)
+    likelihood_telemetry.output_path = path.join(tmp_path, "profile")
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, likelihood_telemetry=likelihood_telemetry
+    )
+
+    log_likelihood = al.AnalysisImaging(
+        dataset=masked_imaging_7x7
+    ).log_likelihood_function(instance=instance)
+
+    for _ in range(6):
+        assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+            log_likelihood, 1.0e-8
+        )
+
+    assert likelihood_telemetry.total_calls == 6
+    assert len(likelihood_telemetry.sample_list) == 2
+
+    with open(likelihood_telemetry.file_path) as f:
+        sample_list = [json.loads(line) for line in f.read().splitlines()]
+
+    assert [sample["call"] for sample in sample_list] == [2, 4, 6]
+    assert "image_2d_list_from" in sample_list[0]["stages"]
+
+    with open(path.join(tmp_path, "profile", "likelihood_telemetry_1.jsonl"), "w") as f:
+        f.write(json.dumps({**sample_list[0], "pid": 1, "call": 4, "time": 0.0}))
+
+    parent_telemetry = al.LikelihoodTelemetry(every=2, window=2)
+    parent_telemetry.output_path = likelihood_telemetry.output_path
+
+    summary_dict = parent_telemetry.summary_dict
+
+    assert parent_telemetry.total_calls == 0
+    assert summary_dict["total_calls"] == 10
+    assert summary_dict["total_processes"] == 2
+    assert summary_dict["total_samples"] == 2
+    assert summary_dict["stages"]["total"]["samples"] == 2
+    assert (
+        summary_dict["stages"]["total"]["p50"] <= summary_dict["stages"]["total"]["p95"]
+    )
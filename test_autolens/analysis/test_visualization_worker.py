@@ -0,0 +1,51 @@
+import queue
+
+import autolens as al
+
+from autolens.analysis.visualization_worker import _visualize_loop
+
+
+class MockVisualizer:
+    @staticmethod
+    def visualize(analysis, paths, instance, during_analysis):
+        analysis.visualized_list.append(instance)
+
+
+class MockAnalysis:
+    Visualizer = MockVisualizer
+
+    def __init__(self):
+        self.visualized_list = []
+
+
+def test__visualize_loop__coalesces_pending_requests():
+    analysis = MockAnalysis()
+
+    request_queue = queue.Queue()
+
+    for instance in [1, 2, 3]:
+        request_queue.put((None, instance, True))
+
+    request_queue.put(None)
+
+    _visualize_loop(analysis=analysis, request_queue=request_queue)
+
+    assert analysis.visualized_list == [3]
+
+
+def test__analysis_visualize__during_analysis_sent_to_worker(masked_imaging_7x7):
+    class MockWorker(al.VisualizationWorker):
+        def submit(self, analysis, paths, instance, during_analysis=True):
+            self.total_requests += 1
+
+    worker = MockWorker()
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, visualization_worker=worker
+    )
+
+    analysis.visualize(paths=None, instance=None, during_analysis=True)
+    analysis.visualize(paths=None, instance=None, during_analysis=True)
+
+    assert worker.total_requests == 2
+    assert worker.is_running is False
@@ -127,3 +127,28 @@ def test__profile_log_likelihood_function(masked_imaging_7x7):
 
     assert "regularization_term_0" in run_time_dict
     assert "log_det_regularization_matrix_term_0" in run_time_dict
+
+
+def test__hierarchical_profiler_from(masked_imaging_7x7):
+    pixelization = al.Pixelization(
+        mesh=al.mesh.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant(coefficient=1.0),
+    )
+
+    lens = al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph(einstein_radius=1.0))
+    source = al.Galaxy(redshift=1.0, pixelization=pixelization)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    instance = model.instance_from_unit_vector([])
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    profiler = analysis.hierarchical_profiler_from(instance=instance)
+
+    assert "fit_from" in profiler.time_dict
+    assert any(
+        key.startswith("fit_from;") and key.endswith(";mapper_galaxy_dict")
+        for key in profiler.time_dict
+    )
+    assert any(key.endswith(";plane_0;IsothermalSph") for key in profiler.time_dict)
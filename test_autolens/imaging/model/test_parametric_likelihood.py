@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autolens as al
+
+from autolens import exc
+
+
+def test__log_likelihood_from__matches_analysis_log_likelihood(
+    masked_imaging_7x7_sub_2,
+):
+    lens = af.Model(
+        al.Galaxy,
+        redshift=0.5,
+        light=al.lp.Sersic,
+        mass=al.mp.Isothermal,
+    )
+    source = af.Model(al.Galaxy, redshift=1.0, bulge=al.lp.Exponential)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens, source=source))
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7_sub_2)
+
+    parametric_likelihood = analysis.parametric_likelihood_from(model=model)
+
+    parameters = model.physical_values_from_prior_medians
+
+    instance = model.instance_from_vector(vector=parameters)
+
+    assert parametric_likelihood(np.array(parameters)) == pytest.approx(
+        analysis.log_likelihood_function(instance=instance), 1.0e-8
+    )
+
+    parameters[-1] = 0.5
+
+    instance = model.instance_from_vector(vector=parameters)
+
+    assert parametric_likelihood(np.array(parameters)) == pytest.approx(
+        analysis.log_likelihood_function(instance=instance), 1.0e-8
+    )
+
+
+def test__log_likelihood_from__operated_light_profile(masked_imaging_7x7):
+    lens = af.Model(
+        al.Galaxy,
+        redshift=0.5,
+        light=al.lp.Sersic,
+        psf_light=al.lp_operated.Gaussian,
+    )
+
+    model = af.Collection(galaxies=af.Collection(lens=lens))
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    parametric_likelihood = analysis.parametric_likelihood_from(model=model)
+
+    parameters = model.physical_values_from_prior_medians
+
+    instance = model.instance_from_vector(vector=parameters)
+
+    assert parametric_likelihood(np.array(parameters)) == pytest.approx(
+        analysis.log_likelihood_function(instance=instance), 1.0e-8
+    )
+
+
+def test__linear_light_profile__raises_exception(masked_imaging_7x7):
+    lens = af.Model(al.Galaxy, redshift=0.5, light=al.lp_linear.Sersic)
+
+    model = af.Collection(galaxies=af.Collection(lens=lens))
+
+    analysis = al.AnalysisImaging(dataset=masked_imaging_7x7)
+
+    with pytest.raises(exc.AnalysisException):
+        analysis.parametric_likelihood_from(model=model)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from autolens.lens.plot.tracer_quantities import TracerQuantityProvider
+
+
+def test__quantities_are_memoized_per_grid(tracer_x2_plane_7x7, grid_2d_7x7):
+    tracer_quantities = TracerQuantityProvider(tracer=tracer_x2_plane_7x7)
+
+    image = tracer_quantities.image_2d_from(grid=grid_2d_7x7)
+
+    assert tracer_quantities.image_2d_from(grid=grid_2d_7x7) is image
+    assert image.array == pytest.approx(
+        tracer_x2_plane_7x7.image_2d_from(grid=grid_2d_7x7).array, 1.0e-4
+    )
+
+    magnification = tracer_quantities.magnification_2d_from(grid=grid_2d_7x7)
+
+    assert np.asarray(magnification) == pytest.approx(
+        np.asarray(tracer_x2_plane_7x7.magnification_2d_from(grid=grid_2d_7x7)),
+        1.0e-4,
+        nan_ok=True,
+    )
+
+    assert tracer_quantities.magnification_2d_from(grid=grid_2d_7x7) is magnification
+    assert set(tracer_quantities.time_dict) == {
+        "image",
+        "deflections",
+        "magnification",
+    }
@@ -0,0 +1,169 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autolens as al
+
+from autofit.non_linear.grid.sensitivity.result import SensitivityResult
+from autofit.non_linear.samples import Sample
+
+
+def make_samples_summary(log_likelihood):
+    return af.m.MockSamplesSummary(
+        max_log_likelihood_sample=Sample(
+            log_likelihood=log_likelihood, log_prior=0.0, weight=1.0
+        ),
+        log_evidence=log_likelihood,
+    )
+
+
+def test__sensitivity_result__figure_of_merit_array_and_columns():
+    result = SensitivityResult(
+        samples=[make_samples_summary(log_likelihood=1.0) for _ in range(4)],
+        perturb_samples=[
+            make_samples_summary(log_likelihood=value) for value in [2.0, 3.0, 0.0, 5.0]
+        ],
+        shape=(2, 2),
+        path_values={
+            ("mass", "centre", "centre_0"): [0.5, 0.5, -0.5, -0.5],
+            ("mass", "centre", "centre_1"): [-0.5, 0.5, -0.5, 0.5],
+        },
+    )
+
+    result = al.SubhaloSensitivityResult(result=result)
+
+    assert result.pixel_scales == (1.0, 1.0)
+
+    figure_of_merit_array = result.figure_of_merit_array(use_log_evidences=False)
+
+    assert figure_of_merit_array.native == pytest.approx(
+        np.array([[1.0, 2.0], [-1.0, 4.0]]), 1.0e-4
+    )
+
+    columns = result.columns
+
+    assert columns.figure_of_merit_array(
+        use_log_evidences=True
+    ).native == pytest.approx(figure_of_merit_array.native, 1.0e-4)
+    assert columns.figure_of_merit_array(
+        use_log_evidences=False, remove_zeros=True
+    ).native == pytest.approx(np.array([[1.0, 2.0], [0.0, 4.0]]), 1.0e-4)
+
+
+def test__subhalo_sensitivity_simulator__matches_simulator_via_tracer():
+    grid = al.Grid2D.uniform(shape_native=(21, 21), pixel_scales=0.2)
+
+    psf = al.Kernel2D.from_gaussian(
+        shape_native=(3, 3), sigma=0.2, pixel_scales=grid.pixel_scales
+    )
+
+    simulator = al.SimulatorImaging(
+        exposure_time=300.0,
+        psf=psf,
+        background_sky_level=0.1,
+        add_poisson_noise=False,
+    )
+
+    lens = al.Galaxy(
+        redshift=0.5,
+        light=al.lp.Sersic(intensity=0.1),
+        mass=al.mp.Isothermal(einstein_radius=1.0),
+    )
+    source = al.Galaxy(redshift=1.0, light=al.lp.Sersic(intensity=1.0))
+
+    subhalo = al.Galaxy(
+        redshift=0.5, mass=al.mp.Isothermal(centre=(0.5, 0.5), einstein_radius=0.1)
+    )
+
+    sensitivity_simulator = al.SubhaloSensitivitySimulator(
+        tracer_base=al.Tracer(galaxies=[lens, source]),
+        grid=grid,
+        simulator=simulator,
+    )
+
+    dataset = sensitivity_simulator.dataset_from(subhalo=subhalo)
+
+    dataset_via_tracer = simulator.via_tracer_from(
+        tracer=al.Tracer(galaxies=[lens, source, subhalo]), grid=grid
+    )
+
+    assert dataset.data.native == pytest.approx(dataset_via_tracer.data.native, 1.0e-4)
+
+    subhalo = al.Galaxy(
+        redshift=0.5,
+        light=al.lp.SersicSph(centre=(0.5, 0.5), intensity=1.0),
+        mass=al.mp.Isothermal(centre=(0.5, 0.5), einstein_radius=0.1),
+    )
+
+    assert sensitivity_simulator.use_base_deflections_for(subhalo=subhalo) is True
+
+    dataset = sensitivity_simulator.dataset_from(subhalo=subhalo)
+
+    dataset_via_tracer = simulator.via_tracer_from(
+        tracer=al.Tracer(galaxies=[lens, source, subhalo]), grid=grid
+    )
+
+    assert dataset.data.native == pytest.approx(dataset_via_tracer.data.native, 1.0e-4)
+
+    subhalo = al.Galaxy(
+        redshift=0.75, mass=al.mp.Isothermal(centre=(0.5, 0.5), einstein_radius=0.1)
+    )
+
+    assert sensitivity_simulator.use_base_deflections_for(subhalo=subhalo) is False
+
+    dataset = sensitivity_simulator.dataset_from(subhalo=subhalo)
+
+    dataset_via_tracer = simulator.via_tracer_from(
+        tracer=al.Tracer(galaxies=[lens, source, subhalo]), grid=grid
+    )
+
+    assert dataset.data.native == pytest.approx(dataset_via_tracer.data.native, 1.0e-4)
+
+
+def test__subhalo_sensitivity_simulator__masked_datasets_share_preloads():
+    grid = al.Grid2D.uniform(shape_native=(11, 11), pixel_scales=0.2)
+
+    simulator = al.SimulatorImaging(
+        exposure_time=300.0,
+        psf=al.Kernel2D.from_gaussian(
+            shape_native=(3, 3), sigma=0.2, pixel_scales=grid.pixel_scales
+        ),
+        add_poisson_noise=False,
+    )
+
+    sensitivity_simulator = al.SubhaloSensitivitySimulator(
+        tracer_base=al.Tracer(
+            galaxies=[
+                al.Galaxy(redshift=0.5, mass=al.mp.Isothermal(einstein_radius=1.0)),
+                al.Galaxy(redshift=1.0, light=al.lp.Sersic(intensity=1.0)),
+            ]
+        ),
+        grid=grid,
+        simulator=simulator,
+        mask=al.Mask2D.circular(
+            shape_native=grid.shape_native, pixel_scales=0.2, radius=0.8
+        ),
+    )
+
+    dataset_0 = sensitivity_simulator(
+        instance=af.ModelInstance(
+            dict(
+                perturb=al.Galaxy(redshift=0.5, mass=al.mp.PointMass(centre=(0.2, 0.2)))
+            )
+        )
+    )
+    dataset_1 = sensitivity_simulator(
+        instance=af.ModelInstance(
+            dict(
+                perturb=al.Galaxy(
+                    redshift=0.5, mass=al.mp.PointMass(centre=(-0.2, 0.2))
+                )
+            )
+        )
+    )
+
+    assert isinstance(dataset_1, al.Imaging)
+    assert dataset_1.convolver is dataset_0.convolver
+    assert dataset_1.grids is dataset_0.grids
+    assert dataset_1.w_tilde is dataset_0.w_tilde
+    assert (dataset_0.data != dataset_1.data).any()
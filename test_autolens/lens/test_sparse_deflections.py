@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autolens as al
+
+
+def make_halo_galaxies():
+    return [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.NFWTruncatedSph(
+                centre=centre, kappa_s=0.05, scale_radius=0.05, truncation_radius=0.3
+            ),
+        )
+        for centre in [(1.0, 1.0), (-1.0, 0.5), (0.5, -1.5)]
+    ] + [al.Galaxy(redshift=1.0)]
+
+
+def test__deflections_yx_2d_from__halos_approximated_within_error_budget():
+    grid = al.Grid2D.uniform(shape_native=(30, 30), pixel_scales=0.1)
+
+    tracer_exact = al.Tracer(galaxies=make_halo_galaxies())
+
+    sparse_deflections = al.SparseDeflections(tolerance=1.0e-4)
+
+    galaxies = make_halo_galaxies()
+
+    sparse_deflections.apply_to(galaxies=galaxies)
+
+    tracer = al.Tracer(galaxies=galaxies)
+
+    deflections = tracer.deflections_yx_2d_from(grid=grid)
+
+    error = np.max(
+        np.abs(
+            np.asarray(deflections)
+            - np.asarray(tracer_exact.deflections_yx_2d_from(grid=grid))
+        )
+    )
+
+    assert isinstance(deflections, al.VectorYX2D)
+    assert sparse_deflections.total_approximated > 0.5 * 3 * 900
+    assert 0.0 < sparse_deflections.error_budget < 3.0e-4
+    assert error < sparse_deflections.error_budget
+
+    error_budget = sparse_deflections.error_budget
+
+    tracer.deflections_yx_2d_from(grid=grid)
+
+    assert sparse_deflections.error_budget == pytest.approx(error_budget, 1.0e-8)
+
+    sparse_deflections.apply_to(galaxies=galaxies)
+
+    assert tracer.deflections_yx_2d_from(grid=grid) == pytest.approx(
+        np.asarray(deflections), 1.0e-8
+    )
+
+    sparse_deflections.apply_to(galaxies=make_halo_galaxies())
+
+    assert sparse_deflections.error_budget == 0.0
+    assert sparse_deflections.max_error_budget > 0.0
+
+
+def test__deflections_yx_2d_from__elliptical_lens_is_exact():
+    grid = al.Grid2D.uniform(shape_native=(30, 30), pixel_scales=0.1)
+
+    galaxy = al.Galaxy(
+        redshift=0.5,
+        mass=al.mp.Isothermal(einstein_radius=1.0, ell_comps=(0.2, 0.1)),
+        shear=al.mp.ExternalShear(gamma_1=0.05, gamma_2=0.05),
+    )
+
+    deflections_exact = galaxy.deflections_yx_2d_from(grid=grid)
+
+    sparse_deflections = al.SparseDeflections(tolerance=1.0e-4)
+    sparse_deflections.apply_to(galaxies=[galaxy])
+
+    assert galaxy.deflections_yx_2d_from(grid=grid) == pytest.approx(
+        np.asarray(deflections_exact), 1.0e-8
+    )
+    assert sparse_deflections.total_approximated == 0
+    assert sparse_deflections.error_budget == 0.0
+
+
+def test__analysis__tracer_via_instance_from_uses_sparse_deflections(
+    masked_imaging_7x7,
+):
+    model = af.Collection(
+        galaxies=af.Collection(
+            halo=al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.PointMass(centre=(0.1, 0.1), einstein_radius=0.1),
+            ),
+            source=al.Galaxy(redshift=1.0),
+        )
+    )
+
+    sparse_deflections = al.SparseDeflections(
+        tolerance=1.0e-4, total_rings=4, total_angles=4
+    )
+
+    analysis = al.AnalysisImaging(
+        dataset=masked_imaging_7x7, sparse_deflections=sparse_deflections
+    )
+
+    instance = model.instance_from_unit_vector([])
+
+    tracer = analysis.tracer_via_instance_from(instance=instance)
+
+    grid = al.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.2)
+
+    tracer.deflections_yx_2d_from(grid=grid)
+
+    assert sparse_deflections.total_approximated > 0
@@ -1,7 +1,10 @@
+import numpy as np
+from os import path
+import pytest
+
 import autofit as af
 import autolens as al
 
-
 # def test__detection_array_from():
 #     samples_list = [
 #         [
@@ -33,3 +36,47 @@ import autolens as al
 #     )
 #
 #     print(detection_array)
+
+
+def test__subhalo_result_columns__arrays_and_npz_round_trip(tmp_path):
+    columns = al.subhalo.SubhaloResultColumns(
+        y=np.array([0.5, 0.5, -0.5, -0.5]),
+        x=np.array([-0.5, 0.5, -0.5, 0.5]),
+        shape=(2, 2),
+        pixel_scales=(1.0, 1.0),
+        log_evidences=np.array([1.0, -2.0, 3.0, 4.0]),
+        log_likelihoods=np.array([5.0, 6.0, 7.0, 8.0]),
+        subhalo_masses=np.array([1e8, 1e9, 1e10, 1e11]),
+        subhalo_centres=np.array([[0.5, -0.5], [0.5, 0.5], [-0.5, -0.5], [-0.5, 0.5]]),
+    )
+
+    assert columns.extent == (-0.5, 0.5, -0.5, 0.5)
+
+    assert columns.figure_of_merit_array(
+        use_log_evidences=True, relative_to_value=1.0, remove_zeros=True
+    ).native == pytest.approx(np.array([[0.0, 0.0], [2.0, 3.0]]), 1.0e-4)
+    assert columns.figure_of_merit_array(
+        use_log_evidences=False
+    ).native == pytest.approx(np.array([[5.0, 6.0], [7.0, 8.0]]), 1.0e-4)
+    assert columns.subhalo_mass_array.native == pytest.approx(
+        np.array([[1e8, 1e9], [1e10, 1e11]]), 1.0e-4
+    )
+    assert columns.subhalo_centres_grid.native[1, 1] == pytest.approx(
+        np.array([-0.5, 0.5]), 1.0e-4
+    )
+
+    file_path = path.join(tmp_path, "subhalo.npz")
+
+    columns.output_to_npz(file_path=file_path)
+
+    columns = al.subhalo.SubhaloResultColumns.from_npz(file_path=file_path)
+
+    assert columns.shape == (2, 2)
+    assert columns.pixel_scales == (1.0, 1.0)
+    assert columns.figure_of_merit_array(
+        use_log_evidences=False
+    ).native == pytest.approx(np.array([[5.0, 6.0], [7.0, 8.0]]), 1.0e-4)
+    assert columns._column_dict["subhalo_masses"] is None
+    assert columns.subhalo_mass_array.native == pytest.approx(
+        np.array([[1e8, 1e9], [1e10, 1e11]]), 1.0e-4
+    )
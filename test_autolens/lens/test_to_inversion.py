@@ -372,6 +372,42 @@ def test__traced_mesh_grid_pg_list(masked_imaging_7x7):
     assert (traced_mesh_grids_list_of_planes[4][0] == traced_grid_pix_1).all()
 
 
+def test__traced_grid_2d_list_of_inversion__fused_with_traced_mesh_grid_pg_list(
+    masked_imaging_7x7,
+):
+    image_plane_mesh_grid = al.Grid2DIrregular(values=[(1.0, 0.0), (0.0, 1.0)])
+
+    pixelization = al.m.MockPixelization(
+        image_mesh=al.m.MockImageMesh(image_plane_mesh_grid=image_plane_mesh_grid)
+    )
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph(einstein_radius=0.5)),
+            al.Galaxy(redshift=1.0, pixelization=pixelization),
+        ]
+    )
+
+    tracer_to_inversion = al.TracerToInversion(
+        dataset=masked_imaging_7x7, tracer=tracer
+    )
+
+    traced_grid_list = tracer_to_inversion.traced_grid_2d_list_of_inversion
+    traced_mesh_grid_pg_list = tracer_to_inversion.traced_mesh_grid_pg_list
+
+    assert tracer_to_inversion.uses_fused_tracing is True
+    assert traced_grid_list[1] == pytest.approx(
+        tracer.traced_grid_2d_list_from(
+            grid=masked_imaging_7x7.grids.pixelization.over_sampler.over_sampled_grid
+        )[1],
+        1.0e-8,
+    )
+    assert traced_mesh_grid_pg_list[1][0] == pytest.approx(
+        tracer.traced_grid_2d_list_from(grid=image_plane_mesh_grid)[1], 1.0e-8
+    )
+    assert traced_grid_list[1].array.base is traced_mesh_grid_pg_list[1][0].array.base
+
+
 def test__mapper_galaxy_dict(masked_imaging_7x7):
     galaxy_no_pix = al.Galaxy(redshift=0.5)
 
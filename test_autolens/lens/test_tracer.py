@@ -6,6 +6,8 @@ from autoconf.dictable import from_json, output_to_json
 import autofit as af
 import autolens as al
 
+from autolens.lens.lensing_geometry import is_inside_curve_from
+
 
 grid_simple = al.Grid2DIrregular(values=[(1.0, 2.0)])
 
@@ -1085,6 +1087,89 @@ def test__instance_into_tracer__retains_dictionary_access():
     assert tracer.galaxies.lens.light.intensity == 2.0
 
 
+def test__lensing_geometry_from():
+    grid = al.Grid2D.uniform(shape_native=(20, 20), pixel_scales=0.25)
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.PowerLaw(centre=(0.1, 0.0), einstein_radius=1.0, slope=1.5),
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+    )
+
+    lensing_geometry = tracer.lensing_geometry_from(grid=grid, pixel_scale=0.1)
+
+    assert tracer.lensing_geometry_from(grid=grid, pixel_scale=0.1) is lensing_geometry
+    assert tracer.lensing_geometry_from(grid=grid) is not lensing_geometry
+
+    for curve_list, curve_list_from in [
+        (
+            lensing_geometry.tangential_critical_curve_list,
+            tracer.tangential_critical_curve_list_from,
+        ),
+        (
+            lensing_geometry.radial_critical_curve_list,
+            tracer.radial_critical_curve_list_from,
+        ),
+        (
+            lensing_geometry.tangential_caustic_list,
+            tracer.tangential_caustic_list_from,
+        ),
+        (lensing_geometry.radial_caustic_list, tracer.radial_caustic_list_from),
+    ]:
+        curve_list_via_tracer = curve_list_from(grid=grid, pixel_scale=0.1)
+
+        assert len(curve_list) == len(curve_list_via_tracer) > 0
+
+        for curve, curve_via_tracer in zip(curve_list, curve_list_via_tracer):
+            assert curve.array == pytest.approx(np.asarray(curve_via_tracer), 1.0e-4)
+
+    assert lensing_geometry.radial_critical_curve_area_list == pytest.approx(
+        tracer.radial_critical_curve_area_list_from(grid=grid, pixel_scale=0.1),
+        1.0e-4,
+    )
+
+
+def test__lensing_geometry__total_tangential_caustics_enclosing_from():
+    grid = al.Grid2D.uniform(shape_native=(7, 7), pixel_scales=1.0)
+
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(
+                    centre=(0.001, 0.001),
+                    einstein_radius=1.0,
+                    ell_comps=(0.0, 0.111111),
+                ),
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+    )
+
+    lensing_geometry = tracer.lensing_geometry_from(grid=grid)
+
+    assert (
+        lensing_geometry.total_tangential_caustics_enclosing_from(
+            coordinate=(0.0, 0.05)
+        )
+        == 1
+    )
+    assert (
+        lensing_geometry.total_tangential_caustics_enclosing_from(coordinate=(0.0, 0.5))
+        == 0
+    )
+
+    square = al.Grid2DIrregular(values=[(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)])
+
+    assert is_inside_curve_from(curve=square, coordinate=(0.5, 0.5)) is True
+    assert is_inside_curve_from(curve=square, coordinate=(0.5, 1.5)) is False
+    assert is_inside_curve_from(curve=square, coordinate=(1.5, 0.5)) is False
+
+
 def test__output_to_and_load_from_json():
     json_file = path.join(
         "{}".format(path.dirname(path.realpath(__file__))), "files", "tracer.json"
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+
+def make_galaxies():
+    rng = np.random.default_rng(1)
+
+    halo_list = [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.NFWTruncatedSph(
+                centre=tuple(rng.uniform(-2.0, 2.0, 2)),
+                kappa_s=0.05,
+                scale_radius=0.05,
+                truncation_radius=0.3,
+            ),
+        )
+        for _ in range(30)
+    ] + [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.PointMass(
+                centre=tuple(rng.uniform(-2.0, 2.0, 2)), einstein_radius=0.05
+            ),
+        )
+        for _ in range(10)
+    ]
+
+    return halo_list + [
+        al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.Isothermal(einstein_radius=1.0, ell_comps=(0.1, 0.0)),
+        ),
+        al.Galaxy(redshift=1.0),
+    ]
+
+
+def test__deflections_yx_2d_from__tree_code_matches_summed_halos():
+    grid = al.Grid2D.uniform(shape_native=(20, 20), pixel_scales=0.2)
+
+    galaxies = make_galaxies()
+
+    tracer_exact = al.Tracer(
+        galaxies=galaxies, tree_deflections=al.TreeDeflections(halo_threshold=None)
+    )
+
+    deflections_exact = np.asarray(tracer_exact.deflections_yx_2d_from(grid=grid))
+
+    tracer = al.Tracer(
+        galaxies=galaxies, tree_deflections=al.TreeDeflections(halo_threshold=10)
+    )
+
+    deflections = tracer.deflections_yx_2d_from(grid=grid)
+
+    assert isinstance(deflections, al.VectorYX2D)
+    assert np.max(np.abs(np.asarray(deflections) - deflections_exact)) < 1.0e-3
+    assert np.max(np.abs(np.asarray(deflections) - deflections_exact)) > 1.0e-8
+
+    tracer = al.Tracer(
+        galaxies=galaxies,
+        tree_deflections=al.TreeDeflections(opening_angle=0.0, halo_threshold=10),
+    )
+
+    assert tracer.deflections_yx_2d_from(grid=grid) == pytest.approx(
+        deflections_exact, abs=1.0e-5
+    )
+
+    grid = al.Grid2DIrregular(values=[(0.5, 0.5), (1.0, -1.0)])
+
+    deflections = tracer.deflections_yx_2d_from(grid=grid)
+
+    assert isinstance(deflections, al.VectorYX2DIrregular)
+    assert deflections == pytest.approx(
+        np.asarray(tracer_exact.deflections_yx_2d_from(grid=grid)), abs=1.0e-5
+    )
+
+
+def test__is_used_for__halo_threshold():
+    galaxies = make_galaxies()
+
+    assert al.TreeDeflections(halo_threshold=40).is_used_for(galaxies=galaxies)
+    assert not al.TreeDeflections(halo_threshold=41).is_used_for(galaxies=galaxies)
+    assert not al.TreeDeflections(halo_threshold=None).is_used_for(galaxies=galaxies)
+
+    grid = al.Grid2D.uniform(shape_native=(10, 10), pixel_scales=0.2)
+
+    deflections_exact = al.Tracer(
+        galaxies=galaxies, tree_deflections=al.TreeDeflections(halo_threshold=None)
+    ).deflections_yx_2d_from(grid=grid)
+
+    tracer = al.Tracer(galaxies=galaxies)
+
+    assert tracer.tree_deflections is None
+    assert tracer.deflections_yx_2d_from(grid=grid) == pytest.approx(
+        np.asarray(deflections_exact), 1.0e-8
+    )
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+import autolens as al
+
+from autolens.point.fit.positions.source.max_separation import (
+    PositionsMassTracer,
+    furthest_separations_from,
+    max_separation_from,
+    max_separations_via_tracer_list_from,
+)
+
+
+def test__max_separation_from():
+    positions = al.Grid2DIrregular([(0.0, 0.0), (0.0, 1.0), (0.0, 3.0)])
+
+    assert max_separation_from(positions=positions) == pytest.approx(3.0, 1.0e-8)
+
+    positions = al.Grid2DIrregular([(1.0, 0.0), (0.0, 1.0), (-1.0, -1.0)])
+
+    assert max_separation_from(positions=positions) == pytest.approx(
+        max(positions.furthest_distances_to_other_coordinates), 1.0e-8
+    )
+
+
+def test__furthest_separations_from():
+    positions = al.Grid2DIrregular([(1.0, 0.0), (0.0, 1.0), (-1.0, -1.0)])
+
+    assert furthest_separations_from(positions=positions) == pytest.approx(
+        np.array(positions.furthest_distances_to_other_coordinates), 1.0e-8
+    )
+
+    positions_batch = np.array(
+        [
+            [(0.0, 0.0), (0.0, 1.0), (0.0, 3.0)],
+            [(0.0, 0.0), (4.0, 0.0), (0.0, 3.0)],
+        ]
+    )
+
+    assert furthest_separations_from(positions=positions_batch) == pytest.approx(
+        np.array([[3.0, 2.0, 3.0], [4.0, 5.0, 5.0]]), 1.0e-8
+    )
+
+
+def test__max_separations_via_tracer_list_from():
+    positions = al.Grid2DIrregular([(1.0, 0.0), (-1.1, 0.1), (0.2, 1.3)])
+
+    tracer_list = [
+        al.Tracer(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.IsothermalSph(einstein_radius=einstein_radius),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+        for einstein_radius in [0.8, 1.0, 1.2]
+    ]
+
+    max_separations = max_separations_via_tracer_list_from(
+        positions=positions, tracer_list=tracer_list
+    )
+
+    assert max_separations == pytest.approx(
+        [
+            al.FitPositionsSourceMaxSeparation(
+                data=positions, noise_map=None, tracer=tracer
+            ).max_separation_of_source_plane_positions
+            for tracer in tracer_list
+        ],
+        1.0e-8,
+    )
+
+
+def test__positions_mass_tracer__matches_fit_with_full_tracer():
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(redshift=0.5, light=al.lp.SersicSph(intensity=1.0)),
+            al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph(einstein_radius=1.0)),
+            al.Galaxy(redshift=0.75, light=al.lp.SersicSph(intensity=1.0)),
+            al.Galaxy(
+                redshift=1.0,
+                mass=al.mp.IsothermalSph(centre=(0.1, 0.1), einstein_radius=0.2),
+            ),
+            al.Galaxy(redshift=2.0, light=al.lp.SersicSph(intensity=1.0)),
+        ]
+    )
+
+    positions = al.Grid2DIrregular([(1.0, 0.0), (-1.1, 0.1), (0.2, 1.3)])
+
+    positions_tracer = PositionsMassTracer(tracer=tracer)
+
+    fit = al.FitPositionsSourceMaxSeparation(
+        data=positions, noise_map=None, tracer=tracer
+    )
+
+    assert positions_tracer.has_mass is True
+    assert len(positions_tracer.mass_planes) == 2
+    assert positions_tracer.source_plane_positions_from(
+        positions=positions
+    ) == pytest.approx(fit.source_plane_positions, 1.0e-8)
+    assert positions_tracer.max_separation_of_source_plane_positions_from(
+        positions=positions
+    ) == pytest.approx(fit.max_separation_of_source_plane_positions, 1.0e-8)
+
+    tracer = al.Tracer(
+        galaxies=[al.Galaxy(redshift=0.5, light=al.lp.SersicSph(intensity=1.0))]
+    )
+
+    assert PositionsMassTracer(tracer=tracer).has_mass is False
@@ -111,3 +111,33 @@ def test_real_example_normal(grid, tracer):
     )
 
     assert len(result) == 5
+
+
+def test_coarse_solver_seeded_at_critical_curves(grid, tracer):
+    solver = PointSolver.for_grid(
+        grid=grid,
+        pixel_scale_precision=0.001,
+    )
+
+    coarse_solver = PointSolver.for_grid(
+        grid=grid,
+        pixel_scale_precision=0.001,
+        coarse_factor=2,
+        seed_magnification=5.0,
+    )
+
+    result, info_dict = solver.solve_with_info(
+        tracer=tracer,
+        source_plane_coordinate=(0.07, 0.07),
+    )
+
+    coarse_result, coarse_info_dict = coarse_solver.solve_with_info(
+        tracer=tracer,
+        source_plane_coordinate=(0.07, 0.07),
+    )
+
+    assert len(coarse_result) == len(result) == 5
+    assert np.array(sorted(coarse_result.in_list)) == pytest.approx(
+        np.array(sorted(result.in_list)), abs=1.0e-2
+    )
+    assert coarse_info_dict["initial_triangles"] < info_dict["initial_triangles"]
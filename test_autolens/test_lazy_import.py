@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+from os import path
+
+import autolens as al
+
+
+def test__fit_imaging__does_not_import_plotting_or_aggregator():
+    script = """
+import sys
+
+import autolens as al
+
+mask = al.Mask2D.circular(shape_native=(15, 15), pixel_scales=0.2, radius=1.0)
+
+dataset = al.Imaging(
+    data=al.Array2D.ones(shape_native=(15, 15), pixel_scales=0.2),
+    noise_map=al.Array2D.ones(shape_native=(15, 15), pixel_scales=0.2),
+    psf=al.Kernel2D.from_gaussian(shape_native=(3, 3), sigma=0.2, pixel_scales=0.2),
+).apply_mask(mask=mask)
+
+tracer = al.Tracer(
+    galaxies=[
+        al.Galaxy(redshift=0.5, mass=al.mp.IsothermalSph(einstein_radius=1.0)),
+        al.Galaxy(redshift=1.0, light=al.lp.SersicSph(intensity=1.0)),
+    ]
+)
+
+al.FitImaging(dataset=dataset, tracer=tracer).figure_of_merit
+
+print(
+    sorted(
+        name
+        for name in sys.modules
+        if name.startswith("autolens.")
+        and (".plot" in name or "aggregator" in name or "sensitivity" in name)
+    )
+)
+"""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [path.dirname(path.dirname(al.__file__)), env.get("PYTHONPATH", "")]
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test__lazy_attributes():
+    assert al.plot.TracerPlotter is not None
+    assert al.agg.TracerAgg is not None
+    assert "SubhaloSensitivityResult" in dir(al)
@@ -0,0 +1,66 @@
+from os import path
+
+import autolens as al
+
+from autolens import profiling
+
+
+def test__profiler__records_nested_stacks_of_tracer():
+    tracer = al.Tracer(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.Isothermal(einstein_radius=1.0),
+                shear=al.mp.ExternalShear(gamma_1=0.05),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.SersicSph(intensity=1.0)),
+        ]
+    )
+
+    grid = al.Grid2D.uniform(shape_native=(5, 5), pixel_scales=0.1)
+
+    with al.HierarchicalProfiler() as profiler:
+        tracer.image_2d_from(grid=grid)
+
+    assert profiling.active_profiler() is None
+
+    assert (
+        "image_2d_list_from;traced_grid_2d_list_from;plane_0;Isothermal+ExternalShear"
+        in profiler.time_dict
+    )
+    assert "image_2d_list_from;light_plane_1" in profiler.time_dict
+    assert profiler.calls_dict["image_2d_list_from"] == 1
+
+    self_time_dict = profiler.self_time_dict
+
+    assert (
+        self_time_dict["image_2d_list_from"] <= profiler.time_dict["image_2d_list_from"]
+    )
+
+    tracer.image_2d_from(grid=grid)
+
+    assert profiler.calls_dict["image_2d_list_from"] == 1
+
+
+def test__section__profiling_disabled__does_nothing():
+    with profiling.section(name="section"):
+        pass
+
+    assert profiling.active_profiler() is None
+
+
+def test__output_flame_graph(tmp_path):
+    with al.HierarchicalProfiler() as profiler:
+        with profiling.section(name="outer"):
+            with profiling.section(name=lambda: "inner"):
+                pass
+
+    file_path = path.join(tmp_path, "profile", "flame_graph.txt")
+
+    profiler.output_flame_graph(file_path=file_path)
+
+    with open(file_path) as f:
+        line_list = f.read().splitlines()
+
+    assert [line.split(" ")[0] for line in line_list] == ["outer;inner", "outer"]
+    assert all(int(line.split(" ")[1]) >= 0 for line in line_list)